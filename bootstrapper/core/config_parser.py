@@ -4,10 +4,14 @@ Configuration parsing for YAML service configs and .env files.
 Python implementation of configuration parsing from start.sh and stop.sh.
 """
 
+import copy
+import datetime
 import os
 import re
+import shutil
 import sys
-from typing import Dict, Optional, Any
+import time
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from pathlib import Path
 
 
@@ -21,12 +25,20 @@ DEFAULT_BASE_PORT = 63000
 # with the resolved PROJECT_NAME (``<name>-<service>``, ``<name>-network``).
 DEFAULT_PROJECT_NAME = "atlas"
 
+# Repository root (parent of bootstrapper/), resolved once at import rather
+# than per ConfigParser.
+_DEFAULT_ROOT = Path(__file__).resolve().parent.parent.parent
+
 # Docker Compose project names must be lowercase and match this pattern (it is
 # what `docker compose -p` accepts; consumer stacks reusing Atlas as a submodule
 # set their own via PROJECT_NAME / --project so start & stop target the right
 # family of containers).
 _PROJECT_NAME_RE = re.compile(r"^[a-z0-9][a-z0-9_-]*$")
 
+# Characters allowed in a SOURCE key; together with the ``_SOURCE`` suffix
+# check this is start.sh's ``^([A-Z0-9_]+_SOURCE)=`` without a regex.
+_SOURCE_KEY_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_"
+
 
 def normalize_project_name(raw: str) -> str:
     """Validate + normalize a Compose project name.
@@ -49,6 +61,27 @@ def normalize_project_name(raw: str) -> str:
     return name
 
 
+# Parse results are cached against a file's (mtime_ns, size, inode). A file
+# modified inside this window could be rewritten again within the same
+# filesystem timestamp tick (2 s on FAT / HFS+) without its size changing, so
+# such "racy" files are re-read on every call instead of cached — the same
+# rule git applies to its index.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def _stat_signature(st: Optional[os.stat_result]) -> Optional[Tuple[int, int, int]]:
+    """Return ``(st_mtime_ns, st_size, st_ino)``, or None for a missing file."""
+    if st is None:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _is_racy(*signatures: Optional[Tuple[int, int, int]]) -> bool:
+    """True when any of the files was modified too recently to cache."""
+    now = time.time_ns()
+    return any(sig is not None and now - sig[0] < _RACY_WINDOW_NS for sig in signatures)
+
+
 # Module-level flag: GENAI_ENV_FILE deprecation warning fires once
 # per process, not once per ConfigParser instance.
 _DEPRECATION_WARNED = False
@@ -92,7 +125,7 @@ class ConfigParser:
         """
         if root_dir is None:
             # Default to parent directory of bootstrapper
-            self.root_dir = Path(__file__).resolve().parent.parent.parent
+            self.root_dir = _DEFAULT_ROOT
         else:
             self.root_dir = Path(root_dir)
 
@@ -106,6 +139,11 @@ class ConfigParser:
 
         self.service_sources = {}
 
+        # (kind, path) -> (file signature, parsed value); see _cached().
+        self._parse_cache: Dict[Tuple[str, Path], Tuple[Any, Any]] = {}
+        # path -> stat result for this run; see _stat().
+        self._stat_cache: Dict[Path, os.stat_result] = {}
+
     def _resolve_env_file_path(self) -> Path:
         """
         Resolve .env file path from ATLAS_ENV_FILE environment variable.
@@ -157,6 +195,48 @@ class ConfigParser:
             bool: True if either env var is set
         """
         return bool(_read_custom_env_file_var())
+
+    def _stat(self, path: Path, refresh: bool = False) -> Optional[os.stat_result]:
+        """
+        Return path's stat result, reusing the one taken earlier in this run.
+
+        Missing files are never cached (start.py creates .env mid-run), and
+        refresh=True always re-stats, updating the cache.
+        """
+        if not refresh:
+            st = self._stat_cache.get(path)
+            if st is not None:
+                return st
+        try:
+            st = path.stat()
+        except OSError:
+            self._stat_cache.pop(path, None)
+            return None
+        self._stat_cache[path] = st
+        return st
+
+    def invalidate_stat_cache(self) -> None:
+        """Forget cached stat results after this process changes a file."""
+        self._stat_cache.clear()
+
+    def _cached(self, kind: str, path: Path, signature: Any, racy: bool,
+                build: Callable[[], Any]) -> Any:
+        """
+        Return the value ``build()`` produced for path while its on-disk
+        signature was ``signature``, re-building when the files changed.
+
+        Callers share the cached object, so public methods hand out copies.
+        """
+        key = (kind, path)
+        hit = self._parse_cache.get(key)
+        if hit is not None and hit[0] == signature:
+            return hit[1]
+        value = build()
+        if racy:
+            self._parse_cache.pop(key, None)
+        else:
+            self._parse_cache[key] = (signature, value)
+        return value
         
     def load_yaml_config(self) -> Dict[str, Any]:
         """
@@ -168,6 +248,25 @@ class ConfigParser:
         shape (source_configurable, adaptive_services, dependencies,
         service_dependencies) that consumers expect.
         """
+        services_root = self.root_dir / "services"
+        try:
+            service_dirs = sorted(p for p in services_root.iterdir() if p.is_dir())
+        except OSError:
+            service_dirs = []
+        file_signatures = [
+            _stat_signature(self._stat(d / "service.yml", refresh=True))
+            for d in service_dirs
+        ]
+        signature = tuple(zip((d.name for d in service_dirs), file_signatures))
+        config = self._cached(
+            "yaml", services_root, signature, _is_racy(*file_signatures),
+            self._load_yaml_config_uncached,
+        )
+        # The synthesized dict is nested; a deep copy keeps a caller's edits
+        # out of the cache.
+        return copy.deepcopy(config)
+
+    def _load_yaml_config_uncached(self) -> Dict[str, Any]:
         from services.manifests import load_manifests
         from services.sc_synthesizer import synthesize_legacy
         manifests = load_manifests(self.root_dir / "services")
@@ -184,12 +283,42 @@ class ConfigParser:
         Returns:
             dict: Dictionary of environment variables from .env file
         """
+        return dict(self._env_vars())
+
+    def _env_vars(self) -> Dict[str, str]:
+        """The cached parse of the .env file; callers must not mutate it."""
+        return self._parsed_env()[0]
+
+    def _parsed_env(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        # Parses are validated against a fresh stat; it also refreshes the
+        # cached one behind env_file_exists() / get_env_file_timestamp().
+        signature = _stat_signature(self._stat(self.env_file_path, refresh=True))
+        return self._cached(
+            "env", self.env_file_path, signature, _is_racy(signature),
+            self._parse_env_once,
+        )
+
+    def _parse_env_once(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Read the .env file once, filling both the variable dict and the
+        SOURCE mapping.
+
+        Returns:
+            tuple: (env_vars, source_mapping)
+        """
         env_vars = {}
-        
-        if not self.env_file_path.exists():
-            return env_vars
-            
-        with open(self.env_file_path, 'r', encoding="utf-8") as f:
+        # Start with only non-customizable services
+        # Backend is always 'container' and not exposed in .env.example
+        source_mapping = {
+            'BACKEND_SOURCE': 'container',
+        }
+
+        try:
+            f = open(self.env_file_path, 'r', encoding="utf-8")
+        except FileNotFoundError:
+            return env_vars, source_mapping
+
+        with f:
             for line in f:
                 line = line.strip()
                 if not line or line.startswith('#'):
@@ -198,6 +327,19 @@ class ConfigParser:
                 # Split on first = only
                 if '=' in line:
                     key, value = line.split('=', 1)
+
+                    # SOURCE values keep start.sh's looser rules (any `#`
+                    # ends the value, quotes are stripped from both ends).
+                    # The key is taken unstripped: `X_SOURCE =y` is no match.
+                    if (
+                        key.endswith('_SOURCE')
+                        and len(key) > len('_SOURCE')
+                        and not key.strip(_SOURCE_KEY_CHARS)
+                    ):
+                        source_mapping[key] = (
+                            value.split('#', 1)[0].strip().strip('"').strip("'")
+                        )
+
                     value = value.strip()
                     if value[:1] in ('"', "'"):
                         # Quoted value: take the quoted span verbatim —
@@ -221,7 +363,7 @@ class ConfigParser:
                         value = value.strip()
                     env_vars[key.strip()] = value
                     
-        return env_vars
+        return env_vars, source_mapping
     
     def parse_service_sources(self) -> Dict[str, str]:
         """
@@ -231,26 +373,9 @@ class ConfigParser:
         Returns:
             dict: Dictionary mapping SOURCE variable names to their values
         """
-        # Start with only non-customizable services  
-        # Backend is always 'container' and not exposed in .env.example
-        source_mapping = {
-            'BACKEND_SOURCE': 'container',
-        }
-            
-        # Parse SOURCE variables from .env file using the same regex as start.sh
-        if self.env_file_path.exists():
-            with open(self.env_file_path, 'r', encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    # Use the same regex pattern as start.sh: ^([A-Z0-9_]+_SOURCE)=([^#]*)
-                    match = re.match(r'^([A-Z0-9_]+_SOURCE)=([^#]*)', line)
-                    if match:
-                        var_name = match.group(1)
-                        var_value = match.group(2).strip().strip('"').strip("'")
-                        source_mapping[var_name] = var_value
-                        
-        self.service_sources = source_mapping
-        return source_mapping
+        source_mapping = self._parsed_env()[1]
+        self.service_sources = dict(source_mapping)
+        return dict(source_mapping)
     
     def get_service_source(self, service_var: str) -> str:
         """
@@ -273,12 +398,26 @@ class ConfigParser:
         Returns:
             str: Project name, defaults to 'atlas' if not found
         """
-        env_vars = self.parse_env_file()
-        raw = env_vars.get('PROJECT_NAME', DEFAULT_PROJECT_NAME)
+        raw = self._env_vars().get('PROJECT_NAME', DEFAULT_PROJECT_NAME)
         if raw is None or not str(raw).strip():
             return DEFAULT_PROJECT_NAME
         return normalize_project_name(str(raw))
     
+    def env_file_info(self) -> Tuple[bool, Optional[str]]:
+        """
+        Check whether the .env file exists and get its modification time
+        from a single stat.
+
+        Returns:
+            tuple: (exists, formatted timestamp or None if missing)
+        """
+        st = self._stat(self.env_file_path)
+        if st is None:
+            return False, None
+
+        timestamp = datetime.datetime.fromtimestamp(st.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
+        return True, timestamp
+
     def env_file_exists(self) -> bool:
         """
         Check if .env file exists.
@@ -286,7 +425,7 @@ class ConfigParser:
         Returns:
             bool: True if .env file exists
         """
-        return self.env_file_path.exists()
+        return self._stat(self.env_file_path) is not None
     
     def get_env_file_timestamp(self) -> Optional[str]:
         """
@@ -295,12 +434,7 @@ class ConfigParser:
         Returns:
             str: Formatted timestamp string, or None if file doesn't exist
         """
-        if not self.env_file_exists():
-            return None
-            
-        import datetime
-        mtime = self.env_file_path.stat().st_mtime
-        return datetime.datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S')
+        return self.env_file_info()[1]
     
     def create_env_backup(self) -> str:
         """
@@ -317,14 +451,42 @@ class ConfigParser:
         if not self.env_file_exists():
             raise FileNotFoundError("Cannot backup .env file - it doesn't exist")
 
-        import datetime
         timestamp = datetime.datetime.now().strftime('%Y%m%d%H%M%S')
 
         # Create backup in the same directory as the .env file
         # This ensures backups work correctly with custom paths
+        # Two backups in the same second (port migration + a service edit in
+        # one run) used to share a name, the second overwriting the first;
+        # suffix .1, .2, ... instead.
         backup_filename = f"{self.env_file_path.name}.backup.{timestamp}"
+        existing = {p.name for p in self._list_backups()}
+        suffix = 0
+        while backup_filename in existing:
+            suffix += 1
+            backup_filename = f"{self.env_file_path.name}.backup.{timestamp}.{suffix}"
         backup_path = self.env_file_path.parent / backup_filename
 
-        import shutil
         shutil.copy2(self.env_file_path, backup_path)
+        self.invalidate_stat_cache()
         return str(backup_path)
+
+    def _list_backups(self) -> List[Path]:
+        """
+        List existing ``<env file>.backup.*`` siblings of the .env file.
+
+        One ``os.scandir`` pass over the directory instead of an ``exists()``
+        per candidate name.
+
+        Returns:
+            list: Backup paths, sorted by name
+        """
+        prefix = f"{self.env_file_path.name}.backup."
+        try:
+            with os.scandir(self.env_file_path.parent) as entries:
+                return sorted(
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.startswith(prefix) and entry.is_file()
+                )
+        except OSError:
+            return []
@@ -5,17 +5,61 @@ Compose execution layer (start.sh/stop.sh are now thin wrappers that
 delegate here).
 """
 
+import contextlib
 import os
 import json
-import re
+import shutil
 import signal
 import subprocess
 import time
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 from core.config_parser import ConfigParser
 
 
+# Which compose CLI a host has only changes when Docker is (re)installed, so
+# the detected command is remembered across runs for a day instead of
+# spawning the version probes on every start/stop. ATLAS_COMPOSE_CMD skips
+# detection entirely.
+_COMPOSE_COMMANDS = ("docker compose", "docker-compose")
+_COMPOSE_CMD_CACHE_TTL = 24 * 60 * 60
+
+# Repository root (parent of bootstrapper/), resolved once at import rather
+# than per DockerManager.
+_DEFAULT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+def _compose_cmd_cache_path() -> Path:
+    """Location of the cross-run compose-command cache (XDG cache dir)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "atlas" / "compose_cmd"
+
+
+def _read_cached_compose_cmd() -> Optional[str]:
+    """Return the cached compose command, or None if missing/stale/invalid."""
+    path = _compose_cmd_cache_path()
+    try:
+        if time.time() - path.stat().st_mtime > _COMPOSE_CMD_CACHE_TTL:
+            return None
+        cached = path.read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    return cached if cached in _COMPOSE_COMMANDS else None
+
+
+def _write_cached_compose_cmd(compose_cmd: str) -> None:
+    """Best-effort cache write; an unwritable home just means no caching."""
+    path = _compose_cmd_cache_path()
+    tmp_path = path.with_name(path.name + ".tmp")
+    with contextlib.suppress(OSError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            tmp_path.write_text(compose_cmd + "\n", encoding="utf-8")
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+
 class DockerManager:
     """Manages Docker operations and compose commands."""
 
@@ -28,13 +72,16 @@ class DockerManager:
         """
         if root_dir is None:
             # Default to parent directory of bootstrapper
-            self.root_dir = Path(__file__).resolve().parent.parent.parent
+            self.root_dir = _DEFAULT_ROOT
         else:
             self.root_dir = Path(root_dir)
 
         self.config_parser = ConfigParser(str(self.root_dir))
         self._compose_cmd = None
         self.project_name_override: Optional[str] = None
+        # {(service, internal_port): published_port} from one
+        # `compose ps --format json`; dropped whenever compose runs again.
+        self._port_cache: Optional[Dict[Tuple[str, str], str]] = None
 
         # Callback for the "Command: docker compose …" echo. Defaults to
         # builtin print so the legacy linear flow is unchanged. The Live
@@ -42,12 +89,26 @@ class DockerManager:
         # log pane in dim style.
         self._on_command: Callable[[str], None] = print
     
+    def _project_name(self) -> str:
+        """
+        The compose project name: the --project override, else PROJECT_NAME.
+
+        Deliberately not memoized here — the wizard can rewrite PROJECT_NAME
+        mid-run, and ConfigParser already caches the .env parse against the
+        file's stat signature, so each lookup is one stat.
+        """
+        return self.project_name_override or self.config_parser.get_project_name()
+
     def detect_docker_compose_command(self) -> str:
         """
         Detect available docker compose command.
         Detects the available compose command (descended from the legacy
         shell helper of the same purpose).
         
+        ATLAS_COMPOSE_CMD, when set, is used verbatim. Otherwise a result
+        detected within the last day (see _compose_cmd_cache_path) is reused
+        before falling back to the subprocess probes.
+
         Returns:
             str: Either "docker compose" or "docker-compose"
             
@@ -56,29 +117,42 @@ class DockerManager:
         """
         if self._compose_cmd is not None:
             return self._compose_cmd
-            
-        # Check if docker is available
-        try:
-            subprocess.run(['docker', '--version'],
-                         capture_output=True, check=True, timeout=10)
-        except (subprocess.CalledProcessError, FileNotFoundError,
-                subprocess.TimeoutExpired):
+
+        override = os.environ.get('ATLAS_COMPOSE_CMD', '').strip()
+        if override:
+            self._compose_cmd = override
+            return self._compose_cmd
+
+        # A PATH lookup, not a `docker --version` spawn. Checked before the
+        # cache so an uninstalled Docker is still reported as such.
+        if shutil.which('docker') is None:
             raise RuntimeError("Docker is not installed or not in PATH")
+
+        cached = _read_cached_compose_cmd()
+        if cached is not None:
+            self._compose_cmd = cached
+            return self._compose_cmd
         
         # Check if 'docker compose' (newer) works
         try:
             subprocess.run(['docker', 'compose', 'version'],
-                           capture_output=True, check=True, timeout=10)
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                           check=True, timeout=10)
             self._compose_cmd = "docker compose"
+            _write_cached_compose_cmd(self._compose_cmd)
             return self._compose_cmd
         except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
             pass
         
         # Check if 'docker-compose' (legacy) works
+        if shutil.which('docker-compose') is None:
+            raise RuntimeError("Neither 'docker compose' nor 'docker-compose' command is available")
         try:
             subprocess.run(['docker-compose', '--version'],
-                         capture_output=True, check=True, timeout=10)
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                         check=True, timeout=10)
             self._compose_cmd = "docker-compose"
+            _write_cached_compose_cmd(self._compose_cmd)
             return self._compose_cmd
         except (subprocess.CalledProcessError, FileNotFoundError,
                 subprocess.TimeoutExpired):
@@ -187,17 +261,14 @@ class DockerManager:
         Returns:
             int: Return code from the command
         """
+        self._port_cache = None
         compose_cmd = self.detect_docker_compose_command().split()
         
         # Build the full command
         full_cmd = compose_cmd.copy()
 
         # Add project name to ensure consistency with PROJECT_NAME from .env
-        resolved_project_name = (
-            project_name
-            or self.project_name_override
-            or self.config_parser.get_project_name()
-        )
+        resolved_project_name = project_name or self._project_name()
         full_cmd.extend(['-p', resolved_project_name])
 
         # Add --env-file if .env exists and use_env_file is True
@@ -300,7 +371,8 @@ class DockerManager:
         try:
             subprocess.run(
                 ['docker', 'network', 'rm', network_name],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=False,
                 timeout=10,
             )
@@ -367,7 +439,7 @@ class DockerManager:
         return self.detect_docker_compose_command().split()
     
     def perform_cold_start_cleanup(self) -> bool:
-        """Stop containers, remove volumes and orphans, drop the project network, and prune the Docker system (twice — once with volumes, once general).
+        """Stop containers and remove their volumes and orphans in one `down`, drop the project network, and prune the Docker system (twice — once with volumes, once general).
 
         All output flows through the registered command-echo callback
         (`_on_command`) so the wizard's Live region can stream it into
@@ -375,20 +447,12 @@ class DockerManager:
 
         Returns True if every step succeeded.
         """
-        project_name = self.project_name_override or self.config_parser.get_project_name()
+        project_name = self._project_name()
         all_successful = True
 
-        self._on_command("    - Stopping and removing containers...")
-        result = self.stream_compose(
-            ['down', '--remove-orphans'],
-            on_line=self._on_command,
-        )
-        if result != 0:
-            all_successful = False
-
-        self._on_command("    - Removing volumes (cold start)...")
+        self._on_command("    - Stopping containers and removing volumes (cold start)...")
         result = self.stream_compose(
-            ['down', '-v'],
+            ['down', '--volumes', '--remove-orphans'],
             on_line=self._on_command,
         )
         if result != 0:
@@ -416,7 +480,7 @@ class DockerManager:
 
         Returns True if every step succeeded.
         """
-        project_name = self.project_name_override or self.config_parser.get_project_name()
+        project_name = self._project_name()
         all_successful = True
         
         print("    - Stopping containers and removing volumes...")
@@ -482,7 +546,7 @@ class DockerManager:
         """
         try:
             cmd = self.get_compose_command()
-            project_name = self.project_name_override or self.config_parser.get_project_name()
+            project_name = self._project_name()
             cmd.extend(['-p', project_name])
             if self.config_parser.env_file_exists():
                 cmd.append(f'--env-file={self.config_parser.env_file_path}')
@@ -509,6 +573,9 @@ class DockerManager:
         Get the actual external port mapped to a service's internal port.
         Resolves the actual published port (descended from the legacy shell flow).
 
+        All lookups share one ``docker compose ps --format json`` call (see
+        _published_ports); if that fails, falls back to ``docker compose port``.
+
         Args:
             service: Service name
             internal_port: Internal port number
@@ -516,15 +583,13 @@ class DockerManager:
         Returns:
             str: External port number, or empty string if not found
         """
-        try:
-            cmd = self.get_compose_command()
-            project_name = self.project_name_override or self.config_parser.get_project_name()
-            cmd.extend(['-p', project_name])
-            if self.config_parser.env_file_exists():
-                cmd.append(f'--env-file={self.config_parser.env_file_path}')
-            cmd.extend(self._compose_file_args())
-            cmd.extend(['port', service, internal_port])
+        if self._port_cache is None:
+            self._port_cache = self._published_ports()
+        if self._port_cache is not None:
+            return self._port_cache.get((service, str(internal_port)), "")
 
+        try:
+            cmd = self._build_compose_command(['port', service, internal_port])
             result = subprocess.run(
                 cmd,
                 cwd=str(self.root_dir),
@@ -536,15 +601,80 @@ class DockerManager:
                 timeout=10,
             )
             
-            if result.returncode == 0 and result.stdout.strip():
+            if result.returncode == 0:
                 # Extract port number from output like "0.0.0.0:63000"
-                match = re.search(r':(\d+)$', result.stdout.strip())
-                if match:
-                    return match.group(1)
+                tail = result.stdout.strip().rpartition(':')[2]
+                if tail.isdigit():
+                    return tail
             return ""
         except (subprocess.SubprocessError, OSError):
             return ""
 
+    def _published_ports(self) -> Optional[Dict[Tuple[str, str], str]]:
+        """
+        Map every running service's published TCP ports in one compose call.
+
+        Returns:
+            dict: {(service, internal_port): external_port}, or None when
+            ``docker compose ps`` could not be run.
+        """
+        try:
+            cmd = self._build_compose_command(['ps', '--format', 'json'])
+            result = subprocess.run(
+                cmd,
+                cwd=str(self.root_dir),
+                capture_output=True,
+                text=True,
+                check=False,
+                encoding="utf-8",
+                errors="replace",
+                timeout=10,
+            )
+        except (subprocess.SubprocessError, OSError, RuntimeError):
+            return None
+        if result.returncode != 0:
+            return None
+
+        ports: Dict[Tuple[str, str], str] = {}
+        for row in self._parse_ps_json(result.stdout):
+            service = row.get("Service")
+            for publisher in row.get("Publishers") or []:
+                if not isinstance(publisher, dict):
+                    continue
+                published = publisher.get("PublishedPort")
+                if not published or publisher.get("Protocol", "tcp") != "tcp":
+                    continue
+                # First hit wins, like `docker compose port` (replica 1,
+                # IPv4 binding before IPv6).
+                ports.setdefault(
+                    (service, str(publisher.get("TargetPort"))), str(published)
+                )
+        return ports
+
+    @staticmethod
+    def _parse_ps_json(payload: str) -> list[dict]:
+        """Parse ``compose ps --format json`` output (one JSON array, or
+        line-delimited objects on Compose ≥ 2.21)."""
+        rows: list[dict] = []
+        payload = payload.strip()
+        if not payload:
+            return rows
+        try:
+            parsed = json.loads(payload)
+            rows = parsed if isinstance(parsed, list) else [parsed]
+        except json.JSONDecodeError:
+            for line in payload.splitlines():
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(row, dict):
+                    rows.append(row)
+        return [row for row in rows if isinstance(row, dict)]
+
     def failed_one_shot_services(
         self,
         services: list[str],
@@ -615,7 +745,7 @@ class DockerManager:
         """Inspect one compose service via ``docker compose ps --format json``."""
         try:
             cmd = self.get_compose_command()
-            project_name = self.project_name_override or self.config_parser.get_project_name()
+            project_name = self._project_name()
             cmd.extend(['-p', project_name])
             if self.config_parser.env_file_exists():
                 cmd.append(f'--env-file={self.config_parser.env_file_path}')
@@ -637,25 +767,7 @@ class DockerManager:
         if result.returncode != 0:
             return [], result.stderr.strip() or "docker compose ps failed"
 
-        rows: list[dict] = []
-        payload = result.stdout.strip()
-        if not payload:
-            return rows, None
-        try:
-            parsed = json.loads(payload)
-            rows = parsed if isinstance(parsed, list) else [parsed]
-        except json.JSONDecodeError:
-            for line in payload.splitlines():
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    row = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                if isinstance(row, dict):
-                    rows.append(row)
-        return rows, None
+        return self._parse_ps_json(result.stdout), None
     
     def show_container_logs(self, follow: bool = True) -> int:
         """
@@ -700,7 +812,7 @@ class DockerManager:
         full_cmd = self.detect_docker_compose_command().split()
         if top_level_flags:
             full_cmd.extend(top_level_flags)
-        project_name = self.project_name_override or self.config_parser.get_project_name()
+        project_name = self._project_name()
         full_cmd.extend(['-p', project_name])
         if use_env_file and self.config_parser.env_file_exists():
             # Use the resolved path (honors ATLAS_ENV_FILE) — hardcoding .env
@@ -741,6 +853,7 @@ class DockerManager:
 
         Returns the subprocess exit code.
         """
+        self._port_cache = None
         full_cmd = self._build_compose_command(
             args,
             use_env_file=use_env_file,
@@ -814,8 +927,6 @@ class DockerManager:
         JSON) return an empty dict so the caller can fall back to .env
         configured state without crashing.
         """
-        import json
-
         full_cmd = self._build_compose_command(['ps', '--format', 'json'])
         try:
             result = subprocess.run(
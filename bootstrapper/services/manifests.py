@@ -25,6 +25,10 @@ import yaml
 from jsonschema import Draft202012Validator
 from jsonschema.exceptions import ValidationError as JsonSchemaError
 
+# libyaml's C loader when PyYAML was built with it — same safe tag set as
+# yaml.safe_load, several times faster on the ~40 manifests parsed per run.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 # ────────────────────────────────────────────────────────────────────────────
 # Public dataclasses
@@ -288,7 +292,7 @@ def _load_one(service_dir: Path) -> Manifest:
         )
 
     try:
-        raw = yaml.safe_load(manifest_path.read_text(encoding="utf-8"))
+        raw = yaml.load(manifest_path.read_text(encoding="utf-8"), Loader=_YamlLoader)
     except yaml.YAMLError as e:
         raise _PerManifestError(
             f"services/{service_dir.name}/service.yml: invalid YAML — {e}"
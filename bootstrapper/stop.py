@@ -86,8 +86,8 @@ Examples:
         self.banner.show_section_header("Environment Configuration", "📋")
 
         # Check .env file
-        if self.config_parser.env_file_exists():
-            timestamp = self.config_parser.get_env_file_timestamp()
+        env_exists, timestamp = self.config_parser.env_file_info()
+        if env_exists:
             self.banner.show_status_message(f"Found .env file with timestamp: {timestamp}", "info")
 
             # Get project name
@@ -15,6 +15,13 @@ import pytest
 import yaml
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cache_home(tmp_path_factory, monkeypatch):
+    """Keep DockerManager's compose-command cache out of the real ~/.cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+    monkeypatch.delenv("ATLAS_COMPOSE_CMD", raising=False)
+
+
 @pytest.fixture
 def services_root(tmp_path: Path) -> Path:
     """An empty services/ root inside tmp_path."""
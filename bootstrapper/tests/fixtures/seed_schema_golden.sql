@@ -801,11 +801,11 @@ CREATE INDEX idx_research_logs_session_id ON public.research_logs USING btree (s
 
 CREATE INDEX idx_research_results_session_id ON public.research_results USING btree (session_id);
 
-CREATE INDEX idx_research_sessions_created_at ON public.research_sessions USING btree (created_at);
+CREATE INDEX idx_research_sessions_created_at_id ON public.research_sessions USING btree (created_at DESC, id DESC);
 
 CREATE INDEX idx_research_sessions_status ON public.research_sessions USING btree (status);
 
-CREATE INDEX idx_research_sessions_user_id ON public.research_sessions USING btree (user_id);
+CREATE INDEX idx_research_sessions_user_created_at ON public.research_sessions USING btree (user_id, created_at DESC, id DESC);
 
 CREATE INDEX idx_research_sources_session_id ON public.research_sources USING btree (session_id);
 
@@ -76,7 +76,10 @@ def test_get_service_port_honors_project_override(tmp_path, monkeypatch):
 
     class Result:
         returncode = 0
-        stdout = "0.0.0.0:63080\n"
+        stdout = (
+            '{"Service": "backend", "Publishers": '
+            '[{"URL": "0.0.0.0", "TargetPort": 8000, "PublishedPort": 63080, "Protocol": "tcp"}]}\n'
+        )
         stderr = ""
 
     monkeypatch.setattr(dm, "detect_docker_compose_command", lambda: "docker compose")
@@ -0,0 +1,132 @@
+"""DockerManager.detect_docker_compose_command probes the host at most once
+a day: the result is cached under $XDG_CACHE_HOME/atlas/compose_cmd, and
+ATLAS_COMPOSE_CMD bypasses detection. conftest points XDG_CACHE_HOME at a
+per-test tmp dir.
+"""
+from __future__ import annotations
+
+import os
+import subprocess
+import time
+
+import pytest
+
+import core.docker_manager as docker_manager_module
+from core.docker_manager import DockerManager
+
+
+class _Result:
+    returncode = 0
+    stdout = ""
+    stderr = ""
+
+
+def _record_probes(monkeypatch, fail=(), installed=("docker", "docker-compose")) -> list:
+    probes = []
+    monkeypatch.setattr(
+        docker_manager_module.shutil, "which",
+        lambda name: f"/usr/bin/{name}" if name in installed else None,
+    )
+
+    def fake_run(cmd, **_kwargs):
+        probes.append(cmd)
+        if tuple(cmd) in fail:
+            raise subprocess.CalledProcessError(1, cmd)
+        return _Result()
+
+    monkeypatch.setattr(docker_manager_module.subprocess, "run", fake_run)
+    return probes
+
+
+def test_detected_command_is_cached_across_instances(monkeypatch):
+    probes = _record_probes(monkeypatch)
+
+    assert DockerManager().detect_docker_compose_command() == "docker compose"
+    assert DockerManager().detect_docker_compose_command() == "docker compose"
+
+    assert probes == [["docker", "compose", "version"]]
+    cache = docker_manager_module._compose_cmd_cache_path()
+    assert cache.read_text(encoding="utf-8") == "docker compose\n"
+
+
+def test_legacy_compose_is_cached_too(monkeypatch):
+    _record_probes(monkeypatch, fail={("docker", "compose", "version")})
+    assert DockerManager().detect_docker_compose_command() == "docker-compose"
+
+    probes = _record_probes(monkeypatch)
+    assert DockerManager().detect_docker_compose_command() == "docker-compose"
+    assert probes == []
+
+
+def test_stale_or_invalid_cache_is_ignored(monkeypatch):
+    cache = docker_manager_module._compose_cmd_cache_path()
+    cache.parent.mkdir(parents=True)
+
+    cache.write_text("rm -rf /\n", encoding="utf-8")
+    probes = _record_probes(monkeypatch)
+    assert DockerManager().detect_docker_compose_command() == "docker compose"
+    assert len(probes) == 1
+
+    old = time.time() - docker_manager_module._COMPOSE_CMD_CACHE_TTL - 60
+    os.utime(cache, (old, old))
+    probes = _record_probes(monkeypatch)
+    DockerManager().detect_docker_compose_command()
+    assert len(probes) == 1
+
+
+def test_env_override_skips_detection(monkeypatch):
+    monkeypatch.setenv("ATLAS_COMPOSE_CMD", "docker-compose")
+    probes = _record_probes(monkeypatch)
+
+    assert DockerManager().detect_docker_compose_command() == "docker-compose"
+    assert probes == []
+    assert not docker_manager_module._compose_cmd_cache_path().exists()
+
+
+def test_unwritable_cache_dir_does_not_break_detection(tmp_path, monkeypatch):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("", encoding="utf-8")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(blocker))
+    _record_probes(monkeypatch)
+
+    assert DockerManager().detect_docker_compose_command() == "docker compose"
+
+
+
+def test_missing_docker_is_reported_without_spawning(monkeypatch):
+    _record_probes(monkeypatch)
+    DockerManager().detect_docker_compose_command()  # warm the cache
+
+    probes = _record_probes(monkeypatch, installed=())
+    with pytest.raises(RuntimeError, match="Docker is not installed"):
+        DockerManager().detect_docker_compose_command()
+    assert probes == []
+
+
+def test_missing_legacy_binary_is_not_spawned(monkeypatch):
+    probes = _record_probes(
+        monkeypatch, fail={("docker", "compose", "version")}, installed=("docker",),
+    )
+    with pytest.raises(RuntimeError, match="Neither"):
+        DockerManager().detect_docker_compose_command()
+    assert probes == [["docker", "compose", "version"]]
+
+
+def test_probe_output_is_discarded_not_captured(monkeypatch):
+    seen = []
+
+    def fake_run(cmd, **kwargs):
+        seen.append(kwargs)
+        return _Result()
+
+    _record_probes(monkeypatch)
+    monkeypatch.setattr(docker_manager_module.subprocess, "run", fake_run)
+    dm = DockerManager()
+    dm.detect_docker_compose_command()
+    dm.remove_project_networks("atlas")
+
+    for kwargs in seen:
+        assert "capture_output" not in kwargs
+        assert kwargs["stdout"] is subprocess.DEVNULL
+        assert kwargs["stderr"] is subprocess.DEVNULL
+    assert len(seen) == 2
@@ -0,0 +1,222 @@
+"""ConfigParser memoizes .env / manifest parses against the files' stat
+signature (mtime_ns, size, inode), so repeated calls inside one bootstrapper
+run stop re-reading and re-parsing unchanged files.
+"""
+from __future__ import annotations
+
+import os
+import time
+
+from core.config_parser import ConfigParser
+
+
+def _age(path, seconds=60):
+    """Backdate path so it falls outside the racy-timestamp window."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def _parser(tmp_path, monkeypatch, text: str) -> ConfigParser:
+    monkeypatch.delenv("ATLAS_ENV_FILE", raising=False)
+    monkeypatch.delenv("GENAI_ENV_FILE", raising=False)
+    env = tmp_path / ".env"
+    env.write_text(text, encoding="utf-8")
+    _age(env)
+    return ConfigParser(root_dir=str(tmp_path))
+
+
+def _count_env_parses(monkeypatch, parser: ConfigParser) -> list:
+    calls = []
+    real = parser._parse_env_once
+
+    def counting():
+        calls.append(1)
+        return real()
+
+    monkeypatch.setattr(parser, "_parse_env_once", counting)
+    return calls
+
+
+def test_unchanged_env_file_is_parsed_once(tmp_path, monkeypatch):
+    parser = _parser(tmp_path, monkeypatch, "PROJECT_NAME=demo\nFOO=1\n")
+    calls = _count_env_parses(monkeypatch, parser)
+
+    assert parser.parse_env_file() == {"PROJECT_NAME": "demo", "FOO": "1"}
+    assert parser.parse_env_file()["FOO"] == "1"
+    assert parser.get_project_name() == "demo"
+    assert len(calls) == 1
+
+
+def test_env_vars_and_sources_share_one_read(tmp_path, monkeypatch):
+    parser = _parser(tmp_path, monkeypatch, "FOO=1\nN8N_SOURCE=container  # note\n")
+    calls = _count_env_parses(monkeypatch, parser)
+
+    assert parser.parse_service_sources() == {
+        "BACKEND_SOURCE": "container",
+        "N8N_SOURCE": "container",
+    }
+    assert parser.parse_env_file() == {"FOO": "1", "N8N_SOURCE": "container"}
+    assert len(calls) == 1
+
+
+def test_returned_dicts_do_not_leak_into_cache(tmp_path, monkeypatch):
+    parser = _parser(tmp_path, monkeypatch, "FOO=1\nLLM_PROVIDER_SOURCE=ollama-container-cpu\n")
+
+    parser.parse_env_file()["FOO"] = "mutated"
+    parser.parse_service_sources()["LLM_PROVIDER_SOURCE"] = "mutated"
+
+    assert parser.parse_env_file()["FOO"] == "1"
+    assert parser.parse_service_sources()["LLM_PROVIDER_SOURCE"] == "ollama-container-cpu"
+
+
+def test_rewritten_env_file_is_reparsed(tmp_path, monkeypatch):
+    parser = _parser(tmp_path, monkeypatch, "LLM_PROVIDER_SOURCE=ollama-container-cpu\n")
+    assert parser.parse_service_sources()["LLM_PROVIDER_SOURCE"] == "ollama-container-cpu"
+
+    env = parser.env_file_path
+    env.write_text("LLM_PROVIDER_SOURCE=none\n", encoding="utf-8")
+    _age(env, seconds=30)
+
+    assert parser.parse_service_sources()["LLM_PROVIDER_SOURCE"] == "none"
+    assert parser.parse_env_file() == {"LLM_PROVIDER_SOURCE": "none"}
+
+
+def test_recently_modified_env_file_is_not_cached(tmp_path, monkeypatch):
+    # A same-size rewrite within one timestamp tick keeps the stat signature,
+    # so freshly written files must be re-read every time.
+    parser = _parser(tmp_path, monkeypatch, "FOO=1\n")
+    os.utime(parser.env_file_path, None)
+    calls = _count_env_parses(monkeypatch, parser)
+
+    parser.parse_env_file()
+    parser.parse_env_file()
+    assert len(calls) == 2
+
+
+def test_missing_env_file_then_created(tmp_path, monkeypatch):
+    parser = _parser(tmp_path, monkeypatch, "")
+    parser.env_file_path.unlink()
+    assert parser.parse_env_file() == {}
+
+    parser.env_file_path.write_text("FOO=2\n", encoding="utf-8")
+    assert parser.parse_env_file() == {"FOO": "2"}
+
+
+def test_yaml_config_is_cached_until_a_manifest_changes(tmp_path, monkeypatch):
+    manifest = tmp_path / "services" / "demo" / "service.yml"
+    manifest.parent.mkdir(parents=True)
+    manifest.write_text("name: demo\n", encoding="utf-8")
+    _age(manifest)
+
+    import services.manifests
+    import services.sc_synthesizer
+
+    loads = []
+    monkeypatch.setattr(
+        services.manifests, "load_manifests",
+        lambda root: loads.append(root) or ["m"],
+    )
+    monkeypatch.setattr(
+        services.sc_synthesizer, "synthesize_legacy",
+        lambda manifests: {"dependencies": {"demo": []}},
+    )
+    parser = ConfigParser(root_dir=str(tmp_path))
+
+    first = parser.load_yaml_config()
+    first["dependencies"]["demo"].append("mutated")
+    assert parser.load_yaml_config() == {"dependencies": {"demo": []}}
+    assert len(loads) == 1
+
+    manifest.write_text("name: demo\nport: 1\n", encoding="utf-8")
+    _age(manifest, seconds=30)
+    parser.load_yaml_config()
+    assert len(loads) == 2
+
+
+
+def test_source_keys_follow_start_sh_pattern(tmp_path, monkeypatch):
+    parser = _parser(tmp_path, monkeypatch, "\n".join([
+        "N8N_SOURCE='container' # note",
+        "comfyui_SOURCE=localhost",
+        "WEAVIATE_SOURCE =container",
+        "_SOURCE=x",
+        "RESOURCE=y",
+    ]) + "\n")
+
+    assert parser.parse_service_sources() == {
+        "BACKEND_SOURCE": "container",
+        "N8N_SOURCE": "container",
+    }
+
+
+def test_env_file_stat_is_reused_within_a_run(tmp_path, monkeypatch):
+    parser = _parser(tmp_path, monkeypatch, "FOO=1\n")
+    assert parser.env_file_exists()
+    stamp = parser.get_env_file_timestamp()
+
+    # Later checks reuse the first stat instead of hitting the filesystem.
+    os.utime(parser.env_file_path, None)
+    assert parser.get_env_file_timestamp() == stamp
+
+    parser.invalidate_stat_cache()
+    assert parser.get_env_file_timestamp() != stamp
+
+
+def test_missing_env_file_is_not_cached_as_missing(tmp_path, monkeypatch):
+    parser = _parser(tmp_path, monkeypatch, "")
+    parser.env_file_path.unlink()
+    assert not parser.env_file_exists()
+
+    parser.env_file_path.write_text("FOO=1\n", encoding="utf-8")
+    assert parser.env_file_exists()
+
+
+def test_backup_refreshes_stat_cache(tmp_path, monkeypatch):
+    parser = _parser(tmp_path, monkeypatch, "FOO=1\n")
+    assert parser.env_file_exists()
+
+    backup = parser.create_env_backup()
+
+    assert os.path.exists(backup)
+    assert parser._stat_cache == {}
+
+
+def test_same_second_backups_do_not_overwrite(tmp_path, monkeypatch):
+    parser = _parser(tmp_path, monkeypatch, "FOO=1\n")
+    (tmp_path / "unrelated.backup.1").write_text("", encoding="utf-8")
+
+    import datetime
+
+    class _FrozenDatetime(datetime.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return cls(2026, 1, 2, 3, 4, 5)
+
+    monkeypatch.setattr(datetime, "datetime", _FrozenDatetime)
+    first = parser.create_env_backup()
+    parser.env_file_path.write_text("FOO=2\n", encoding="utf-8")
+    second = parser.create_env_backup()
+
+    assert first.endswith(".env.backup.20260102030405")
+    assert second.endswith(".env.backup.20260102030405.1")
+    assert [p.name for p in parser._list_backups()] == [
+        ".env.backup.20260102030405",
+        ".env.backup.20260102030405.1",
+    ]
+    assert open(first, encoding="utf-8").read() == "FOO=1\n"
+
+
+def test_env_file_info_reports_existence_and_mtime_from_one_stat(tmp_path, monkeypatch):
+    parser = _parser(tmp_path, monkeypatch, "FOO=1\n")
+    stats = []
+    real_stat = parser._stat
+    monkeypatch.setattr(parser, "_stat", lambda path, refresh=False: stats.append(path) or real_stat(path, refresh))
+
+    exists, stamp = parser.env_file_info()
+    assert exists is True
+    assert stamp == parser.get_env_file_timestamp()
+    assert len(stats) == 2  # one per call, not two for env_file_info
+
+    parser.env_file_path.unlink()
+    parser.invalidate_stat_cache()
+    assert parser.env_file_info() == (False, None)
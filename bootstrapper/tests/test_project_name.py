@@ -206,6 +206,29 @@ def test_cold_stop_uses_project_override_for_compose_and_networks(monkeypatch):
     assert stopper.docker_manager.project_name_override is None
 
 
+def test_cold_start_cleanup_runs_a_single_compose_down(monkeypatch):
+    from core.docker_manager import DockerManager
+
+    dm = DockerManager()
+    dm.project_name_override = "myshowcase"
+    downs = []
+    prunes = []
+    monkeypatch.setattr(
+        dm, "stream_compose",
+        lambda args, on_line=None, **_kwargs: downs.append(args) or 0,
+    )
+    monkeypatch.setattr(dm, "remove_project_networks", lambda project_name: True)
+    monkeypatch.setattr(
+        dm, "prune_system",
+        lambda remove_volumes=False: prunes.append(remove_volumes) or 0,
+    )
+    dm.set_command_echo_callback(lambda _line: None)
+
+    assert dm.perform_cold_start_cleanup() is True
+    assert downs == [["down", "--volumes", "--remove-orphans"]]
+    assert prunes == [True, False]
+
+
 # ── wizard "Project name" step ───────────────────────────────────────────────
 
 def test_wizard_project_name_step_and_mapping(tmp_path, monkeypatch):
@@ -237,3 +260,21 @@ def test_wizard_project_name_step_and_mapping(tmp_path, monkeypatch):
     # An invalid entry → no-op (None) rather than corrupting PROJECT_NAME.
     _, opts_bad = _selections_to_args({title: "bad name!"}, info, cbp, env_vars=env_vars)
     assert opts_bad.get("project_name") is None
+
+
+def test_docker_manager_project_name_follows_env_rewrites(tmp_path, monkeypatch):
+    # DockerManager must not pin PROJECT_NAME: the wizard rewrites it mid-run.
+    from core.docker_manager import DockerManager
+
+    monkeypatch.delenv("ATLAS_ENV_FILE", raising=False)
+    monkeypatch.delenv("GENAI_ENV_FILE", raising=False)
+    env = tmp_path / ".env"
+    env.write_text("PROJECT_NAME=first\n", encoding="utf-8")
+    dm = DockerManager(str(tmp_path))
+    assert dm._project_name() == "first"
+
+    env.write_text("PROJECT_NAME=second\n", encoding="utf-8")
+    assert dm._project_name() == "second"
+
+    dm.project_name_override = "override"
+    assert dm._project_name() == "override"
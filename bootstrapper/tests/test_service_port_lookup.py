@@ -0,0 +1,101 @@
+"""DockerManager.get_service_port answers every lookup from a single
+``docker compose ps --format json`` call instead of one ``docker compose
+port`` subprocess per (service, port).
+"""
+from __future__ import annotations
+
+import json
+
+import core.docker_manager as docker_manager_module
+from core.docker_manager import DockerManager
+
+
+class _Result:
+    def __init__(self, stdout="", returncode=0):
+        self.stdout = stdout
+        self.stderr = ""
+        self.returncode = returncode
+
+
+def _ps_rows():
+    return "\n".join(json.dumps(row) for row in [
+        {
+            "Service": "backend",
+            "Publishers": [
+                {"URL": "0.0.0.0", "TargetPort": 8000, "PublishedPort": 63016, "Protocol": "tcp"},
+                {"URL": "::", "TargetPort": 8000, "PublishedPort": 63016, "Protocol": "tcp"},
+            ],
+        },
+        {
+            "Service": "kong-api-gateway",
+            "Publishers": [
+                {"URL": "0.0.0.0", "TargetPort": 8000, "PublishedPort": 63002, "Protocol": "tcp"},
+                {"URL": "0.0.0.0", "TargetPort": 8443, "PublishedPort": 63003, "Protocol": "tcp"},
+                {"URL": "", "TargetPort": 8001, "PublishedPort": 0, "Protocol": "tcp"},
+            ],
+        },
+        {"Service": "redis", "Publishers": None},
+    ])
+
+
+def _manager(monkeypatch, responses) -> tuple[DockerManager, list]:
+    dm = DockerManager()
+    monkeypatch.setattr(dm, "detect_docker_compose_command", lambda: "docker compose")
+    calls = []
+
+    def fake_run(cmd, **_kwargs):
+        calls.append(cmd)
+        return responses(cmd)
+
+    monkeypatch.setattr(docker_manager_module.subprocess, "run", fake_run)
+    return dm, calls
+
+
+def test_lookups_share_one_compose_ps(monkeypatch):
+    dm, calls = _manager(monkeypatch, lambda cmd: _Result(_ps_rows()))
+
+    assert dm.get_service_port("backend", "8000") == "63016"
+    assert dm.get_service_port("kong-api-gateway", "8000") == "63002"
+    assert dm.get_service_port("kong-api-gateway", "8443") == "63003"
+    assert dm.get_service_port("kong-api-gateway", "8001") == ""
+    assert dm.get_service_port("redis", "6379") == ""
+    assert dm.get_service_port("n8n", "5678") == ""
+
+    assert len(calls) == 1
+    assert calls[0][-3:] == ["ps", "--format", "json"]
+
+
+def test_compose_runs_drop_the_port_cache(monkeypatch):
+    dm, calls = _manager(monkeypatch, lambda cmd: _Result(_ps_rows()))
+
+    dm.get_service_port("backend", "8000")
+    dm.execute_compose_command(["up", "-d"])
+    dm.get_service_port("backend", "8000")
+
+    assert [cmd[-1] for cmd in calls] == ["json", "-d", "json"]
+
+
+def test_falls_back_to_compose_port_when_ps_fails(monkeypatch):
+    def responses(cmd):
+        if "ps" in cmd:
+            return _Result(returncode=1)
+        return _Result("0.0.0.0:63016\n")
+
+    dm, calls = _manager(monkeypatch, responses)
+
+    assert dm.get_service_port("backend", "8000") == "63016"
+    assert calls[-1][-3:] == ["port", "backend", "8000"]
+
+
+def test_compose_port_fallback_parses_ipv6_and_rejects_garbage(monkeypatch):
+    outputs = iter(["[::]:63016\n", "no such service\n"])
+
+    def responses(cmd):
+        if "ps" in cmd:
+            return _Result(returncode=1)
+        return _Result(next(outputs))
+
+    dm, _calls = _manager(monkeypatch, responses)
+
+    assert dm.get_service_port("backend", "8000") == "63016"
+    assert dm.get_service_port("ghost", "1") == ""
@@ -1762,11 +1762,9 @@ class WizardScreen(Screen):
 
     async def _cold_cleanup(self) -> None:
         project_name = self._starter.config_parser.get_project_name()
-        self._write_status("  • Stopping and removing containers…",
+        self._write_status("  • Stopping containers and removing volumes…",
                            style="dim", source="pipeline")
-        await self._run_compose(["down", "--remove-orphans"])
-        self._write_status("  • Removing volumes…", style="dim", source="pipeline")
-        await self._run_compose(["down", "-v"])
+        await self._run_compose(["down", "--volumes", "--remove-orphans"])
         self._write_status("  • Removing project network…",
                            style="dim", source="pipeline")
         await self._run_command(
@@ -5,53 +5,374 @@ import httpx
 import asyncio
 import time
 import uuid
-from typing import Dict, Any, Optional, List
+from typing import AsyncIterator, Dict, Any, Optional, List, Set, Tuple
 import os
 import logging
+import random
+import secrets
+
+import orjson
+import websockets
 
 logger = logging.getLogger(__name__)
 
+# ComfyUI REST endpoints, relative to the client's base_url.
+_EP_SYSTEM_STATS = "/system_stats"
+_EP_OBJECT_INFO = "/object_info"
+_EP_PROMPT = "/prompt"
+_EP_HISTORY = "/history"
+_EP_QUEUE = "/queue"
+_EP_INTERRUPT = "/interrupt"
+_EP_VIEW = "/view"
+
+# Request bodies are pre-encoded with orjson (httpx's json= uses the
+# stdlib encoder), so the content type has to be set by hand.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Read size for /view downloads; peak memory per download is one chunk
+# rather than the whole image.
+_IMAGE_CHUNK_SIZE = 64 * 1024
+
+# Retry policy for idempotent GETs (see ComfyUIClient._get). 502/503/504
+# are what a proxy or a restarting ComfyUI container answer with. Connect
+# failures are not listed: the transport's retries= already re-attempts
+# them, and retrying here too would multiply connect timeouts against a
+# down host.
+_GET_ATTEMPTS = 4
+_GET_RETRY_BASE_DELAY = 0.1
+_GET_RETRY_MAX_DELAY = 2.0
+_RETRYABLE_STATUSES = frozenset({502, 503, 504})
+_RETRYABLE_ERRORS = (
+    httpx.ReadError, httpx.WriteError, httpx.CloseError, httpx.RemoteProtocolError
+)
+
+# Polling fallback in wait_for_completion: exponential backoff between
+# /history/{prompt_id} checks.
+_POLL_INITIAL_DELAY = 0.1
+_POLL_MAX_DELAY = 5.0
+
+# What a failed ComfyUI round-trip can raise: transport/HTTP-status errors
+# from httpx, and ValueError from decoding a non-JSON body (orjson's
+# JSONDecodeError subclasses it). Anything else is a bug and propagates.
+_UPSTREAM_ERRORS = (httpx.HTTPError, ValueError)
+
+# Websocket message types that mean "this prompt is no longer running".
+# ComfyUI also signals completion with an ``executing`` message whose
+# ``node`` is None, handled separately in _listen_ws.
+_TERMINAL_WS_EVENTS = frozenset(
+    {"execution_success", "execution_error", "execution_interrupted"}
+)
+
+# Node graph for generate_simple_image. Per-call values (checkpoint,
+# prompts, sampler settings, size) are patched into a copy of each
+# node's inputs; the placeholders here are never sent as-is.
+_SIMPLE_WORKFLOW_TEMPLATE: Dict[str, Dict[str, Any]] = {
+    "1": {
+        "inputs": {
+            "ckpt_name": None
+        },
+        "class_type": "CheckpointLoaderSimple"
+    },
+    "2": {
+        "inputs": {
+            "text": "",
+            "clip": ["1", 1]
+        },
+        "class_type": "CLIPTextEncode"
+    },
+    "3": {
+        "inputs": {
+            "text": "",
+            "clip": ["1", 1]
+        },
+        "class_type": "CLIPTextEncode"
+    },
+    "4": {
+        "inputs": {
+            "seed": 0,
+            "steps": 20,
+            "cfg": 7.0,
+            "sampler_name": "euler",
+            "scheduler": "normal",
+            "denoise": 1.0,
+            "model": ["1", 0],
+            "positive": ["2", 0],
+            "negative": ["3", 0],
+            "latent_image": ["5", 0]
+        },
+        "class_type": "KSampler"
+    },
+    "5": {
+        "inputs": {
+            "width": 512,
+            "height": 512,
+            "batch_size": 1
+        },
+        "class_type": "EmptyLatentImage"
+    },
+    "6": {
+        "inputs": {
+            "samples": ["4", 0],
+            "vae": ["1", 2]
+        },
+        "class_type": "VAEDecode"
+    },
+    "7": {
+        "inputs": {
+            "filename_prefix": "ComfyUI",
+            "images": ["6", 0]
+        },
+        "class_type": "SaveImage"
+    }
+}
+
+class ComfyUIError(Exception):
+    """Raised when a ComfyUI request fails — carries the upstream HTTP
+    status (None for transport errors) and the decoded error body so
+    callers can branch on them instead of parsing messages."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None, payload: Any = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.payload = payload
+
+
+def _upstream_error(exc: Exception) -> ComfyUIError:
+    """Wrap an httpx/decoding failure as a ComfyUIError."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        response = exc.response
+        try:
+            payload = orjson.loads(response.content)
+        except ValueError:
+            payload = response.text
+        return ComfyUIError(str(exc), status_code=response.status_code, payload=payload)
+    return ComfyUIError(str(exc))
+
+
 class ComfyUIClient:
-    def __init__(self, base_url: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         self.base_url = base_url or os.getenv("COMFYUI_BASE_URL", "http://comfyui:18188")
         self.base_url = self.base_url.rstrip('/')
         # connect=5 fails fast on a down ComfyUI (single budget=60 would
         # wait the full minute before reporting unhealthy); read=60 keeps
         # the long budget for image-generation HTTP rounds that legitimately
         # take that long.
+        # base_url lets every call site pass a bare endpoint path, and the
+        # explicit Limits size the keep-alive pool for concurrent generation
+        # plus /history polling (httpx's default of 20 keep-alive sockets is
+        # easily exhausted, forcing fresh TCP handshakes per poll).
+        # retries= re-attempts failed TCP connects (ComfyUI restarting),
+        # which is safe for every method including POST /prompt.
+        # An injected transport (the app-wide pool in main.py) replaces the
+        # client's own pool; its limits are configured by whoever owns it.
+        self._owns_transport = transport is None
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=30.0,
+                ),
+                retries=3,
+            )
         self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(connect=5.0, read=60.0, write=10.0, pool=5.0)
+            base_url=self.base_url,
+            timeout=httpx.Timeout(connect=5.0, read=60.0, write=10.0, pool=5.0),
+            transport=transport,
         )
-        
+        # ComfyUI only pushes progress events to the websocket whose
+        # clientId queued the prompt, so one id per client instance lets a
+        # single socket serve every wait_for_completion on this client.
+        self.client_id = str(uuid.uuid4())
+        self._ws_task: Optional[asyncio.Task] = None
+        self._ws_lock = asyncio.Lock()
+        # One event per waiter, so a waiter that returns can't take the
+        # event away from another one waiting on the same prompt.
+        self._completion_events: Dict[str, Set[asyncio.Event]] = {}
+        self._models_ttl = float(os.getenv("COMFYUI_MODELS_TTL", "60"))
+        self._models_cache: Optional[Tuple[float, Dict[str, List[str]]]] = None
+        self._models_lock = asyncio.Lock()
+        # Separate connection budgets: _prompt_sem caps concurrent POST
+        # /prompt calls (it is released once the prompt is queued, so it does
+        # not bound ComfyUI's own job queue), and a burst of submissions
+        # can't starve the (cheap, frequent) /history polls of connections.
+        self._prompt_sem = asyncio.Semaphore(int(os.getenv("COMFYUI_MAX_INFLIGHT", "4")))
+        self._history_sem = asyncio.Semaphore(int(os.getenv("COMFYUI_MAX_HISTORY_POLLS", "32")))
+
     async def __aenter__(self):
         return self
-        
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._ws_task is not None:
+            self._ws_task.cancel()
+            try:
+                await self._ws_task
+            except asyncio.CancelledError:
+                pass
+            self._ws_task = None
+        # Closing the AsyncClient closes its transport, which would tear
+        # down a shared pool other clients still use.
+        if self._owns_transport:
+            await self.client.aclose()
+
+    def _ws_url(self) -> str:
+        """ComfyUI's event stream lives at /ws on the same host:port."""
+        scheme, sep, rest = self.base_url.partition("://")
+        ws_scheme = "wss" if scheme == "https" else "ws"
+        return f"{ws_scheme}{sep}{rest}/ws?clientId={self.client_id}"
+
+    async def _ensure_ws_listener(self) -> bool:
+        """Start the shared websocket listener if it isn't running.
+
+        Returns False when the socket can't be opened (older ComfyUI,
+        proxy that strips Upgrade, ...) so callers fall back to polling.
+        """
+        async with self._ws_lock:
+            if self._ws_task is not None and not self._ws_task.done():
+                return True
+            try:
+                ws = await websockets.connect(
+                    self._ws_url(), open_timeout=5, max_size=None
+                )
+            except (OSError, asyncio.TimeoutError, websockets.exceptions.WebSocketException) as e:
+                logger.warning("ComfyUI websocket unavailable, polling instead: %s", e)
+                return False
+            self._ws_task = asyncio.create_task(self._listen_ws(ws))
+            return True
+
+    async def _listen_ws(self, ws) -> None:
+        """Wake the matching waiter whenever ComfyUI reports a prompt done."""
+        try:
+            async for message in ws:
+                # Binary frames carry live previews — not interesting here.
+                if not isinstance(message, str):
+                    continue
+                try:
+                    msg = orjson.loads(message)
+                except ValueError:
+                    continue
+                data = msg.get("data") or {}
+                prompt_id = data.get("prompt_id")
+                msg_type = msg.get("type")
+                done = msg_type in _TERMINAL_WS_EVENTS or (
+                    msg_type == "executing" and data.get("node") is None
+                )
+                if prompt_id and done:
+                    for event in self._completion_events.get(prompt_id, ()):
+                        event.set()
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        finally:
+            await ws.close()
+            # Wake every waiter: they re-check history and continue by
+            # polling now that no more events will arrive.
+            for events in self._completion_events.values():
+                for event in events:
+                    event.set()
     
+    async def _get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """GET ``url``, retrying transient upstream failures.
+
+        Only for idempotent reads. Dropped connections and 502/503/504 are
+        retried up to _GET_ATTEMPTS times with jittered exponential
+        backoff; the last response is returned (or the last error raised)
+        for the caller's raise_for_status/except to handle as before.
+        Read timeouts are not retried — they already waited the full
+        read budget — and neither are connect failures, which the
+        transport has already retried.
+        """
+        delay = _GET_RETRY_BASE_DELAY
+        for _ in range(_GET_ATTEMPTS - 1):
+            try:
+                response = await self.client.get(url, **kwargs)
+            except _RETRYABLE_ERRORS:
+                pass
+            else:
+                if response.status_code not in _RETRYABLE_STATUSES:
+                    return response
+                await response.aclose()
+            await asyncio.sleep(delay + random.uniform(0, delay))
+            delay = min(delay * 2, _GET_RETRY_MAX_DELAY)
+        return await self.client.get(url, **kwargs)
+
+    async def _get_json(self, url: str, **kwargs: Any) -> Any:
+        """GET ``url`` (retried as in _get) and decode the JSON body.
+
+        Raises httpx.HTTPStatusError on an error status and ValueError on
+        a body that isn't JSON.
+        """
+        response = await self._get(url, **kwargs)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def _post_json(self, url: str, body: Any = None) -> Any:
+        """POST ``body`` as JSON (never retried) and decode the reply.
+
+        Some endpoints (/queue, /interrupt) answer with an empty body;
+        that decodes to None.
+        """
+        if body is None:
+            response = await self.client.post(url)
+        else:
+            response = await self.client.post(
+                url, content=orjson.dumps(body), headers=_JSON_HEADERS
+            )
+        response.raise_for_status()
+        return orjson.loads(response.content) if response.content else None
+
     async def health_check(self) -> Dict[str, Any]:
         """Check if ComfyUI is available and responsive"""
         try:
-            response = await self.client.get(f"{self.base_url}/system_stats")
+            response = await self._get(_EP_SYSTEM_STATS)
             response.raise_for_status()
             return {
                 "status": "healthy",
                 "response_time": response.elapsed.total_seconds(),
-                "system_stats": response.json()
+                "system_stats": orjson.loads(response.content)
             }
-        except Exception as e:
-            logger.error(f"ComfyUI health check failed: {str(e)}")
+        except _UPSTREAM_ERRORS as e:
+            logger.error("ComfyUI health check failed: %s", e)
             return {
                 "status": "unhealthy",
                 "error": str(e)
             }
     
+    def invalidate_models_cache(self) -> None:
+        """Drop the cached model listing (e.g. after adding a checkpoint)."""
+        self._models_cache = None
+
     async def get_models(self) -> Dict[str, List[str]]:
-        """Get available models from ComfyUI"""
+        """Get available models from ComfyUI.
+
+        /object_info is a multi-MB dump of every node definition, so the
+        extracted listing is cached for COMFYUI_MODELS_TTL seconds. The lock
+        collapses concurrent cache misses into a single upstream fetch.
+        Failures ({}) are not cached.
+        """
+        cached = self._models_cache
+        if cached is not None and time.monotonic() - cached[0] < self._models_ttl:
+            return cached[1]
+
+        async with self._models_lock:
+            cached = self._models_cache
+            if cached is not None and time.monotonic() - cached[0] < self._models_ttl:
+                return cached[1]
+            models = await self._fetch_models()
+            if models:
+                self._models_cache = (time.monotonic(), models)
+            return models
+
+    async def _fetch_models(self) -> Dict[str, List[str]]:
+        """Read model lists for the common loaders out of /object_info."""
         try:
-            response = await self.client.get(f"{self.base_url}/object_info")
-            response.raise_for_status()
-            object_info = response.json()
+            object_info = await self._get_json(_EP_OBJECT_INFO)
             
             models = {}
             
@@ -81,27 +402,26 @@ class ComfyUIClient:
             
             return models
             
-        except Exception as e:
-            logger.error(f"Failed to get models from ComfyUI: {str(e)}")
+        # LookupError/TypeError: /object_info answered, but not in the
+        # shape the loaders above expect.
+        except (*_UPSTREAM_ERRORS, LookupError, TypeError) as e:
+            logger.error("Failed to get models from ComfyUI: %s", e)
             return {}
     
     async def queue_prompt(self, workflow: Dict[str, Any]) -> Dict[str, Any]:
         """Queue a workflow for execution"""
         try:
-            # Generate a unique client_id for this request
-            client_id = str(uuid.uuid4())
-            
+            # Queue under this instance's client_id so completion events
+            # reach the shared websocket listener.
+            client_id = self.client_id
+
             prompt_data = {
                 "prompt": workflow,
                 "client_id": client_id
             }
             
-            response = await self.client.post(
-                f"{self.base_url}/prompt",
-                json=prompt_data
-            )
-            response.raise_for_status()
-            result = response.json()
+            async with self._prompt_sem:
+                result = await self._post_json(_EP_PROMPT, prompt_data) or {}
             
             return {
                 "success": True,
@@ -110,37 +430,48 @@ class ComfyUIClient:
                 "number": result.get("number")
             }
             
-        except Exception as e:
-            logger.error(f"Failed to queue prompt: {str(e)}")
+        except _UPSTREAM_ERRORS as e:
+            error = _upstream_error(e)
+            logger.error("Failed to queue prompt: %s", error)
+            # ComfyUI answers a rejected workflow with a 400 whose body
+            # lists node_errors; pass it through structured.
             return {
                 "success": False,
-                "error": str(e)
+                "error": str(error),
+                "status_code": error.status_code,
+                "payload": error.payload
             }
     
-    async def get_history(self, prompt_id: Optional[str] = None) -> Dict[str, Any]:
-        """Get execution history"""
+    async def get_history(
+        self, prompt_id: Optional[str] = None, max_items: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Get execution history.
+
+        Without ``prompt_id`` this is ComfyUI's whole history ring buffer;
+        ``max_items`` caps it to the most recent entries.
+        """
         try:
-            url = f"{self.base_url}/history"
+            url = _EP_HISTORY
+            params = None
             if prompt_id:
-                url += f"/{prompt_id}"
+                url = f"{_EP_HISTORY}/{prompt_id}"
+            elif max_items is not None:
+                params = {"max_items": max_items}
             
-            response = await self.client.get(url)
-            response.raise_for_status()
-            return response.json()
+            async with self._history_sem:
+                return await self._get_json(url, params=params)
             
-        except Exception as e:
-            logger.error(f"Failed to get history: {str(e)}")
+        except _UPSTREAM_ERRORS as e:
+            logger.error("Failed to get history: %s", e)
             return {}
     
     async def get_queue_status(self) -> Dict[str, Any]:
         """Get current queue status"""
         try:
-            response = await self.client.get(f"{self.base_url}/queue")
-            response.raise_for_status()
-            return response.json()
+            return await self._get_json(_EP_QUEUE)
             
-        except Exception as e:
-            logger.error(f"Failed to get queue status: {str(e)}")
+        except _UPSTREAM_ERRORS as e:
+            logger.error("Failed to get queue status: %s", e)
             return {}
     
     async def cancel_prompt(self, prompt_id: str) -> bool:
@@ -158,18 +489,13 @@ class ComfyUIClient:
                 for item in queue.get("queue_running", [])
                 if isinstance(item, (list, tuple)) and len(item) > 1
             }
-            response = await self.client.post(
-                f"{self.base_url}/queue",
-                json={"delete": [prompt_id]}
-            )
-            response.raise_for_status()
+            await self._post_json(_EP_QUEUE, {"delete": [prompt_id]})
             if prompt_id in running_ids:
-                response = await self.client.post(f"{self.base_url}/interrupt")
-                response.raise_for_status()
+                await self._post_json(_EP_INTERRUPT)
             return True
             
-        except Exception as e:
-            logger.error(f"Failed to cancel prompt {prompt_id}: {str(e)}")
+        except _UPSTREAM_ERRORS as e:
+            logger.error("Failed to cancel prompt %s: %s", prompt_id, e)
             return False
     
     async def generate_simple_image(
@@ -187,69 +513,25 @@ class ComfyUIClient:
         
         # Generate random seed if not provided
         if seed is None:
-            seed = int.from_bytes(os.urandom(4), byteorder='big') % (2**32)
-        
-        # Create a simple workflow
+            seed = secrets.randbits(32)
+
+        # Copy each node's inputs so the shared template is never mutated;
+        # link lists like ["1", 1] are read-only and can stay shared.
         workflow = {
-            "1": {
-                "inputs": {
-                    "ckpt_name": checkpoint
-                },
-                "class_type": "CheckpointLoaderSimple"
-            },
-            "2": {
-                "inputs": {
-                    "text": prompt,
-                    "clip": ["1", 1]
-                },
-                "class_type": "CLIPTextEncode"
-            },
-            "3": {
-                "inputs": {
-                    "text": negative_prompt,
-                    "clip": ["1", 1]
-                },
-                "class_type": "CLIPTextEncode"
-            },
-            "4": {
-                "inputs": {
-                    "seed": seed,
-                    "steps": steps,
-                    "cfg": cfg,
-                    "sampler_name": "euler",
-                    "scheduler": "normal",
-                    "denoise": 1.0,
-                    "model": ["1", 0],
-                    "positive": ["2", 0],
-                    "negative": ["3", 0],
-                    "latent_image": ["5", 0]
-                },
-                "class_type": "KSampler"
-            },
-            "5": {
-                "inputs": {
-                    "width": width,
-                    "height": height,
-                    "batch_size": 1
-                },
-                "class_type": "EmptyLatentImage"
-            },
-            "6": {
-                "inputs": {
-                    "samples": ["4", 0],
-                    "vae": ["1", 2]
-                },
-                "class_type": "VAEDecode"
-            },
-            "7": {
-                "inputs": {
-                    "filename_prefix": "ComfyUI",
-                    "images": ["6", 0]
-                },
-                "class_type": "SaveImage"
-            }
+            node_id: {**node, "inputs": dict(node["inputs"])}
+            for node_id, node in _SIMPLE_WORKFLOW_TEMPLATE.items()
         }
-        
+        workflow["1"]["inputs"]["ckpt_name"] = checkpoint
+        workflow["2"]["inputs"]["text"] = prompt
+        workflow["3"]["inputs"]["text"] = negative_prompt
+        sampler = workflow["4"]["inputs"]
+        sampler["seed"] = seed
+        sampler["steps"] = steps
+        sampler["cfg"] = cfg
+        latent = workflow["5"]["inputs"]
+        latent["width"] = width
+        latent["height"] = height
+
         # Queue the workflow
         result = await self.queue_prompt(workflow)
         
@@ -272,58 +554,149 @@ class ComfyUIClient:
         else:
             return result
     
-    async def wait_for_completion(self, prompt_id: str, timeout: int = 300) -> Dict[str, Any]:
-        """Wait for a prompt to complete execution"""
-        start_time = time.monotonic()
-        
-        while True:
-            # Check if timeout exceeded
-            if time.monotonic() - start_time > timeout:
+    async def _check_completion(self, prompt_id: str) -> Optional[Dict[str, Any]]:
+        """Return the final result if the prompt's history says it is done."""
+        if not prompt_id:
+            # get_history("") would fetch the entire history ring buffer.
+            raise ValueError("prompt_id is required")
+        history = await self.get_history(prompt_id)
+
+        # /history/{prompt_id} only ever holds this prompt's entry, keyed by
+        # its id; take the sole value if a ComfyUI build keys it otherwise.
+        prompt_history = history.get(prompt_id) or next(iter(history.values()), None)
+        if prompt_history is not None:
+
+            # Check if completed
+            if "outputs" in prompt_history:
+                return {
+                    "success": True,
+                    "outputs": prompt_history["outputs"],
+                    "status": prompt_history.get("status", {}),
+                    "prompt_id": prompt_id
+                }
+
+            # Check if failed
+            if "status" in prompt_history and prompt_history["status"].get("status_str") == "error":
                 return {
                     "success": False,
-                    "error": "Timeout waiting for completion"
+                    "error": prompt_history["status"].get("messages", []),
+                    "prompt_id": prompt_id
                 }
-            
-            # Get history for this prompt
-            history = await self.get_history(prompt_id)
-            
-            if prompt_id in history:
-                prompt_history = history[prompt_id]
-                
-                # Check if completed
-                if "outputs" in prompt_history:
-                    return {
-                        "success": True,
-                        "outputs": prompt_history["outputs"],
-                        "status": prompt_history.get("status", {}),
-                        "prompt_id": prompt_id
-                    }
-                
-                # Check if failed
-                if "status" in prompt_history and prompt_history["status"].get("status_str") == "error":
+        return None
+
+    async def wait_for_completion(self, prompt_id: str, timeout: int = 300) -> Dict[str, Any]:
+        """Wait for a prompt to complete execution.
+
+        Blocks on ComfyUI's websocket event stream and reads /history once
+        the prompt reports done, instead of fetching history every second.
+        Polling is the fallback when the websocket can't be opened or
+        drops mid-wait. ComfyUI may emit the completion event a moment
+        before the history entry lands, so a signalled-but-incomplete
+        check also drops to polling rather than waiting for an event that
+        will never repeat.
+        """
+        start_time = time.monotonic()
+        event = asyncio.Event()
+        self._completion_events.setdefault(prompt_id, set()).add(event)
+        # Fast prompts are noticed within ~100ms; long runs back off to one
+        # history fetch every few seconds.
+        poll_delay = _POLL_INITIAL_DELAY
+
+        try:
+            use_ws = await self._ensure_ws_listener()
+
+            while True:
+                # One history check up front also covers prompts that
+                # finished before the listener was attached.
+                result = await self._check_completion(prompt_id)
+                if result is not None:
+                    return result
+
+                # Check if timeout exceeded
+                remaining = timeout - (time.monotonic() - start_time)
+                if remaining <= 0:
                     return {
                         "success": False,
-                        "error": prompt_history["status"].get("messages", []),
-                        "prompt_id": prompt_id
+                        "error": "Timeout waiting for completion"
                     }
-            
-            # Wait before checking again
-            await asyncio.sleep(1)
-    
+
+                if use_ws and not event.is_set():
+                    try:
+                        await asyncio.wait_for(event.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        pass
+                else:
+                    # Wait before checking again (jittered so concurrent
+                    # waiters don't poll in lockstep)
+                    jitter = random.uniform(0, poll_delay * 0.1)
+                    await asyncio.sleep(min(poll_delay + jitter, remaining))
+                    poll_delay = min(poll_delay * 1.5, _POLL_MAX_DELAY)
+        finally:
+            waiters = self._completion_events.get(prompt_id)
+            if waiters is not None:
+                waiters.discard(event)
+                if not waiters:
+                    del self._completion_events[prompt_id]
+
+    async def stream_image(
+        self,
+        filename: str,
+        subfolder: str = "",
+        folder_type: str = "output",
+        chunk_size: int = _IMAGE_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Stream image bytes from ComfyUI in chunks of up to ``chunk_size``.
+
+        Raises ``ComfyUIError`` (with ``status_code`` set) on the first
+        iteration if ComfyUI answers with an error status, before any bytes
+        are yielded.
+        """
+        params = {
+            "filename": filename,
+            "type": folder_type
+        }
+        if subfolder:
+            params["subfolder"] = subfolder
+
+        try:
+            async with self.client.stream("GET", _EP_VIEW, params=params) as response:
+                if response.is_error:
+                    # Error bodies are small; read it so the payload is kept.
+                    await response.aread()
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes(chunk_size):
+                    yield chunk
+        except httpx.HTTPError as e:
+            error = _upstream_error(e)
+            logger.error("Failed to stream image data: %s", error)
+            raise error from e
+
     async def get_image_data(self, filename: str, subfolder: str = "", folder_type: str = "output") -> bytes:
         """Get image data from ComfyUI"""
+        return b"".join(
+            [chunk async for chunk in self.stream_image(filename, subfolder, folder_type)]
+        )
+
+    async def get_images_data(
+        self, specs: List[Tuple[str, str, str]], concurrency: int = 8
+    ) -> List[bytes]:
+        """Download several images concurrently.
+
+        ``specs`` holds ``(filename, subfolder, folder_type)`` tuples, e.g.
+        the ``images`` entries of a SaveImage node's outputs. Results come
+        back in the same order; at most ``concurrency`` downloads run at
+        once. The first failure raises ``ComfyUIError`` and cancels the
+        remaining downloads.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(spec: Tuple[str, str, str]) -> bytes:
+            async with semaphore:
+                return await self.get_image_data(*spec)
+
+        tasks = [asyncio.ensure_future(fetch(spec)) for spec in specs]
         try:
-            params = {
-                "filename": filename,
-                "type": folder_type
-            }
-            if subfolder:
-                params["subfolder"] = subfolder
-            
-            response = await self.client.get(f"{self.base_url}/view", params=params)
-            response.raise_for_status()
-            return response.content
-            
-        except Exception as e:
-            logger.error(f"Failed to get image data: {str(e)}")
-            raise
\ No newline at end of file
+            return await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -1,18 +1,28 @@
-from fastapi import FastAPI, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, FastAPI, HTTPException, Query, Request, Response, status, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field
-from storage3 import SyncStorageClient as StorageClient
-from typing import Optional, cast, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from contextlib import asynccontextmanager
+from functools import lru_cache
+from urllib.parse import quote
 import os
-import asyncio
+import logging
+import socket
 import httpx
 import asyncpg
+import orjson
 import yaml
 
 from n8n_client import N8nClient
-from research_service import ResearchService
-from comfyui_client import ComfyUIClient
+from research_service import (
+    ResearchBusyError,
+    ResearchService,
+    TERMINAL_STATUSES,
+    decode_session_cursor,
+    encode_session_cursor,
+)
+from comfyui_client import ComfyUIClient, ComfyUIError
 from uuid import UUID as _UUID
 from memory_service import MemoryService
 from memory_models import (
@@ -23,6 +33,42 @@ from memory_models import (
     MemoryListResponse, MemoryHealthResponse,
 )
 from ray_routes import router as ray_router
+from settings import get_settings
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    Returned directly by routes whose payload is already plain JSON data
+    (ComfyUI /object_info, /history and /queue passthroughs, health
+    probes, the manifest listing, research logs), which skips FastAPI's
+    jsonable_encoder walk as well as the stdlib encoder. Not the app-wide
+    default: routes with a response_model already serialize through
+    pydantic-core, and a custom default class would turn that
+    off. (fastapi.responses.ORJSONResponse is deprecated for that reason.)
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+logger = logging.getLogger(__name__)
+
+# What the HTTP upstreams (n8n, ...) and the research DB raise when they
+# fail. One app-level handler (_upstream_error_handler) maps these, so
+# routes don't wrap their calls; anything else is a bug and falls through
+# to FastAPI's 500 handler, which logs the traceback. Only the network
+# flavours of OSError are listed: a local FileNotFoundError/PermissionError
+# from a ray or plugin route is a bug, not an unavailable upstream.
+# (TimeoutError also covers asyncio's, e.g. a pool acquire timing out.)
+_UPSTREAM_ERRORS = (
+    httpx.HTTPError,
+    asyncpg.PostgresError,
+    asyncpg.InterfaceError,
+    ConnectionError,
+    TimeoutError,
+    socket.gaierror,
+)
 
 
 def _validate_uuid_param(value: str, name: str = "parameter"):
@@ -35,24 +81,34 @@ def _validate_uuid_param(value: str, name: str = "parameter"):
             detail=f"Invalid {name}: must be a valid UUID",
         )
 
+# Environment is read and validated once (see settings.py); a missing
+# KONG_URL or SUPABASE_SERVICE_KEY fails the import with a ValueError.
+settings = get_settings()
+
 # Get project name from environment
-PROJECT_NAME = os.getenv("PROJECT_NAME", "atlas")
+PROJECT_NAME = settings.project_name
 
 # Maximum body size for /storage/upload, in bytes. Default 100 MiB matches
 # Supabase Storage's default object cap; operators can override via env.
 # Without this guard `file.read()` will buffer arbitrarily large uploads
 # into memory and OOM the worker.
-MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(100 * 1024 * 1024)))
+MAX_UPLOAD_BYTES = settings.max_upload_bytes
+
+# Read size when streaming an upload on to Supabase Storage.
+UPLOAD_CHUNK_BYTES = 1024 * 1024  # 1 MiB
 
 
 @asynccontextmanager
 async def _lifespan(app: FastAPI):
     yield
-    # Graceful shutdown: close the process-lifetime n8n client so httpx
-    # doesn't warn about an unclosed client and its keep-alive sockets
-    # close deterministically. (n8n_client is the only long-lived HTTP
-    # client; ComfyUIClient and the memory/research clients are per-call.)
+    # Graceful shutdown: stop the process-lifetime clients, then close the
+    # connection pool they share so its keep-alive sockets close
+    # deterministically.
+    await comfyui_client.aclose()
     await n8n_client.aclose()
+    await research_service.aclose()
+    await memory_service.aclose()
+    await http_transport.aclose()
 
 
 app = FastAPI(
@@ -76,43 +132,67 @@ Instrumentator(
     should_group_status_codes=True,
 ).instrument(app).expose(app, endpoint="/metrics")
 
+async def _upstream_error_handler(request: Request, exc: Exception) -> ORJSONResponse:
+    """Log an upstream failure and map it to a status without echoing
+    internals to the client: unreachable (connect/timeout) -> 503, error
+    reply from an HTTP upstream -> 502, anything else -> 500."""
+    logger.error("%s %s failed: %s", request.method, request.url.path, exc)
+    if isinstance(exc, (
+        ConnectionError, TimeoutError, socket.gaierror,
+        httpx.TransportError, asyncpg.InterfaceError,
+    )):
+        code, detail = status.HTTP_503_SERVICE_UNAVAILABLE, "Upstream service unavailable"
+    elif isinstance(exc, httpx.HTTPStatusError):
+        code, detail = status.HTTP_502_BAD_GATEWAY, "Upstream service returned an error"
+    else:
+        code, detail = status.HTTP_500_INTERNAL_SERVER_ERROR, "Upstream request failed"
+    return ORJSONResponse({"detail": detail}, status_code=code)
+
+
+for _exc_type in _UPSTREAM_ERRORS:
+    app.add_exception_handler(_exc_type, _upstream_error_handler)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify exact origins
+    # CORS_ORIGINS narrows this to specific origins (see settings.py).
+    allow_origins=list(settings.cors_origins),
     # NOTE: `allow_credentials=True` with the `*` wildcard origin is rejected by
     # all browsers (the spec forbids credentials + wildcard), so it would only
     # silently break credentialed requests. The backend is reached server-side
     # via Kong and does not rely on browser cookies, so credentials stay off
     # until specific origins are configured.
     allow_credentials=False,
-    allow_methods=["*"],
+    # The methods the routes use plus HEAD and PATCH, rather than "*".
+    allow_methods=["GET", "HEAD", "POST", "PUT", "PATCH", "DELETE"],
     allow_headers=["*"],
+    # Let browsers reuse a preflight for a day instead of Starlette's 10
+    # minutes, so most cross-origin calls skip the extra OPTIONS round-trip.
+    max_age=86400,
 )
 
 # Get environment variables
-KONG_URL = os.getenv("KONG_URL")
-SERVICE_KEY = os.getenv("SUPABASE_SERVICE_KEY")
-
-if not KONG_URL:
-    raise ValueError("KONG_URL environment variable is required")
-if not SERVICE_KEY:
-    raise ValueError("SUPABASE_SERVICE_KEY environment variable is required")
+KONG_URL = settings.kong_url
+SERVICE_KEY = settings.service_key
 
 # Construct Supabase Storage URL via Kong
 # The standard path for storage via the gateway is /storage/v1.
-# storage3 requires a trailing slash and warns + auto-corrects if it's
-# missing — we set it explicitly to avoid the UserWarning at boot.
-storage_url = f"{KONG_URL}/storage/v1/"
-
-# Initialize Supabase Storage client
-storage_client = StorageClient(
-    url=storage_url,
-    headers={
-        "Authorization": f"Bearer {SERVICE_KEY}",
-        "apikey": SERVICE_KEY,  # Supabase storage requires the service key as apikey header
-    },
-)
+storage_url = settings.storage_url
+
+storage_headers = {
+    "Authorization": f"Bearer {SERVICE_KEY}",
+    "apikey": SERVICE_KEY,  # Supabase storage requires the service key as apikey header
+}
+
+
+@lru_cache(maxsize=1024)
+def _public_url(bucket: str, path: str) -> str:
+    """Public object URL in Supabase Storage's object/public layout.
+
+    It is a pure function of (bucket, path), so repeat uploads to the
+    same path reuse the formatted string.
+    """
+    return f"{storage_url}object/public/{quote(bucket)}/{quote(path)}"
 
 
 app.include_router(ray_router)
@@ -133,32 +213,62 @@ class StorageResponse(BaseModel):
     url: str
 
 
+# /health is polled every few seconds by orchestrators and / is constant
+# too, so both bodies are encoded once at import. A fresh Response wraps
+# the bytes per request; response_model still documents /health's schema.
+_HEALTH_BODY = HealthResponse(status="healthy", version="0.1.0").model_dump_json().encode()
+_ROOT_BODY = orjson.dumps({
+    "message": f"Welcome to the {PROJECT_NAME} Backend API",
+    "docs_url": "/docs",
+})
+
+
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint for the API"""
-    return HealthResponse(
-        status="healthy",
-        version="0.1.0",
-    )
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/")
 async def root():
     """Root endpoint that returns a welcome message"""
-    return {
-        "message": f"Welcome to the {PROJECT_NAME} Backend API",
-        "docs_url": "/docs",
-    }
-
+    return Response(content=_ROOT_BODY, media_type="application/json")
+
+
+# One connection pool for every long-lived upstream client. Each client
+# keeps its own base URL, headers and timeouts, but sockets, limits and
+# keep-alive are shared and configured here. retries= only re-attempts
+# failed TCP connects, so it is safe for non-idempotent requests too.
+http_transport = httpx.AsyncHTTPTransport(
+    limits=httpx.Limits(
+        max_connections=100,
+        max_keepalive_connections=50,
+        keepalive_expiry=30.0,
+    ),
+    retries=3,
+)
 
 # Initialize n8n client
-n8n_client = N8nClient()
+n8n_client = N8nClient(transport=http_transport)
+
+# Initialize ComfyUI client (also keeps its model cache and completion
+# websocket alive across requests)
+comfyui_client = ComfyUIClient(transport=http_transport)
+
+# Async client for the Supabase Storage REST API, used to stream uploads.
+# write= bounds each chunk send, not the whole upload.
+storage_http = httpx.AsyncClient(
+    base_url=storage_url,
+    headers=storage_headers,
+    timeout=httpx.Timeout(connect=5.0, read=60.0, write=30.0, pool=5.0),
+    transport=http_transport,
+)
 
 # Initialize research service
-research_service = ResearchService()
+research_service = ResearchService(transport=http_transport)
 
 # Initialize LangMem memory service
-memory_service = MemoryService()
+memory_service = MemoryService(transport=http_transport)
 
 
 
@@ -179,100 +289,114 @@ class WorkflowResponse(BaseModel):
     updated_at: Optional[str] = Field(default=None, validation_alias="updatedAt")
 
 
+workflows_router = APIRouter(prefix="/workflows", tags=["workflows"])
+
 
-@app.get("/workflows", response_model=List[WorkflowResponse])
+@workflows_router.get("", response_model=List[WorkflowResponse])
 async def list_workflows():
     """List all n8n workflows"""
-    try:
-        workflows = await n8n_client.list_workflows()
-        return workflows
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list workflows: {str(e)}",
-        )
+    return await n8n_client.list_workflows()
 
 
-@app.get("/workflows/{workflow_id}", response_model=WorkflowResponse)
+@workflows_router.get("/{workflow_id}", response_model=WorkflowResponse)
 async def get_workflow(workflow_id: str):
     """Get a specific n8n workflow by ID"""
     try:
-        workflow = await n8n_client.get_workflow(workflow_id)
-        return workflow
+        return await n8n_client.get_workflow(workflow_id)
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Workflow with ID {workflow_id} not found",
             )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get workflow: {str(e)}",
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get workflow: {str(e)}",
-        )
+        raise
 
 
+@workflows_router.delete("/cache")
+async def invalidate_workflow_cache():
+    """Drop cached n8n workflow definitions so edits show up immediately"""
+    n8n_client.invalidate_workflow_cache()
+    return ORJSONResponse({"success": True})
 
-@app.post("/storage/upload", response_model=StorageResponse)
+
+
+storage_router = APIRouter(prefix="/storage", tags=["storage"])
+
+
+@storage_router.post("/upload", response_model=StorageResponse)
 async def upload_file(file: UploadFile = File(...), bucket: str = "default"):
     """Upload a file to Supabase Storage"""
     try:
-        # Ensure filename exists and cast to str to satisfy type checker
-        if not file.filename:
+        # Checking the local narrows it to str for the type checker.
+        filename = file.filename
+        if not filename:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="File must have a filename",
             )
-        filename = cast(str, file.filename)
-
-        # Read file content in bounded chunks so an oversized upload fails
-        # cleanly with 413 instead of OOMing the worker. UploadFile's
-        # SpooledTemporaryFile is iterated, not materialized whole.
-        chunks: List[bytes] = []
-        total = 0
-        chunk_size = 1024 * 1024  # 1 MiB
-        while True:
-            chunk = await file.read(chunk_size)
-            if not chunk:
-                break
-            total += len(chunk)
-            if total > MAX_UPLOAD_BYTES:
-                raise HTTPException(
-                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                    detail=f"File exceeds maximum upload size of {MAX_UPLOAD_BYTES} bytes",
-                )
-            chunks.append(chunk)
-        content = b"".join(chunks)
-
-        # Upload to storage. storage3 exposes upload/get_public_url on
-        # the per-bucket proxy (from_), not on the client itself — the
-        # old client-level calls raised AttributeError on every request.
-        bucket_ref = storage_client.from_(bucket)
-        # storage3's SyncStorageClient does blocking network I/O; run it off
-        # the event loop so a slow/large upload doesn't stall the worker and
-        # every other in-flight request with it.
-        await asyncio.to_thread(
-            bucket_ref.upload,
-            path=filename,
-            file=content,
-            file_options={"content-type": file.content_type}
-            if file.content_type
-            else None,
+
+        # Multipart parsing has already spooled the body and recorded its
+        # size, so an oversized upload is rejected before any of it is
+        # copied into worker memory.
+        if file.size is not None and file.size > MAX_UPLOAD_BYTES:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"File exceeds maximum upload size of {MAX_UPLOAD_BYTES} bytes",
+            )
+
+        async def file_chunks():
+            # Stream the spooled upload in bounded chunks so at most one
+            # chunk is held in worker memory; the running total still
+            # enforces the cap when the size wasn't known up front.
+            total = 0
+            while chunk := await file.read(UPLOAD_CHUNK_BYTES):
+                total += len(chunk)
+                if total > MAX_UPLOAD_BYTES:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"File exceeds maximum upload size of {MAX_UPLOAD_BYTES} bytes",
+                    )
+                yield chunk
+
+        # Upload to storage: the object is POSTed to the Storage REST API
+        # directly with the body streamed from the upload (storage3's
+        # uploader only took the whole body as bytes).
+        headers = {
+            "content-type": file.content_type or "text/plain;charset=UTF-8",
+            "cache-control": "max-age=3600",
+            "x-upsert": "false",
+        }
+        if file.size is not None:
+            headers["content-length"] = str(file.size)
+        response = await storage_http.post(
+            f"object/{quote(bucket)}/{quote(filename)}",
+            content=file_chunks(),
+            headers=headers,
         )
+        if response.is_error:
+            # Surface Storage's own message (e.g. "The resource already
+            # exists" on a duplicate path), as storage3 did, rather than
+            # httpx's generic status line.
+            try:
+                message = orjson.loads(response.content).get("message")
+            except (ValueError, AttributeError):
+                message = None
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=message or response.text or f"Storage upload failed ({response.status_code})",
+            )
 
         # Get public URL
-        url = await asyncio.to_thread(bucket_ref.get_public_url, filename)
+        url = _public_url(bucket, filename)
 
         return StorageResponse(bucket=bucket, path=filename, url=url)
     except HTTPException:
         raise
-    except Exception as e:
+    except Exception:
+        logger.exception("Failed to upload file")
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to upload file",
         )
 
 
@@ -280,7 +404,7 @@ async def upload_file(file: UploadFile = File(...), bucket: str = "default"):
 class ResearchStartRequest(BaseModel):
     """Request model for starting research"""
     query: str
-    max_loops: Optional[int] = 3
+    max_loops: Optional[int] = Field(default=3, ge=1)
     search_api: Optional[str] = "duckduckgo"
     user_id: Optional[str] = None
 
@@ -330,7 +454,10 @@ class ResearchLogResponse(BaseModel):
 
 
 # Research API Endpoints
-@app.post("/research/start", response_model=ResearchResponse)
+research_router = APIRouter(prefix="/research", tags=["research"])
+
+
+@research_router.post("/start", response_model=ResearchResponse)
 async def start_research(request: ResearchStartRequest):
     """Start a new research session"""
     # Validate user_id like every other user-id-bearing route (the other
@@ -347,133 +474,174 @@ async def start_research(request: ResearchStartRequest):
             user_id=request.user_id
         )
         return ResearchResponse(**result)
-    except Exception as e:
+    except ResearchBusyError as e:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to start research: {str(e)}"
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "5"},
         )
 
 
-@app.get("/research/{session_id}/status", response_model=ResearchSessionResponse)
-async def get_research_status(session_id: str):
+# Cache-Control for research polling: finished sessions never change, so
+# browsers and proxies may reuse them; running ones only briefly.
+_RESEARCH_FINAL_CACHE = "private, max-age=86400, immutable"
+_RESEARCH_RUNNING_CACHE = "private, max-age=2"
+
+
+@research_router.get("/{session_id}/status", response_model=ResearchSessionResponse)
+async def get_research_status(session_id: str, response: Response):
     """Get the status of a research session"""
     _validate_uuid_param(session_id, "session_id")
-    try:
-        result = await research_service.get_research_status(session_id)
-        if not result:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Research session {session_id} not found"
-            )
-        return ResearchSessionResponse(**result)
-    except HTTPException:
-        raise
-    except Exception as e:
+    result = await research_service.get_research_status(session_id)
+    if not result:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get research status: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Research session {session_id} not found"
         )
+    response.headers["Cache-Control"] = (
+        _RESEARCH_FINAL_CACHE
+        if result["status"] in TERMINAL_STATUSES
+        else _RESEARCH_RUNNING_CACHE
+    )
+    return ResearchSessionResponse(**result)
 
 
-@app.get("/research/{session_id}/result", response_model=ResearchResultResponse)
-async def get_research_result(session_id: str):
+@research_router.get("/{session_id}/result", response_model=ResearchResultResponse)
+async def get_research_result(session_id: str, response: Response):
     """Get the result of a completed research session"""
     _validate_uuid_param(session_id, "session_id")
-    try:
-        result = await research_service.get_research_result(session_id)
-        if not result:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Research result for session {session_id} not found"
-            )
-        return ResearchResultResponse(**result)
-    except HTTPException:
-        raise
-    except Exception as e:
+    result = await research_service.get_research_result(session_id)
+    if not result:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get research result: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Research result for session {session_id} not found"
         )
+    response.headers["Cache-Control"] = _RESEARCH_FINAL_CACHE
+    return ResearchResultResponse(**result)
 
 
-@app.post("/research/{session_id}/cancel", response_model=ResearchResponse)
+@research_router.post("/{session_id}/cancel", response_model=ResearchResponse)
 async def cancel_research(session_id: str):
     """Cancel a running research session"""
     _validate_uuid_param(session_id, "session_id")
-    try:
-        success = await research_service.cancel_research(session_id)
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Cannot cancel research session {session_id} - session not found or not running"
-            )
-        return ResearchResponse(
-            session_id=session_id,
-            status="cancelled",
-            message="Research session cancelled successfully"
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
+    success = await research_service.cancel_research(session_id)
+    if not success:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to cancel research: {str(e)}"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Cannot cancel research session {session_id} - session not found or not running"
         )
+    return ResearchResponse(
+        session_id=session_id,
+        status="cancelled",
+        message="Research session cancelled successfully"
+    )
+
+
+_NDJSON = "application/x-ndjson"
+
 
+@research_router.get(
+    "/{session_id}/logs",
+    response_model=List[ResearchLogResponse],
+    responses={200: {"content": {_NDJSON: {}}}},
+)
+async def get_research_logs(session_id: str, request: Request):
+    """Get logs for a research session.
 
-@app.get("/research/{session_id}/logs", response_model=List[ResearchLogResponse])
-async def get_research_logs(session_id: str):
-    """Get logs for a research session"""
+    Send ``Accept: application/x-ndjson`` to receive one JSON object per
+    line, streamed from the database as it is read, instead of one list.
+    """
     _validate_uuid_param(session_id, "session_id")
+    if _NDJSON in request.headers.get("accept", ""):
+        return await _stream_research_logs(session_id)
+    logs = await research_service.get_research_logs(session_id)
+    # research_service already builds rows in ResearchLogResponse's
+    # shape, so a long log is encoded straight to JSON instead of being
+    # validated into models twice (here and by response_model).
+    return ORJSONResponse(logs)
+
+
+async def _stream_research_logs(session_id: str) -> StreamingResponse:
+    logs = research_service.iter_research_logs(session_id)
     try:
-        logs = await research_service.get_research_logs(session_id)
-        return [ResearchLogResponse(**log) for log in logs]
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get research logs: {str(e)}"
-        )
+        # Read the first row before answering so a DB failure still maps
+        # to an error status instead of a truncated 200.
+        first = await logs.__anext__()
+    except StopAsyncIteration:
+        first = None
+    except BaseException:
+        await logs.aclose()
+        raise
 
+    async def body():
+        # The DB connection stays open past this handler and is released
+        # once the last row is sent (or the client goes away).
+        try:
+            if first is not None:
+                yield orjson.dumps(first) + b"\n"
+            async for log in logs:
+                yield orjson.dumps(log) + b"\n"
+        finally:
+            await logs.aclose()
 
-@app.get("/research/sessions", response_model=List[ResearchSessionResponse])
+    return StreamingResponse(body(), media_type=_NDJSON)
+
+
+@research_router.get("/sessions", response_model=List[ResearchSessionResponse])
 async def list_research_sessions(
+    response: Response,
     user_id: Optional[str] = None,
-    limit: int = 50,
-    offset: int = 0
+    limit: int = Query(default=50, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = None,
 ):
-    """List research sessions"""
+    """List research sessions, newest first.
+
+    A full page carries an ``X-Next-Cursor`` header; pass it back as
+    ``cursor`` for the next page. ``offset`` still works but is
+    deprecated: deep offsets make the DB scan every skipped row.
+    """
     if user_id is not None:
         _validate_uuid_param(user_id, "user_id")
-    try:
-        sessions = await research_service.list_user_sessions(
-            user_id=user_id,
-            limit=min(limit, 100),  # Cap at 100
-            offset=max(offset, 0)   # Ensure non-negative
-        )
-        return [ResearchSessionResponse(**session) for session in sessions]
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list research sessions: {str(e)}"
-        )
+    if cursor is not None:
+        try:
+            decode_session_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
+    sessions = await research_service.list_user_sessions(
+        user_id=user_id,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+    )
+    if sessions and len(sessions) == limit:
+        next_cursor = encode_session_cursor(sessions[-1])
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+    # response_model validates and serializes the rows in one
+    # pydantic-core pass (and fills the omitted optional fields).
+    return sessions
 
 
-@app.get("/research/health")
+@research_router.get("/health")
 async def research_health_check():
     """Health check for research service"""
     try:
         health = await research_service.health_check()
-        return {
+        return ORJSONResponse({
             "service": "research",
             "status": "healthy" if health["database"] == "healthy" else "degraded",
             "details": health
-        }
+        })
     except Exception as e:
-        return {
+        return ORJSONResponse({
             "service": "research", 
             "status": "unhealthy",
             "error": str(e)
-        }
+        })
 
 
 # ComfyUI API Models
@@ -481,11 +649,13 @@ class ComfyUIGenerateRequest(BaseModel):
     """Request model for ComfyUI image generation"""
     prompt: str
     negative_prompt: Optional[str] = ""
-    width: int = 512
-    height: int = 512
-    steps: int = 20
-    cfg: float = 7.0
-    seed: Optional[int] = None
+    # Bounds mirror ComfyUI's EmptyLatentImage/KSampler inputs, so bad
+    # values are rejected here instead of failing inside the queue.
+    width: int = Field(default=512, ge=16, le=16384, multiple_of=8)
+    height: int = Field(default=512, ge=16, le=16384, multiple_of=8)
+    steps: int = Field(default=20, ge=1, le=10000)
+    cfg: float = Field(default=7.0, ge=0.0, le=100.0)
+    seed: Optional[int] = Field(default=None, ge=0, le=0xFFFFFFFFFFFFFFFF)
     checkpoint: Optional[str] = "v1-5-pruned-emaonly.safetensors"
     wait_for_completion: bool = True
 
@@ -507,232 +677,185 @@ class ComfyUIResponse(BaseModel):
 
 
 # ComfyUI API Endpoints
-@app.get("/comfyui/health")
+comfyui_router = APIRouter(prefix="/comfyui", tags=["comfyui"])
+
+
+@comfyui_router.get("/health")
 async def comfyui_health_check():
     """Health check for ComfyUI service"""
     try:
-        async with ComfyUIClient() as client:
-            health = await client.health_check()
-            return {
-                "service": "comfyui",
-                "status": health.get("status", "unknown"),
-                "details": health
-            }
+        health = await comfyui_client.health_check()
+        return ORJSONResponse({
+            "service": "comfyui",
+            "status": health.get("status", "unknown"),
+            "details": health
+        })
     except Exception as e:
-        return {
+        return ORJSONResponse({
             "service": "comfyui",
             "status": "unhealthy", 
             "error": str(e)
-        }
+        })
 
 
-@app.get("/comfyui/models")
+@comfyui_router.get("/models")
 async def get_comfyui_models():
     """Get available ComfyUI models"""
-    try:
-        async with ComfyUIClient() as client:
-            models = await client.get_models()
-            return {
-                "success": True,
-                "models": models
-            }
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get ComfyUI models: {str(e)}"
-        )
+    models = await comfyui_client.get_models()
+    return ORJSONResponse({
+        "success": True,
+        "models": models
+    })
 
 
-@app.post("/comfyui/generate", response_model=ComfyUIResponse)
+@comfyui_router.post("/generate", response_model=ComfyUIResponse)
 async def generate_image(request: ComfyUIGenerateRequest):
     """Generate an image using ComfyUI"""
-    try:
-        async with ComfyUIClient() as client:
-            # Generate the image
-            result = await client.generate_simple_image(
-                prompt=request.prompt,
-                negative_prompt=request.negative_prompt,
-                width=request.width,
-                height=request.height,
-                steps=request.steps,
-                cfg=request.cfg,
-                seed=request.seed,
-                checkpoint=request.checkpoint
+    # Generate the image
+    result = await comfyui_client.generate_simple_image(
+        prompt=request.prompt,
+        negative_prompt=request.negative_prompt,
+        width=request.width,
+        height=request.height,
+        steps=request.steps,
+        cfg=request.cfg,
+        seed=request.seed,
+        checkpoint=request.checkpoint
+    )
+    
+    if not result.get("success"):
+        return ComfyUIResponse(
+            success=False,
+            error=result.get("error", "Unknown error")
+        )
+    
+    prompt_id = result["prompt_id"]
+    
+    # If wait_for_completion is True, wait for the image to be generated
+    if request.wait_for_completion:
+        completion_result = await comfyui_client.wait_for_completion(prompt_id)
+        
+        if completion_result.get("success"):
+            return ComfyUIResponse(
+                success=True,
+                prompt_id=prompt_id,
+                client_id=result["client_id"],
+                message="Image generated successfully",
+                data={
+                    "outputs": completion_result["outputs"],
+                    "parameters": result["parameters"]
+                }
             )
-            
-            if not result.get("success"):
-                return ComfyUIResponse(
-                    success=False,
-                    error=result.get("error", "Unknown error")
-                )
-            
-            prompt_id = result["prompt_id"]
-            
-            # If wait_for_completion is True, wait for the image to be generated
-            if request.wait_for_completion:
-                completion_result = await client.wait_for_completion(prompt_id)
-                
-                if completion_result.get("success"):
-                    return ComfyUIResponse(
-                        success=True,
-                        prompt_id=prompt_id,
-                        client_id=result["client_id"],
-                        message="Image generated successfully",
-                        data={
-                            "outputs": completion_result["outputs"],
-                            "parameters": result["parameters"]
-                        }
-                    )
-                else:
-                    return ComfyUIResponse(
-                        success=False,
-                        prompt_id=prompt_id,
-                        error=completion_result.get("error", "Generation failed")
-                    )
-            else:
-                # Return immediately with prompt ID
-                return ComfyUIResponse(
-                    success=True,
-                    prompt_id=prompt_id,
-                    client_id=result["client_id"],
-                    message="Image generation queued",
-                    data={"parameters": result["parameters"]}
-                )
-                
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to generate image: {str(e)}"
+        else:
+            return ComfyUIResponse(
+                success=False,
+                prompt_id=prompt_id,
+                error=completion_result.get("error", "Generation failed")
+            )
+    else:
+        # Return immediately with prompt ID
+        return ComfyUIResponse(
+            success=True,
+            prompt_id=prompt_id,
+            client_id=result["client_id"],
+            message="Image generation queued",
+            data={"parameters": result["parameters"]}
         )
 
 
-@app.post("/comfyui/workflow", response_model=ComfyUIResponse)
+@comfyui_router.post("/workflow", response_model=ComfyUIResponse)
 async def execute_comfyui_workflow(request: ComfyUIWorkflowRequest):
     """Execute a custom ComfyUI workflow"""
-    try:
-        async with ComfyUIClient() as client:
-            # Queue the workflow
-            result = await client.queue_prompt(request.workflow)
-            
-            if not result.get("success"):
-                return ComfyUIResponse(
-                    success=False,
-                    error=result.get("error", "Unknown error")
-                )
-            
-            prompt_id = result["prompt_id"]
-            
-            # If wait_for_completion is True, wait for the workflow to complete
-            if request.wait_for_completion:
-                completion_result = await client.wait_for_completion(prompt_id)
-                
-                if completion_result.get("success"):
-                    return ComfyUIResponse(
-                        success=True,
-                        prompt_id=prompt_id,
-                        client_id=result["client_id"],
-                        message="Workflow executed successfully",
-                        data={"outputs": completion_result["outputs"]}
-                    )
-                else:
-                    return ComfyUIResponse(
-                        success=False,
-                        prompt_id=prompt_id,
-                        error=completion_result.get("error", "Workflow execution failed")
-                    )
-            else:
-                # Return immediately with prompt ID
-                return ComfyUIResponse(
-                    success=True,
-                    prompt_id=prompt_id,
-                    client_id=result["client_id"],
-                    message="Workflow queued"
-                )
-                
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to execute workflow: {str(e)}"
+    # Queue the workflow
+    result = await comfyui_client.queue_prompt(request.workflow)
+    
+    if not result.get("success"):
+        return ComfyUIResponse(
+            success=False,
+            error=result.get("error", "Unknown error")
+        )
+    
+    prompt_id = result["prompt_id"]
+    
+    # If wait_for_completion is True, wait for the workflow to complete
+    if request.wait_for_completion:
+        completion_result = await comfyui_client.wait_for_completion(prompt_id)
+        
+        if completion_result.get("success"):
+            return ComfyUIResponse(
+                success=True,
+                prompt_id=prompt_id,
+                client_id=result["client_id"],
+                message="Workflow executed successfully",
+                data={"outputs": completion_result["outputs"]}
+            )
+        else:
+            return ComfyUIResponse(
+                success=False,
+                prompt_id=prompt_id,
+                error=completion_result.get("error", "Workflow execution failed")
+            )
+    else:
+        # Return immediately with prompt ID
+        return ComfyUIResponse(
+            success=True,
+            prompt_id=prompt_id,
+            client_id=result["client_id"],
+            message="Workflow queued"
         )
 
 
-@app.get("/comfyui/history/{prompt_id}")
+@comfyui_router.get("/history/{prompt_id}")
 async def get_generation_history(prompt_id: str):
     """Get ComfyUI generation history for a specific prompt"""
-    try:
-        async with ComfyUIClient() as client:
-            history = await client.get_history(prompt_id)
-            return {
-                "success": True,
-                "history": history
-            }
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get history: {str(e)}"
-        )
+    history = await comfyui_client.get_history(prompt_id)
+    return ORJSONResponse({
+        "success": True,
+        "history": history
+    })
 
 
-@app.get("/comfyui/queue")
+@comfyui_router.get("/queue")
 async def get_queue_status():
     """Get ComfyUI queue status"""
-    try:
-        async with ComfyUIClient() as client:
-            queue = await client.get_queue_status()
-            return {
-                "success": True,
-                "queue": queue
-            }
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get queue status: {str(e)}"
-        )
+    queue = await comfyui_client.get_queue_status()
+    return ORJSONResponse({
+        "success": True,
+        "queue": queue
+    })
 
 
-@app.post("/comfyui/cancel/{prompt_id}")
+@comfyui_router.post("/cancel/{prompt_id}")
 async def cancel_generation(prompt_id: str):
     """Cancel a ComfyUI generation"""
-    try:
-        async with ComfyUIClient() as client:
-            success = await client.cancel_prompt(prompt_id)
-            return {
-                "success": success,
-                "message": "Generation cancelled" if success else "Failed to cancel generation"
-            }
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to cancel generation: {str(e)}"
-        )
+    success = await comfyui_client.cancel_prompt(prompt_id)
+    return ORJSONResponse({
+        "success": success,
+        "message": "Generation cancelled" if success else "Failed to cancel generation"
+    })
+
 
+# Content type by file extension; ComfyUI's default output is PNG.
+_IMAGE_MEDIA_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+}
 
-@app.get("/comfyui/image/{filename}")
+
+@comfyui_router.get("/image/{filename}")
 async def get_generated_image(filename: str, subfolder: str = "", folder_type: str = "output"):
     """Get a generated image from ComfyUI"""
+    chunks = comfyui_client.stream_image(filename, subfolder, folder_type)
     try:
-        async with ComfyUIClient() as client:
-            image_data = await client.get_image_data(filename, subfolder, folder_type)
-            
-            # Determine content type based on file extension
-            content_type = "image/png"
-            if filename.lower().endswith(('.jpg', '.jpeg')):
-                content_type = "image/jpeg"
-            elif filename.lower().endswith('.webp'):
-                content_type = "image/webp"
-            
-            from fastapi.responses import Response
-            # Sanitize the filename before placing it in a header: strip CR/LF
-            # (which crash the HTTP/1.1 codec with a 500) and quote per RFC 6266
-            # so a name containing ';' or '"' can't break the header structure.
-            safe_name = filename.replace("\r", "").replace("\n", "").replace('"', "")
-            return Response(
-                content=image_data,
-                media_type=content_type,
-                headers={"Content-Disposition": f'inline; filename="{safe_name}"'}
-            )
-    except httpx.HTTPStatusError as e:
-        if e.response.status_code == 404:
+        # Pull the first chunk before answering so a ComfyUI 404/5xx still
+        # maps to a proper error status instead of a truncated 200.
+        first_chunk = await chunks.__anext__()
+    except StopAsyncIteration:
+        first_chunk = b""
+    except ComfyUIError as e:
+        await chunks.aclose()
+        if e.status_code == 404:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Image {filename} not found",
@@ -741,15 +864,68 @@ async def get_generated_image(filename: str, subfolder: str = "", folder_type: s
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get image: {str(e)}"
         )
-    except Exception as e:
+    except Exception:
+        await chunks.aclose()
+        logger.exception("Failed to get image")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get image: {str(e)}"
+            detail="Failed to get image",
         )
 
+    async def body():
+        # The upstream response stays open past this handler: it is
+        # released once the last chunk is sent (or the download is
+        # abandoned).
+        try:
+            if first_chunk:
+                yield first_chunk
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
+
+    content_type = _IMAGE_MEDIA_TYPES.get(
+        os.path.splitext(filename)[1].lower(), "image/png"
+    )
+
+    # Sanitize the filename before placing it in a header: strip CR/LF
+    # (which crash the HTTP/1.1 codec with a 500) and quote per RFC 6266
+    # so a name containing ';' or '"' can't break the header structure.
+    safe_name = filename.replace("\r", "").replace("\n", "").replace('"', "")
+    return StreamingResponse(
+        body(),
+        media_type=content_type,
+        headers={"Content-Disposition": f'inline; filename="{safe_name}"'}
+    )
+
+
+# Last parsed manifest as (path, st_mtime_ns, st_size, models). The file
+# only changes when the bootstrapper rewrites it at stack start, so a stat()
+# per request replaces a full YAML parse.
+_manifest_cache: Optional[Tuple[str, int, int, List[Dict[str, Any]]]] = None
+
+
+def _load_comfyui_manifest(path: str) -> List[Dict[str, Any]]:
+    """Return the manifest's model list, re-parsing only when the file changed.
+
+    Raises:
+        FileNotFoundError: if the manifest does not exist.
+        yaml.YAMLError: if it cannot be parsed (never cached).
+    """
+    global _manifest_cache
+    st = os.stat(path)
+    cached = _manifest_cache
+    if cached is not None and cached[:3] == (path, st.st_mtime_ns, st.st_size):
+        return cached[3]
+    with open(path, "r", encoding="utf-8") as fh:
+        manifest = yaml.safe_load(fh) or {}
+    models: List[Dict[str, Any]] = manifest.get("models", [])
+    _manifest_cache = (path, st.st_mtime_ns, st.st_size, models)
+    return models
+
 
 # ComfyUI Model Management Endpoints
-@app.get("/comfyui/db/models")
+@comfyui_router.get("/db/models")
 async def get_comfyui_db_models(active_only: bool = True, essential_only: bool = False):
     """Get ComfyUI models from the manifest file written by the bootstrapper at startup.
 
@@ -768,14 +944,11 @@ async def get_comfyui_db_models(active_only: bool = True, essential_only: bool =
     )
     try:
         try:
-            with open(manifest_path, "r", encoding="utf-8") as fh:
-                manifest = yaml.safe_load(fh) or {}
+            models = _load_comfyui_manifest(manifest_path)
         except (FileNotFoundError, yaml.YAMLError):
             # Missing OR corrupt/partial manifest — graceful empty list, not 500
             # (consumers — the Open WebUI tool, n8n — don't handle a 500 well).
-            return {"success": True, "models": []}
-
-        models: List[Dict[str, Any]] = manifest.get("models", [])
+            return ORJSONResponse({"success": True, "models": []})
 
         # The manifest contains only active models (bootstrapper writes them
         # all as active=true).  Honor the query params for forward-compat.
@@ -789,12 +962,13 @@ async def get_comfyui_db_models(active_only: bool = True, essential_only: bool =
         if active_only:
             models = [m for m in models if m.get("active", True)]
 
-        return {"success": True, "models": models}
+        return ORJSONResponse({"success": True, "models": models})
 
-    except Exception as e:
+    except Exception:
+        logger.exception("Failed to read ComfyUI manifest")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to read ComfyUI manifest: {str(e)}",
+            detail="Failed to read ComfyUI manifest",
         )
 
 
@@ -802,7 +976,10 @@ async def get_comfyui_db_models(active_only: bool = True, essential_only: bool =
 # LangMem Memory API Endpoints
 # =============================================================================
 
-@app.post("/memory/extract", response_model=MemoryExtractResponse)
+memory_router = APIRouter(prefix="/memory", tags=["memory"])
+
+
+@memory_router.post("/extract", response_model=MemoryExtractResponse)
 async def memory_extract(request: MemoryExtractRequest):
     """Extract and store memory facts from conversation messages."""
     try:
@@ -817,14 +994,15 @@ async def memory_extract(request: MemoryExtractRequest):
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)
         )
-    except Exception as e:
+    except Exception:
+        logger.exception("Failed to extract memories")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to extract memories: {str(e)}",
+            detail="Failed to extract memories",
         )
 
 
-@app.post("/memory/recall", response_model=MemoryRecallResponse)
+@memory_router.post("/recall", response_model=MemoryRecallResponse)
 async def memory_recall(request: MemoryRecallRequest):
     """Recall relevant memories for a query using semantic search."""
     try:
@@ -840,14 +1018,15 @@ async def memory_recall(request: MemoryRecallRequest):
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)
         )
-    except Exception as e:
+    except Exception:
+        logger.exception("Failed to recall memories")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to recall memories: {str(e)}",
+            detail="Failed to recall memories",
         )
 
 
-@app.post("/memory/consolidate", response_model=MemoryConsolidateResponse)
+@memory_router.post("/consolidate", response_model=MemoryConsolidateResponse)
 async def memory_consolidate(request: MemoryConsolidateRequest):
     """Consolidate and deduplicate user memories."""
     try:
@@ -857,14 +1036,15 @@ async def memory_consolidate(request: MemoryConsolidateRequest):
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)
         )
-    except Exception as e:
+    except Exception:
+        logger.exception("Failed to consolidate memories")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to consolidate memories: {str(e)}",
+            detail="Failed to consolidate memories",
         )
 
 
-@app.post("/memory/summarize", response_model=MemorySummarizeResponse)
+@memory_router.post("/summarize", response_model=MemorySummarizeResponse)
 async def memory_summarize(request: MemorySummarizeRequest):
     """Generate a natural-language summary of a user's memory profile."""
     try:
@@ -876,14 +1056,15 @@ async def memory_summarize(request: MemorySummarizeRequest):
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)
         )
-    except Exception as e:
+    except Exception:
+        logger.exception("Failed to summarize memories")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to summarize memories: {str(e)}",
+            detail="Failed to summarize memories",
         )
 
 
-@app.get("/memory/user/{user_id}", response_model=MemoryListResponse)
+@memory_router.get("/user/{user_id}", response_model=MemoryListResponse)
 async def memory_list(
     user_id: str,
     namespace: str = "default",
@@ -904,14 +1085,15 @@ async def memory_list(
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)
         )
-    except Exception as e:
+    except Exception:
+        logger.exception("Failed to list memories")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list memories: {str(e)}",
+            detail="Failed to list memories",
         )
 
 
-@app.put("/memory/{memory_id}", response_model=Dict[str, Any])
+@memory_router.put("/{memory_id}", response_model=Dict[str, Any])
 async def memory_update(memory_id: str, request: MemoryUpdateRequest):
     """Update a specific memory fact."""
     _validate_uuid_param(memory_id, "memory_id")
@@ -930,14 +1112,15 @@ async def memory_update(memory_id: str, request: MemoryUpdateRequest):
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)
         )
-    except Exception as e:
+    except Exception:
+        logger.exception("Failed to update memory")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update memory: {str(e)}",
+            detail="Failed to update memory",
         )
 
 
-@app.delete("/memory/{memory_id}", response_model=Dict[str, Any])
+@memory_router.delete("/{memory_id}", response_model=Dict[str, Any])
 async def memory_delete(memory_id: str):
     """Delete (deactivate) a specific memory fact."""
     _validate_uuid_param(memory_id, "memory_id")
@@ -955,15 +1138,24 @@ async def memory_delete(memory_id: str):
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)
         )
-    except Exception as e:
+    except Exception:
+        logger.exception("Failed to delete memory")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete memory: {str(e)}",
+            detail="Failed to delete memory",
         )
 
 
-@app.get("/memory/health", response_model=MemoryHealthResponse)
+@memory_router.get("/health", response_model=MemoryHealthResponse)
 async def memory_health_check():
     """Health check for the LangMem memory service."""
     result = await memory_service.health_check()
     return MemoryHealthResponse(**result)
+
+
+# Included last: include_router copies the routes registered so far.
+app.include_router(workflows_router)
+app.include_router(storage_router)
+app.include_router(research_router)
+app.include_router(comfyui_router)
+app.include_router(memory_router)
@@ -24,7 +24,7 @@ logger = logging.getLogger("memory_service")
 class MemoryService:
     """LangMem-inspired persistent memory service."""
 
-    def __init__(self):
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
         self.enabled = os.getenv("LANGMEM_ENABLED", "true").lower() == "true"
         self.database_url = os.getenv("DATABASE_URL", "")
         self.litellm_url = os.getenv("LITELLM_BASE_URL", "http://litellm:4000")
@@ -35,10 +35,20 @@ class MemoryService:
         self.extraction_model = os.getenv("LANGMEM_EXTRACTION_MODEL", "")
         self.embedding_model = os.getenv("LANGMEM_EMBEDDING_MODEL", "")
 
+        # One long-lived client for LiteLLM, shared with the MemoryStore for
+        # Weaviate. An injected transport is a shared pool owned by the
+        # caller, so aclose() leaves it open.
+        self._owns_transport = transport is None
+        self._http = httpx.AsyncClient(transport=transport)
+
         self.store: Optional[MemoryStore] = None
         self._initialized = False
         self._init_lock = asyncio.Lock()
 
+    async def aclose(self) -> None:
+        if self._owns_transport:
+            await self._http.aclose()
+
     async def _ensure_initialized(self):
         """Lazy initialization of the memory store.
 
@@ -63,6 +73,7 @@ class MemoryService:
             litellm_url=self.litellm_url,
             litellm_api_key=self.litellm_api_key,
             embedding_model=self.embedding_model or None,
+            http_client=self._http,
         )
         await self.store.initialize()
         self._initialized = True
@@ -124,19 +135,19 @@ class MemoryService:
         }
         if json_mode:
             body["response_format"] = {"type": "json_object"}
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            resp = await client.post(
-                f"{self.litellm_url}/v1/chat/completions",
-                json=body,
-                headers=headers,
-            )
-            resp.raise_for_status()
-            result = resp.json()
-            choices = result.get("choices") or []
-            if not choices:
-                return ""
-            message = choices[0].get("message") or {}
-            return message.get("content") or ""
+        resp = await self._http.post(
+            f"{self.litellm_url}/v1/chat/completions",
+            json=body,
+            headers=headers,
+            timeout=timeout,
+        )
+        resp.raise_for_status()
+        result = resp.json()
+        choices = result.get("choices") or []
+        if not choices:
+            return ""
+        message = choices[0].get("message") or {}
+        return message.get("content") or ""
 
     async def extract_facts(
         self,
@@ -38,8 +38,14 @@ class MemoryStore:
         litellm_url: Optional[str] = None,
         litellm_api_key: Optional[str] = None,
         embedding_model: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         self.database_url = database_url
+        # Weaviate and LiteLLM calls go through one long-lived client (each
+        # call passes its own timeout) instead of a new AsyncClient and TCP
+        # handshake per request. MemoryService passes its own client, which
+        # sits on the app-wide shared transport; its owner closes it.
+        self._http = http_client or httpx.AsyncClient()
         self.weaviate_url = weaviate_url
         self.litellm_url = litellm_url or "http://litellm:4000"
         self.litellm_api_key = litellm_api_key or os.getenv("LITELLM_API_KEY", "")
@@ -71,19 +77,19 @@ class MemoryStore:
             # Try Weaviate first
             if self.weaviate_url:
                 try:
-                    async with httpx.AsyncClient(timeout=5.0) as client:
-                        resp = await client.get(
-                            f"{self.weaviate_url}/v1/.well-known/ready"
+                    resp = await self._http.get(
+                        f"{self.weaviate_url}/v1/.well-known/ready",
+                        timeout=5.0,
+                    )
+                    if resp.status_code == 200:
+                        self.backend = "weaviate"
+                        await self._ensure_weaviate_collection()
+                        logger.info(
+                            "Memory store initialized with Weaviate backend "
+                            f"at {self.weaviate_url}"
                         )
-                        if resp.status_code == 200:
-                            self.backend = "weaviate"
-                            await self._ensure_weaviate_collection()
-                            logger.info(
-                                "Memory store initialized with Weaviate backend "
-                                f"at {self.weaviate_url}"
-                            )
-                            self._initialized = True
-                            return
+                        self._initialized = True
+                        return
                 except Exception as e:
                     logger.warning(
                         f"Weaviate not available ({e}), falling back to pgvector"
@@ -96,142 +102,145 @@ class MemoryStore:
 
     async def _ensure_weaviate_collection(self):
         """Create the Memory collection in Weaviate if it doesn't exist."""
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            # Check if collection exists
-            resp = await client.get(
-                f"{self.weaviate_url}/v1/schema/{WEAVIATE_COLLECTION_NAME}"
-            )
-            if resp.status_code == 200:
-                # Retroactive heal: stacks deployed before the /v1/v1 fix
-                # carry the broken baseURL in the EXISTING class config.
-                # Weaviate 1.27.5 rejects vectorizer moduleConfig updates
-                # via PUT (immutables validation), so the only remediation
-                # is delete + recreate — safe here because the broken
-                # baseURL meant every embedding call 404'd: the class
-                # never held valid vectors.
-                try:
-                    existing = resp.json()
-                    mod = (existing.get("moduleConfig") or {}).get("text2vec-openai") or {}
-                    bad = (mod.get("baseURL") or "").rstrip("/")
-                    if bad.endswith("/v1"):
-                        logger.warning(
-                            "Memory collection carries the broken /v1 baseURL "
-                            "(%s) — deleting and recreating it (it could never "
-                            "store vectors).", bad,
-                        )
-                        await client.delete(
-                            f"{self.weaviate_url}/v1/schema/{WEAVIATE_COLLECTION_NAME}"
-                        )
-                        # fall through to the creation path below
-                    else:
-                        return  # Already exists and healthy
-                except Exception as exc:  # noqa: BLE001 — heal is best-effort
-                    logger.warning("Memory collection baseURL check failed: %s", exc)
-                    return  # keep existing class; don't block startup
-
-            # Create collection
-            schema = {
-                "class": WEAVIATE_COLLECTION_NAME,
-                "description": "LangMem persistent memory facts",
-                "vectorizer": "text2vec-openai",
-                "moduleConfig": {
-                    "text2vec-openai": {
-                        # Strip the LiteLLM provider prefix (text2vec-openai
-                        # expects an OpenAI-style model name; LiteLLM resolves
-                        # the actual provider from its model_list).
-                        "model": self.embedding_model.split("/", 1)[-1],
-                        # No /v1 suffix: Weaviate's openai module joins
-                        # "/v1/embeddings" onto baseURL itself, so a /v1
-                        # here produced /v1/v1/embeddings → 404 on every
-                        # Weaviate-backed memory insert/search.
-                        "baseURL": self.litellm_url,
-                        "vectorizeClassName": False,
-                    }
+        # Check if collection exists
+        resp = await self._http.get(
+            f"{self.weaviate_url}/v1/schema/{WEAVIATE_COLLECTION_NAME}",
+            timeout=10.0,
+        )
+        if resp.status_code == 200:
+            # Retroactive heal: stacks deployed before the /v1/v1 fix
+            # carry the broken baseURL in the EXISTING class config.
+            # Weaviate 1.27.5 rejects vectorizer moduleConfig updates
+            # via PUT (immutables validation), so the only remediation
+            # is delete + recreate — safe here because the broken
+            # baseURL meant every embedding call 404'd: the class
+            # never held valid vectors.
+            try:
+                existing = resp.json()
+                mod = (existing.get("moduleConfig") or {}).get("text2vec-openai") or {}
+                bad = (mod.get("baseURL") or "").rstrip("/")
+                if bad.endswith("/v1"):
+                    logger.warning(
+                        "Memory collection carries the broken /v1 baseURL "
+                        "(%s) — deleting and recreating it (it could never "
+                        "store vectors).", bad,
+                    )
+                    await self._http.delete(
+                        f"{self.weaviate_url}/v1/schema/{WEAVIATE_COLLECTION_NAME}",
+                        timeout=10.0,
+                    )
+                    # fall through to the creation path below
+                else:
+                    return  # Already exists and healthy
+            except Exception as exc:  # noqa: BLE001 — heal is best-effort
+                logger.warning("Memory collection baseURL check failed: %s", exc)
+                return  # keep existing class; don't block startup
+
+        # Create collection
+        schema = {
+            "class": WEAVIATE_COLLECTION_NAME,
+            "description": "LangMem persistent memory facts",
+            "vectorizer": "text2vec-openai",
+            "moduleConfig": {
+                "text2vec-openai": {
+                    # Strip the LiteLLM provider prefix (text2vec-openai
+                    # expects an OpenAI-style model name; LiteLLM resolves
+                    # the actual provider from its model_list).
+                    "model": self.embedding_model.split("/", 1)[-1],
+                    # No /v1 suffix: Weaviate's openai module joins
+                    # "/v1/embeddings" onto baseURL itself, so a /v1
+                    # here produced /v1/v1/embeddings → 404 on every
+                    # Weaviate-backed memory insert/search.
+                    "baseURL": self.litellm_url,
+                    "vectorizeClassName": False,
+                }
+            },
+            "properties": [
+                {
+                    "name": "content",
+                    "dataType": ["text"],
+                    "description": "Memory fact content",
                 },
-                "properties": [
-                    {
-                        "name": "content",
-                        "dataType": ["text"],
-                        "description": "Memory fact content",
-                    },
-                    {
-                        "name": "userId",
-                        "dataType": ["text"],
-                        "description": "User ID who owns this memory",
-                        "moduleConfig": {
-                            "text2vec-openai": {
-                                "skip": True,
-                                "vectorizePropertyName": False,
-                            }
-                        },
+                {
+                    "name": "userId",
+                    "dataType": ["text"],
+                    "description": "User ID who owns this memory",
+                    "moduleConfig": {
+                        "text2vec-openai": {
+                            "skip": True,
+                            "vectorizePropertyName": False,
+                        }
                     },
-                    {
-                        "name": "namespace",
-                        "dataType": ["text"],
-                        "description": "Memory namespace",
-                        "moduleConfig": {
-                            "text2vec-openai": {
-                                "skip": True,
-                                "vectorizePropertyName": False,
-                            }
-                        },
+                },
+                {
+                    "name": "namespace",
+                    "dataType": ["text"],
+                    "description": "Memory namespace",
+                    "moduleConfig": {
+                        "text2vec-openai": {
+                            "skip": True,
+                            "vectorizePropertyName": False,
+                        }
                     },
-                    {
-                        "name": "factType",
-                        "dataType": ["text"],
-                        "description": "Type of fact",
-                        "moduleConfig": {
-                            "text2vec-openai": {
-                                "skip": True,
-                                "vectorizePropertyName": False,
-                            }
-                        },
+                },
+                {
+                    "name": "factType",
+                    "dataType": ["text"],
+                    "description": "Type of fact",
+                    "moduleConfig": {
+                        "text2vec-openai": {
+                            "skip": True,
+                            "vectorizePropertyName": False,
+                        }
                     },
-                    {
-                        "name": "confidence",
-                        "dataType": ["number"],
-                        "description": "Confidence score",
-                        "moduleConfig": {
-                            "text2vec-openai": {
-                                "skip": True,
-                                "vectorizePropertyName": False,
-                            }
-                        },
+                },
+                {
+                    "name": "confidence",
+                    "dataType": ["number"],
+                    "description": "Confidence score",
+                    "moduleConfig": {
+                        "text2vec-openai": {
+                            "skip": True,
+                            "vectorizePropertyName": False,
+                        }
                     },
-                    {
-                        "name": "pgFactId",
-                        "dataType": ["text"],
-                        "description": "Reference to PostgreSQL memory_facts.id",
-                        "moduleConfig": {
-                            "text2vec-openai": {
-                                "skip": True,
-                                "vectorizePropertyName": False,
-                            }
-                        },
+                },
+                {
+                    "name": "pgFactId",
+                    "dataType": ["text"],
+                    "description": "Reference to PostgreSQL memory_facts.id",
+                    "moduleConfig": {
+                        "text2vec-openai": {
+                            "skip": True,
+                            "vectorizePropertyName": False,
+                        }
                     },
-                    {
-                        "name": "isActive",
-                        "dataType": ["boolean"],
-                        "description": "Whether the memory is active",
-                        "moduleConfig": {
-                            "text2vec-openai": {
-                                "skip": True,
-                                "vectorizePropertyName": False,
-                            }
-                        },
+                },
+                {
+                    "name": "isActive",
+                    "dataType": ["boolean"],
+                    "description": "Whether the memory is active",
+                    "moduleConfig": {
+                        "text2vec-openai": {
+                            "skip": True,
+                            "vectorizePropertyName": False,
+                        }
                     },
-                ],
-            }
-            resp = await client.post(
-                f"{self.weaviate_url}/v1/schema", json=schema
+                },
+            ],
+        }
+        resp = await self._http.post(
+            f"{self.weaviate_url}/v1/schema",
+            json=schema,
+            timeout=10.0,
+        )
+        if resp.status_code in (200, 201):
+            logger.info("Created Weaviate Memory collection")
+        else:
+            logger.error(
+                f"Failed to create Weaviate collection: "
+                f"{resp.status_code} {resp.text}"
             )
-            if resp.status_code in (200, 201):
-                logger.info("Created Weaviate Memory collection")
-            else:
-                logger.error(
-                    f"Failed to create Weaviate collection: "
-                    f"{resp.status_code} {resp.text}"
-                )
 
     async def _generate_embedding(self, text: str) -> List[float]:
         """Generate an embedding vector through the LiteLLM gateway.
@@ -243,14 +252,14 @@ class MemoryStore:
         headers = {}
         if self.litellm_api_key:
             headers["Authorization"] = f"Bearer {self.litellm_api_key}"
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.post(
-                f"{self.litellm_url}/v1/embeddings",
-                json={"model": self.embedding_model, "input": text},
-                headers=headers,
-            )
-            resp.raise_for_status()
-            return resp.json()["data"][0]["embedding"]
+        resp = await self._http.post(
+            f"{self.litellm_url}/v1/embeddings",
+            json={"model": self.embedding_model, "input": text},
+            headers=headers,
+            timeout=30.0,
+        )
+        resp.raise_for_status()
+        return resp.json()["data"][0]["embedding"]
 
     async def store_embedding(
         self,
@@ -295,12 +304,13 @@ class MemoryStore:
                 "isActive": True,
             },
         }
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(
-                f"{self.weaviate_url}/v1/objects", json=obj
-            )
-            resp.raise_for_status()
-            return resp.json()["id"]
+        resp = await self._http.post(
+            f"{self.weaviate_url}/v1/objects",
+            json=obj,
+            timeout=10.0,
+        )
+        resp.raise_for_status()
+        return resp.json()["id"]
 
     async def _store_pgvector(self, fact_id: str, content: str):
         """Store embedding in pgvector column."""
@@ -378,12 +388,13 @@ class MemoryStore:
                 }}
             }}"""
         }
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(
-                f"{self.weaviate_url}/v1/graphql", json=graphql
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await self._http.post(
+            f"{self.weaviate_url}/v1/graphql",
+            json=graphql,
+            timeout=10.0,
+        )
+        resp.raise_for_status()
+        data = resp.json()
 
         results = []
         objects = (
@@ -447,23 +458,23 @@ class MemoryStore:
         await self.initialize()
 
         if self.backend == "weaviate" and weaviate_id:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                resp = await client.delete(
-                    f"{self.weaviate_url}/v1/objects/"
-                    f"{WEAVIATE_COLLECTION_NAME}/{weaviate_id}"
+            resp = await self._http.delete(
+                f"{self.weaviate_url}/v1/objects/"
+                f"{WEAVIATE_COLLECTION_NAME}/{weaviate_id}",
+                timeout=10.0,
+            )
+            # 404 = already gone (fine). Any other non-2xx must be
+            # observable: update_embedding deletes-then-recreates, so a
+            # silently-failed delete leaves a stale vector that diverges
+            # from the PG source of truth and pollutes recall.
+            if resp.status_code not in (200, 204, 404):
+                logger.warning(
+                    "Failed to delete Weaviate object %s (status %s); "
+                    "stale vector may remain for fact %s",
+                    weaviate_id,
+                    resp.status_code,
+                    fact_id,
                 )
-                # 404 = already gone (fine). Any other non-2xx must be
-                # observable: update_embedding deletes-then-recreates, so a
-                # silently-failed delete leaves a stale vector that diverges
-                # from the PG source of truth and pollutes recall.
-                if resp.status_code not in (200, 204, 404):
-                    logger.warning(
-                        "Failed to delete Weaviate object %s (status %s); "
-                        "stale vector may remain for fact %s",
-                        weaviate_id,
-                        resp.status_code,
-                        fact_id,
-                    )
         # pgvector: embedding is in the row, deleted when the row is deleted/updated
 
     async def update_embedding(
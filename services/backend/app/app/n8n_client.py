@@ -1,12 +1,23 @@
+import asyncio
 import httpx
 import os
-from typing import Dict, Any, List, Optional
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+# Upper bound on cached workflow definitions; least recently used go first.
+_WORKFLOW_CACHE_SIZE = 1024
 
 
 class N8nClient:
     """Client for interacting with n8n API"""
 
-    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         self.base_url = base_url or os.getenv("N8N_BASE_URL", "http://n8n:5678")
         self.api_key = api_key or os.getenv("N8N_API_KEY", "")
         self.headers = {"X-N8N-API-KEY": self.api_key} if self.api_key else {}
@@ -16,12 +27,30 @@ class N8nClient:
         # which holds a uvicorn worker through every n8n-down call.
         # connect=5 fails fast; read=30 covers n8n's slowest workflow
         # list endpoint.
+        # An injected transport is a shared pool owned by the caller, so
+        # aclose() leaves it open.
+        self._owns_transport = transport is None
+        # base_url and the API-key header live on the client, so calls
+        # pass only a path instead of re-merging headers every time.
         self._client = httpx.AsyncClient(
-            timeout=httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0)
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0),
+            transport=transport,
         )
+        # Workflow definitions only change when someone edits them in
+        # n8n, so GET /workflows and /workflows/{id} are served from short
+        # TTL caches instead of an API round-trip per request.
+        self._workflow_ttl = float(os.getenv("N8N_WORKFLOW_TTL", "30"))
+        self._workflow_list_ttl = float(os.getenv("N8N_WORKFLOW_LIST_TTL", "10"))
+        self._workflow_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._workflow_list_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        self._workflow_fetches: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+        self._workflow_list_lock = asyncio.Lock()
 
     async def aclose(self) -> None:
-        await self._client.aclose()
+        if self._owns_transport:
+            await self._client.aclose()
 
     async def __aenter__(self) -> "N8nClient":
         return self
@@ -29,32 +58,80 @@ class N8nClient:
     async def __aexit__(self, *a) -> None:
         await self.aclose()
 
+    def invalidate_workflow_cache(self) -> None:
+        """Drop cached workflow definitions (e.g. after editing in n8n)."""
+        self._workflow_cache.clear()
+        self._workflow_list_cache = None
+
+    def _cached_workflow(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        cached = self._workflow_cache.get(workflow_id)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[0] >= self._workflow_ttl:
+            del self._workflow_cache[workflow_id]
+            return None
+        self._workflow_cache.move_to_end(workflow_id)
+        return cached[1]
+
     async def list_workflows(self) -> List[Dict[str, Any]]:
         """List all workflows.
 
         n8n's public API wraps the list in a ``{"data": [...],
         "nextCursor": ...}`` envelope — return the inner list (the raw
         dict failed the route's List[WorkflowResponse] validation).
+
+        Cached for N8N_WORKFLOW_LIST_TTL seconds; the lock collapses
+        concurrent misses into one upstream call.
         """
-        response = await self._client.get(
-            f"{self.base_url}/api/v1/workflows", headers=self.headers
-        )
-        response.raise_for_status()
-        return response.json().get("data", [])
+        cached = self._workflow_list_cache
+        if cached is not None and time.monotonic() - cached[0] < self._workflow_list_ttl:
+            return cached[1]
+
+        async with self._workflow_list_lock:
+            cached = self._workflow_list_cache
+            if cached is not None and time.monotonic() - cached[0] < self._workflow_list_ttl:
+                return cached[1]
+            response = await self._client.get("/api/v1/workflows")
+            response.raise_for_status()
+            workflows = response.json().get("data", [])
+            self._workflow_list_cache = (time.monotonic(), workflows)
+            return workflows
 
     async def get_workflow(self, workflow_id: str) -> Dict[str, Any]:
-        """Get a workflow by ID"""
-        response = await self._client.get(
-            f"{self.base_url}/api/v1/workflows/{workflow_id}", headers=self.headers
-        )
+        """Get a workflow by ID.
+
+        Cached per ID for N8N_WORKFLOW_TTL seconds. Concurrent misses for
+        the same ID share one in-flight fetch. Errors are not cached, and a
+        404 evicts the ID so a deleted workflow stops being served.
+        """
+        cached = self._cached_workflow(workflow_id)
+        if cached is not None:
+            return cached
+
+        fetch = self._workflow_fetches.get(workflow_id)
+        if fetch is None:
+            fetch = asyncio.ensure_future(self._fetch_workflow(workflow_id))
+            self._workflow_fetches[workflow_id] = fetch
+            fetch.add_done_callback(
+                lambda _: self._workflow_fetches.pop(workflow_id, None)
+            )
+        # shield(): one caller disconnecting must not cancel the fetch the
+        # other waiters are sharing.
+        return await asyncio.shield(fetch)
+
+    async def _fetch_workflow(self, workflow_id: str) -> Dict[str, Any]:
+        response = await self._client.get(f"/api/v1/workflows/{workflow_id}")
+        if response.status_code == 404:
+            self._workflow_cache.pop(workflow_id, None)
         response.raise_for_status()
-        return response.json()
+        workflow = response.json()
+        self._workflow_cache[workflow_id] = (time.monotonic(), workflow)
+        while len(self._workflow_cache) > _WORKFLOW_CACHE_SIZE:
+            self._workflow_cache.popitem(last=False)
+        return workflow
 
     async def get_execution(self, execution_id: str) -> Dict[str, Any]:
         """Get an execution by ID"""
-        response = await self._client.get(
-            f"{self.base_url}/api/v1/executions/{execution_id}",
-            headers=self.headers,
-        )
+        response = await self._client.get(f"/api/v1/executions/{execution_id}")
         response.raise_for_status()
         return response.json()
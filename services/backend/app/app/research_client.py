@@ -1,12 +1,16 @@
 import httpx
 import os
 import asyncio
-import json
+import orjson
 import time
 from typing import Dict, Any, List, Optional, AsyncGenerator
 from pydantic import BaseModel
 from enum import Enum
 
+# wait_for_completion's first poll delay and per-poll growth factor.
+_POLL_INITIAL_DELAY = 0.1
+_POLL_BACKOFF = 1.3
+
 
 class ResearchError(Exception):
     """Raised when a research workflow fails — wraps upstream errors
@@ -50,10 +54,33 @@ class ResearchResult(BaseModel):
     metadata: Dict[str, Any]
 
 
+async def _iter_sse_lines(response: httpx.Response) -> AsyncGenerator[bytes, None]:
+    """Yield the lines of a streamed SSE body as bytes.
+
+    Splits the raw byte chunks in one reusable buffer instead of
+    aiter_lines(), which decodes every line to str first.
+    """
+    buffer = bytearray()
+    async for chunk in response.aiter_bytes():
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            yield bytes(buffer[start:end]).rstrip(b"\r")
+            start = end + 1
+        del buffer[:start]
+    if buffer:
+        yield bytes(buffer).rstrip(b"\r")
+
+
 class ResearchClient:
     """Client for interacting with Local Deep Researcher service"""
 
-    def __init__(self, base_url: Optional[str] = None, timeout: int = 300):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: int = 300,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         self.base_url = base_url or os.getenv(
             "LOCAL_DEEP_RESEARCHER_URL", 
             "http://local-deep-researcher:2024"
@@ -63,201 +90,219 @@ class ResearchClient:
             "Content-Type": "application/json",
             "Accept": "application/json"
         }
+        # One keep-alive client for every call instead of a fresh
+        # AsyncClient (and TCP/TLS handshake) per request. Phases get
+        # separate budgets, as in N8nClient: connect/pool fail fast when
+        # the researcher is down, read=30 is the per-call default, and
+        # health_check and the log stream override it.
+        # base_url and the JSON headers are set once here, so calls pass
+        # only a path.
+        # An injected transport is a shared pool owned by the caller, so
+        # aclose() leaves it open.
+        self._owns_transport = transport is None
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0),
+            transport=transport,
+        )
+
+    async def aclose(self) -> None:
+        if self._owns_transport:
+            await self._client.aclose()
+
+    async def __aenter__(self) -> "ResearchClient":
+        return self
+
+    async def __aexit__(self, *a) -> None:
+        await self.aclose()
 
     async def health_check(self) -> Dict[str, Any]:
         """Check if the research service is healthy"""
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            try:
-                response = await client.get(f"{self.base_url}/health")
-                if response.status_code == 200:
-                    return {"status": "healthy", "service": "local-deep-researcher"}
-                else:
-                    return {"status": "unhealthy", "error": f"HTTP {response.status_code}"}
-            except Exception as e:
-                return {"status": "unhealthy", "error": str(e)}
+        try:
+            response = await self._client.get("/health", timeout=10.0)
+            if response.status_code == 200:
+                return {"status": "healthy", "service": "local-deep-researcher"}
+            else:
+                return {"status": "unhealthy", "error": f"HTTP {response.status_code}"}
+        except Exception as e:
+            return {"status": "unhealthy", "error": str(e)}
 
     async def start_research(self, request: ResearchRequest) -> ResearchResponse:
         """Start a new research session"""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                # Prepare payload for LangGraph API
-                payload = {
-                    "query": request.query,
-                    "config": {
-                        "max_loops": request.max_loops,
-                        "search_api": request.search_api
-                    },
-                    "metadata": {
-                        "user_id": request.user_id
-                    }
+        try:
+            # Prepare payload for LangGraph API
+            payload = {
+                "query": request.query,
+                "config": {
+                    "max_loops": request.max_loops,
+                    "search_api": request.search_api
+                },
+                "metadata": {
+                    "user_id": request.user_id
                 }
+            }
 
-                response = await client.post(
-                    f"{self.base_url}/research/start",
-                    json=payload,
-                    headers=self.headers
-                )
-                response.raise_for_status()
+            response = await self._client.post(
+                "/research/start",
+                json=payload
+            )
+            response.raise_for_status()
                 
-                data = response.json()
-                return ResearchResponse(
-                    session_id=data.get("session_id", ""),
-                    status=ResearchStatus.RUNNING,
-                    message="Research started successfully",
-                    data=data
-                )
-            except httpx.HTTPStatusError as e:
-                error_msg = f"HTTP {e.response.status_code}: {e.response.text}"
-                return ResearchResponse(
-                    session_id="",
-                    status=ResearchStatus.FAILED,
-                    message=f"Failed to start research: {error_msg}"
-                )
-            except Exception as e:
-                return ResearchResponse(
-                    session_id="",
-                    status=ResearchStatus.FAILED,
-                    message=f"Failed to start research: {str(e)}"
-                )
+            data = response.json()
+            return ResearchResponse(
+                session_id=data.get("session_id", ""),
+                status=ResearchStatus.RUNNING,
+                message="Research started successfully",
+                data=data
+            )
+        except httpx.HTTPStatusError as e:
+            error_msg = f"HTTP {e.response.status_code}: {e.response.text}"
+            return ResearchResponse(
+                session_id="",
+                status=ResearchStatus.FAILED,
+                message=f"Failed to start research: {error_msg}"
+            )
+        except Exception as e:
+            return ResearchResponse(
+                session_id="",
+                status=ResearchStatus.FAILED,
+                message=f"Failed to start research: {str(e)}"
+            )
 
     async def get_research_status(self, session_id: str) -> ResearchResponse:
         """Get the status of a research session"""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.get(
-                    f"{self.base_url}/research/{session_id}/status",
-                    headers=self.headers
-                )
-                response.raise_for_status()
+        try:
+            response = await self._client.get(f"/research/{session_id}/status")
+            response.raise_for_status()
                 
-                data = response.json()
-                return ResearchResponse(
-                    session_id=session_id,
-                    status=ResearchStatus(data.get("status", "pending")),
-                    message=data.get("message", ""),
-                    data=data
-                )
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    return ResearchResponse(
-                        session_id=session_id,
-                        status=ResearchStatus.FAILED,
-                        message="Research session not found"
-                    )
-                error_msg = f"HTTP {e.response.status_code}: {e.response.text}"
+            data = response.json()
+            return ResearchResponse(
+                session_id=session_id,
+                status=ResearchStatus(data.get("status", "pending")),
+                message=data.get("message", ""),
+                data=data
+            )
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
                 return ResearchResponse(
                     session_id=session_id,
                     status=ResearchStatus.FAILED,
-                    message=f"Failed to get status: {error_msg}"
-                )
-            except Exception as e:
-                return ResearchResponse(
-                    session_id=session_id,
-                    status=ResearchStatus.FAILED,
-                    message=f"Failed to get status: {str(e)}"
+                    message="Research session not found"
                 )
+            error_msg = f"HTTP {e.response.status_code}: {e.response.text}"
+            return ResearchResponse(
+                session_id=session_id,
+                status=ResearchStatus.FAILED,
+                message=f"Failed to get status: {error_msg}"
+            )
+        except Exception as e:
+            return ResearchResponse(
+                session_id=session_id,
+                status=ResearchStatus.FAILED,
+                message=f"Failed to get status: {str(e)}"
+            )
 
     async def get_research_result(self, session_id: str) -> Optional[ResearchResult]:
         """Get the final result of a completed research session"""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.get(
-                    f"{self.base_url}/research/{session_id}/result",
-                    headers=self.headers
-                )
-                response.raise_for_status()
+        try:
+            response = await self._client.get(f"/research/{session_id}/result")
+            response.raise_for_status()
                 
-                data = response.json()
-                return ResearchResult(
-                    session_id=session_id,
-                    title=data.get("title", "Research Result"),
-                    summary=data.get("summary", ""),
-                    content=data.get("content", ""),
-                    sources=data.get("sources", []),
-                    metadata=data.get("metadata", {})
-                )
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    return None
-                raise ResearchError(f"HTTP {e.response.status_code}: {e.response.text}")
-            except Exception as e:
-                raise ResearchError(f"Failed to get result: {str(e)}")
+            data = response.json()
+            return ResearchResult(
+                session_id=session_id,
+                title=data.get("title", "Research Result"),
+                summary=data.get("summary", ""),
+                content=data.get("content", ""),
+                sources=data.get("sources", []),
+                metadata=data.get("metadata", {})
+            )
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise ResearchError(f"HTTP {e.response.status_code}: {e.response.text}")
+        except Exception as e:
+            raise ResearchError(f"Failed to get result: {str(e)}")
 
     async def cancel_research(self, session_id: str) -> ResearchResponse:
         """Cancel a running research session"""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.post(
-                    f"{self.base_url}/research/{session_id}/cancel",
-                    headers=self.headers
-                )
-                response.raise_for_status()
+        try:
+            response = await self._client.post(f"/research/{session_id}/cancel")
+            response.raise_for_status()
                 
-                data = response.json()
-                return ResearchResponse(
-                    session_id=session_id,
-                    status=ResearchStatus.CANCELLED,
-                    message="Research cancelled successfully",
-                    data=data
-                )
-            except httpx.HTTPStatusError as e:
-                error_msg = f"HTTP {e.response.status_code}: {e.response.text}"
-                return ResearchResponse(
-                    session_id=session_id,
-                    status=ResearchStatus.FAILED,
-                    message=f"Failed to cancel research: {error_msg}"
-                )
-            except Exception as e:
-                return ResearchResponse(
-                    session_id=session_id,
-                    status=ResearchStatus.FAILED,
-                    message=f"Failed to cancel research: {str(e)}"
-                )
+            data = response.json()
+            return ResearchResponse(
+                session_id=session_id,
+                status=ResearchStatus.CANCELLED,
+                message="Research cancelled successfully",
+                data=data
+            )
+        except httpx.HTTPStatusError as e:
+            error_msg = f"HTTP {e.response.status_code}: {e.response.text}"
+            return ResearchResponse(
+                session_id=session_id,
+                status=ResearchStatus.FAILED,
+                message=f"Failed to cancel research: {error_msg}"
+            )
+        except Exception as e:
+            return ResearchResponse(
+                session_id=session_id,
+                status=ResearchStatus.FAILED,
+                message=f"Failed to cancel research: {str(e)}"
+            )
 
     async def stream_research_logs(self, session_id: str) -> AsyncGenerator[Dict[str, Any], None]:
         """Stream real-time logs from a research session"""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                async with client.stream(
-                    "GET",
-                    f"{self.base_url}/research/{session_id}/logs/stream",
-                    headers=self.headers
-                ) as response:
-                    response.raise_for_status()
+        try:
+            async with self._client.stream(
+                "GET",
+                f"/research/{session_id}/logs/stream",
+                # Only the gap between events may be long.
+                timeout=httpx.Timeout(
+                    connect=5.0, read=self.timeout, write=10.0, pool=5.0
+                ),
+            ) as response:
+                response.raise_for_status()
                     
-                    async for line in response.aiter_lines():
-                        if line.startswith("data: "):
-                            try:
-                                data = json.loads(line[6:])  # Remove "data: " prefix
-                                yield data
-                            except json.JSONDecodeError:
-                                continue
-                        elif line == "event: close":
-                            break
-            except Exception as e:
-                yield {"error": f"Stream error: {str(e)}"}
+                async for line in _iter_sse_lines(response):
+                    if line[:6] == b"data: ":
+                        try:
+                            # orjson parses the bytes slice directly; no
+                            # str decode of the line first.
+                            data = orjson.loads(line[6:])
+                        except orjson.JSONDecodeError:
+                            continue
+                        yield data
+                    elif line == b"event: close":
+                        break
+        except Exception as e:
+            yield {"error": f"Stream error: {str(e)}"}
 
     async def list_active_sessions(self) -> List[Dict[str, Any]]:
         """List all currently active research sessions"""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.get(
-                    f"{self.base_url}/research/sessions/active",
-                    headers=self.headers
-                )
-                response.raise_for_status()
-                return response.json()
-            except Exception as e:
-                raise ResearchError(f"Failed to list active sessions: {str(e)}")
+        try:
+            response = await self._client.get("/research/sessions/active")
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            raise ResearchError(f"Failed to list active sessions: {str(e)}")
 
     async def wait_for_completion(
         self, 
         session_id: str, 
-        poll_interval: int = 5, 
+        poll_interval: float = 5, 
         max_wait_time: int = 300
     ) -> ResearchResponse:
-        """Wait for a research session to complete with polling"""
+        """Wait for a research session to complete with polling.
+
+        Polls back off exponentially from _POLL_INITIAL_DELAY up to
+        ``poll_interval``, so a short session is noticed within a fraction
+        of a second while a long one still costs one request per
+        ``poll_interval``.
+        """
         start_time = time.monotonic()
+        delay = min(_POLL_INITIAL_DELAY, poll_interval)
 
         while True:
             status_response = await self.get_research_status(session_id)
@@ -276,5 +321,6 @@ class ResearchClient:
                     status=ResearchStatus.FAILED,
                     message=f"Timeout waiting for completion after {max_wait_time} seconds"
                 )
-            
-            await asyncio.sleep(poll_interval)
\ No newline at end of file
+
+            await asyncio.sleep(min(delay, max_wait_time - elapsed_time))
+            delay = min(delay * _POLL_BACKOFF, poll_interval)
\ No newline at end of file
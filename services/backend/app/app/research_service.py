@@ -1,10 +1,15 @@
 import asyncio
 import asyncpg
+import base64
+import httpx
 import logging
 import os
-from typing import Dict, Any, List, Optional
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
 from datetime import datetime, timezone
-import json
+import orjson
 from uuid import UUID, uuid4
 
 from research_client import (
@@ -18,6 +23,68 @@ from research_client import (
 
 logger = logging.getLogger(__name__)
 
+# A session in one of these states never changes again (cancel only moves
+# PENDING/RUNNING), so its status and result can be cached indefinitely.
+TERMINAL_STATUSES = frozenset({
+    ResearchStatus.COMPLETED.value,
+    ResearchStatus.FAILED.value,
+    ResearchStatus.CANCELLED.value,
+})
+
+# In-progress statuses are cached just long enough to collapse a client's
+# tight polling loop; this worker's own updates invalidate them sooner.
+_STATUS_TTL = 2.0
+# Upper bound on memoized sessions per cache; least recently used go first.
+_SESSION_CACHE_SIZE = 1024
+# How long a health probe result is reused.
+_HEALTH_TTL = 2.0
+
+# Statements run from several places share one constant, so every call
+# site sends identical text and hits the same asyncpg statement-cache
+# entry on a pooled connection.
+_INSERT_LOG_QUERY = """
+    INSERT INTO public.research_logs (session_id, step_number, step_type, message)
+    VALUES ($1, $2, $3, $4)
+"""
+# Moves a session to a terminal status without an error message.
+_FINISH_SESSION_QUERY = """
+    UPDATE public.research_sessions
+    SET status = $1, completed_at = $2
+    WHERE id = $3
+"""
+_LOGS_QUERY = """
+    SELECT step_number, step_type, message, data, created_at
+    FROM public.research_logs
+    WHERE session_id = $1
+    ORDER BY step_number ASC
+"""
+# Rows fetched per round-trip when streaming logs.
+_LOGS_PREFETCH = 200
+
+
+def _json_text(value: Any) -> str:
+    return orjson.dumps(value).decode()
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Per-connection pool setup, run once when a connection is opened.
+
+    asyncpg hands jsonb over as text by default, leaving every caller to
+    encode and decode it. With this codec jsonb parameters take plain
+    Python values and rows come back already parsed, via orjson.
+    """
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_json_text,
+        decoder=orjson.loads,
+        schema="pg_catalog",
+    )
+
+
+class ResearchBusyError(ResearchError):
+    """Raised by start_research when RESEARCH_MAX_CONCURRENCY sessions are
+    already running; callers should retry later rather than queue."""
+
 
 def _log_task_exception(session_id: str):
     """Build an add_done_callback that surfaces silent task crashes.
@@ -41,26 +108,126 @@ def _log_task_exception(session_id: str):
     return _callback
 
 
+def encode_session_cursor(session: Dict[str, Any]) -> Optional[str]:
+    """Opaque keyset cursor pointing just past ``session`` (a row from
+    list_user_sessions), or None if the row has no created_at."""
+    if not session.get("created_at"):
+        return None
+    raw = f"{session['created_at']}|{session['session_id']}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_session_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Inverse of encode_session_cursor.
+
+    Raises:
+        ValueError: if the cursor was not produced by encode_session_cursor.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, session_id = raw.split("|")
+        return datetime.fromisoformat(created_at), UUID(session_id)
+    except ValueError as e:  # includes binascii and Unicode decode errors
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
 class ResearchService:
     """Service for managing research operations with database persistence"""
 
-    def __init__(self):
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
         self.db_url = os.getenv("DATABASE_URL")
         if not self.db_url:
             raise ValueError("DATABASE_URL environment variable is required")
         
-        self.research_client = ResearchClient()
+        self.research_client = ResearchClient(transport=transport)
         self._active_tasks = {}  # Track background tasks
-
-    async def _get_db_connection(self):
-        """Get database connection.
-
-        timeout/command_timeout bound the connect phase and per-query
-        budget. Defaults are 60s connect + None command_timeout, which
-        let a hung Postgres bouncer or stuck migration pin a uvicorn
-        worker indefinitely.
+        # session_id -> researcher-side session id, while a run is live;
+        # lets cancel_research stop the remote work too.
+        self._remote_ids: Dict[str, str] = {}
+        # Each running session holds a slot from its insert until its
+        # background task ends, bounding concurrent upstream research runs
+        # (search-API quota, DB connections, worker memory) under bursts.
+        self._research_slots = asyncio.Semaphore(
+            int(os.getenv("RESEARCH_MAX_CONCURRENCY", "16"))
+        )
+        # session_id -> (expires_at, status dict); see TERMINAL_STATUSES
+        self._status_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # session_id -> in-flight status read shared by concurrent pollers
+        self._status_fetches: Dict[str, "asyncio.Future[Optional[Dict[str, Any]]]"] = {}
+        # session_id -> result dict. Results are written once, on completion.
+        self._result_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Created on first use (it needs the running loop); see _get_pool.
+        self._pool: Optional[asyncpg.Pool] = None
+        self._pool_lock = asyncio.Lock()
+        # (expires_at, probe results); see health_check.
+        self._health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._health_lock = asyncio.Lock()
+
+    async def aclose(self) -> None:
+        """Stop running sessions, then close the HTTP client and DB pool.
+
+        Tasks are cancelled first so none of them is mid-write when the
+        pool closes. Safe to call more than once.
+        """
+        tasks = list(self._active_tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.research_client.aclose()
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    async def __aenter__(self) -> "ResearchService":
+        return self
+
+    async def __aexit__(self, *a) -> None:
+        await self.aclose()
+
+    @staticmethod
+    def _remember(cache: OrderedDict, session_id: str, value: Any) -> None:
+        cache[session_id] = value
+        cache.move_to_end(session_id)
+        while len(cache) > _SESSION_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _forget_status(self, session_id: str) -> None:
+        self._status_cache.pop(session_id, None)
+        # Later pollers start a fresh read instead of joining one that may
+        # have seen the row before this write.
+        self._status_fetches.pop(session_id, None)
+
+    async def _get_pool(self) -> asyncpg.Pool:
+        """Connection pool shared by every query, created on first use.
+
+        Reusing connections skips the TCP + auth + startup round-trips a
+        fresh asyncpg.connect() paid per call, and keeps asyncpg's
+        per-connection statement cache warm. timeout/command_timeout bound
+        the connect phase and per-query budget. Defaults are 60s connect +
+        None command_timeout, which let a hung Postgres bouncer or stuck
+        migration pin a uvicorn worker indefinitely.
         """
-        return await asyncpg.connect(self.db_url, timeout=10, command_timeout=30)
+        if self._pool is None:
+            async with self._pool_lock:
+                if self._pool is None:
+                    self._pool = await asyncpg.create_pool(
+                        self.db_url,
+                        min_size=int(os.getenv("RESEARCH_DB_POOL_MIN", "2")),
+                        max_size=int(os.getenv("RESEARCH_DB_POOL_MAX", "20")),
+                        timeout=10,
+                        command_timeout=30,
+                        init=_init_connection,
+                    )
+        return self._pool
+
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[asyncpg.Connection]:
+        """Borrow a pooled connection for the duration of the block."""
+        pool = await self._get_pool()
+        # Bounded so an exhausted pool fails the request instead of
+        # queueing it forever.
+        async with pool.acquire(timeout=10) as conn:
+            yield conn
 
     async def start_research(
         self, 
@@ -69,28 +236,43 @@ class ResearchService:
         search_api: str = "duckduckgo",
         user_id: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Start a new research session with database tracking"""
-        
+        """Start a new research session with database tracking.
+
+        Raises:
+            ResearchBusyError: if every research slot is taken. Nothing is
+                written for the rejected session.
+        """
+        if self._research_slots.locked():
+            raise ResearchBusyError(
+                "Too many research sessions running; retry shortly"
+            )
+        # Doesn't suspend while a slot is free, so the check above can't race.
+        await self._research_slots.acquire()
+
         # Create database record first
-        session_id = str(uuid4())
-        conn = await self._get_db_connection()
-        
+        # Bound as a native UUID (no str -> uuid parse in asyncpg); the
+        # string form is only for the caller and the in-process caches.
+        session_uuid = uuid4()
+        session_id = str(session_uuid)
         try:
-            await conn.execute("""
-                INSERT INTO public.research_sessions 
-                (id, query, status, max_loops, search_api, user_id, started_at)
-                VALUES ($1, $2, $3, $4, $5, $6, $7)
-            """, session_id, query, ResearchStatus.PENDING.value, max_loops, search_api, 
-                UUID(user_id) if user_id else None, datetime.now(timezone.utc))
-            
-            # Log the start
-            await conn.execute("""
-                INSERT INTO public.research_logs (session_id, step_number, step_type, message)
-                VALUES ($1, $2, $3, $4)
-            """, session_id, 1, "start", f"Research session started for query: {query}")
-            
-        finally:
-            await conn.close()
+            # Session row and its "start" log entry in one statement: one
+            # round-trip, and they commit together.
+            async with self._connection() as conn:
+                await conn.execute("""
+                    WITH session AS (
+                        INSERT INTO public.research_sessions 
+                        (id, query, status, max_loops, search_api, user_id, started_at)
+                        VALUES ($1, $2, $3, $4, $5, $6, $7)
+                        RETURNING id
+                    )
+                    INSERT INTO public.research_logs (session_id, step_number, step_type, message)
+                    SELECT id, 1, 'start', $8 FROM session
+                """, session_uuid, query, ResearchStatus.PENDING.value, max_loops, search_api, 
+                    UUID(user_id) if user_id else None, datetime.now(timezone.utc),
+                    f"Research session started for query: {query}")
+        except BaseException:
+            self._research_slots.release()
+            raise
 
         # Start background research task. add_done_callback surfaces any
         # exception raised before _run_research_background's outer try
@@ -100,7 +282,12 @@ class ResearchService:
             self._run_research_background(session_id, query, max_loops, search_api, user_id)
         )
         task.add_done_callback(_log_task_exception(session_id))
+        # Released however the task ends: finished, failed or cancelled.
+        task.add_done_callback(lambda _: self._research_slots.release())
+        # Strong reference while it runs (asyncio only holds tasks weakly),
+        # dropped by the task itself when it ends.
         self._active_tasks[session_id] = task
+        task.add_done_callback(lambda _: self._active_tasks.pop(session_id, None))
 
         return {
             "session_id": session_id,
@@ -119,21 +306,26 @@ class ResearchService:
         search_api: str,
         user_id: Optional[str]
     ):
-        """Run research in background and update database"""
-        conn = await self._get_db_connection()
-        
-        try:
-            # Update status to running
-            await conn.execute("""
-                UPDATE public.research_sessions 
-                SET status = $1, started_at = $2
-                WHERE id = $3
-            """, ResearchStatus.RUNNING.value, datetime.now(timezone.utc), session_id)
+        """Run research in background and update database.
 
-            await conn.execute("""
-                INSERT INTO public.research_logs (session_id, step_number, step_type, message)
-                VALUES ($1, $2, $3, $4)
-            """, session_id, 2, "execute", "Starting research execution")
+        Connections are borrowed per write rather than held for the whole
+        run, so a session waiting on the remote researcher doesn't pin a
+        pool slot for minutes.
+        """
+        try:
+            async with self._connection() as conn:
+                # Update status to running
+                await conn.execute("""
+                    UPDATE public.research_sessions 
+                    SET status = $1, started_at = $2
+                    WHERE id = $3
+                """, ResearchStatus.RUNNING.value, datetime.now(timezone.utc), session_id)
+                self._forget_status(session_id)
+
+                await conn.execute(
+                    _INSERT_LOG_QUERY,
+                    session_id, 2, "execute", "Starting research execution",
+                )
 
             # Create request for research client
             request = ResearchRequest(
@@ -144,30 +336,25 @@ class ResearchService:
             )
 
             # Execute research using the actual local-deep-researcher service
-            await self._execute_research(conn, session_id, request)
+            await self._execute_research(session_id, request)
 
         except Exception as e:
-            # Update status to failed
-            await conn.execute("""
-                UPDATE public.research_sessions 
-                SET status = $1, completed_at = $2, error_message = $3
-                WHERE id = $4
-            """, ResearchStatus.FAILED.value, datetime.now(timezone.utc), str(e), session_id)
-
-            await conn.execute("""
-                INSERT INTO public.research_logs (session_id, step_number, step_type, message)
-                VALUES ($1, $2, $3, $4)
-            """, session_id, 99, "error", f"Research failed: {str(e)}")
-
-        finally:
-            await conn.close()
-            # Clean up task reference
-            if session_id in self._active_tasks:
-                del self._active_tasks[session_id]
+            async with self._connection() as conn:
+                # Update status to failed
+                await conn.execute("""
+                    UPDATE public.research_sessions 
+                    SET status = $1, completed_at = $2, error_message = $3
+                    WHERE id = $4
+                """, ResearchStatus.FAILED.value, datetime.now(timezone.utc), str(e), session_id)
+                self._forget_status(session_id)
+
+                await conn.execute(
+                    _INSERT_LOG_QUERY,
+                    session_id, 99, "error", f"Research failed: {str(e)}",
+                )
 
     async def _execute_research(
         self, 
-        conn: asyncpg.Connection, 
         session_id: str, 
         request: ResearchRequest
     ):
@@ -180,27 +367,32 @@ class ResearchService:
             raise ResearchError(f"Failed to start research: {research_response.message}")
         
         remote_session_id = research_response.session_id
-        
-        # Log the remote session ID
-        await conn.execute("""
-            INSERT INTO public.research_logs (session_id, step_number, step_type, message)
-            VALUES ($1, $2, $3, $4)
-        """, session_id, 3, "remote_start", f"Remote research session started: {remote_session_id}")
-        
-        # Wait for completion
-        final_response = await self.research_client.wait_for_completion(remote_session_id)
-        
-        if final_response.status == ResearchStatus.COMPLETED:
-            # Get the results
-            research_result = await self.research_client.get_research_result(remote_session_id)
-            
-            if research_result:
-                # Store the results
-                await self._store_research_result(conn, session_id, research_result)
+        self._remote_ids[session_id] = remote_session_id
+        try:
+            # Log the remote session ID
+            async with self._connection() as conn:
+                await conn.execute(
+                    _INSERT_LOG_QUERY,
+                    session_id, 3, "remote_start", f"Remote research session started: {remote_session_id}",
+                )
+
+            # Wait for completion
+            final_response = await self.research_client.wait_for_completion(remote_session_id)
+
+            if final_response.status == ResearchStatus.COMPLETED:
+                # Get the results
+                research_result = await self.research_client.get_research_result(remote_session_id)
+
+                if research_result:
+                    # Store the results
+                    async with self._connection() as conn:
+                        await self._store_research_result(conn, session_id, research_result)
+                else:
+                    raise ResearchError("Failed to retrieve research results")
             else:
-                raise ResearchError("Failed to retrieve research results")
-        else:
-            raise ResearchError(f"Research failed: {final_response.message}")
+                raise ResearchError(f"Research failed: {final_response.message}")
+        finally:
+            self._remote_ids.pop(session_id, None)
 
     async def _store_research_result(
         self, 
@@ -210,43 +402,74 @@ class ResearchService:
     ):
         """Store research results in the database"""
         
-        # Log completion
-        await conn.execute("""
-            INSERT INTO public.research_logs (session_id, step_number, step_type, message)
-            VALUES ($1, $2, $3, $4)
-        """, session_id, 4, "complete", "Research completed successfully")
-
-        # Store research result
-        result_id = str(uuid4())
-        await conn.execute("""
-            INSERT INTO public.research_results 
-            (id, session_id, title, summary, content, sources, metadata)
-            VALUES ($1, $2, $3, $4, $5, $6, $7)
-        """, result_id, session_id, research_result.title, research_result.summary,
-            research_result.content, json.dumps(research_result.sources), 
-            json.dumps(research_result.metadata))
-
-        # Store individual sources
-        for source in research_result.sources:
+        # One transaction: the result, its sources and the COMPLETED status
+        # commit together (one WAL flush), and a failure part-way leaves no
+        # half-stored result behind.
+        async with conn.transaction():
+            # Log completion
+            await conn.execute(
+                _INSERT_LOG_QUERY,
+                session_id, 4, "complete", "Research completed successfully",
+            )
+
+            # Store research result
+            result_uuid = uuid4()
             await conn.execute("""
-                INSERT INTO public.research_sources 
-                (session_id, result_id, url, title, relevance_score, metadata)
-                VALUES ($1, $2, $3, $4, $5, $6)
-            """, session_id, result_id, source.get("url", ""), source.get("title", ""),
-                source.get("relevance_score", 0.0), json.dumps(source.get("metadata", {})))
-
-        # Update session as completed
-        await conn.execute("""
-            UPDATE public.research_sessions 
-            SET status = $1, completed_at = $2
-            WHERE id = $3
-        """, ResearchStatus.COMPLETED.value, datetime.now(timezone.utc), session_id)
+                INSERT INTO public.research_results 
+                (id, session_id, title, summary, content, sources, metadata)
+                VALUES ($1, $2, $3, $4, $5, $6, $7)
+            """, result_uuid, session_id, research_result.title, research_result.summary,
+                research_result.content, research_result.sources, 
+                research_result.metadata)
+
+            # Store individual sources. executemany pipelines every row in one
+            # round-trip instead of awaiting an INSERT per source.
+            if research_result.sources:
+                await conn.executemany("""
+                    INSERT INTO public.research_sources 
+                    (session_id, result_id, url, title, relevance_score, metadata)
+                    VALUES ($1, $2, $3, $4, $5, $6)
+                """, [
+                    (session_id, result_uuid, source.get("url", ""), source.get("title", ""),
+                     source.get("relevance_score", 0.0), source.get("metadata", {}))
+                    for source in research_result.sources
+                ])
+
+            # Update session as completed
+            await conn.execute(
+                _FINISH_SESSION_QUERY,
+                ResearchStatus.COMPLETED.value, datetime.now(timezone.utc), session_id,
+            )
+        self._forget_status(session_id)
 
     async def get_research_status(self, session_id: str) -> Optional[Dict[str, Any]]:
-        """Get research session status"""
-        conn = await self._get_db_connection()
-        
-        try:
+        """Get research session status.
+
+        Terminal statuses are memoized until evicted; in-progress ones for
+        _STATUS_TTL seconds, which collapses tight client polling loops.
+        Concurrent misses for one session share a single DB read.
+        """
+        cached = self._status_cache.get(session_id)
+        if cached is not None and time.monotonic() < cached[0]:
+            self._status_cache.move_to_end(session_id)
+            return cached[1]
+
+        fetch = self._status_fetches.get(session_id)
+        if fetch is None:
+            fetch = asyncio.ensure_future(self._fetch_status(session_id))
+            self._status_fetches[session_id] = fetch
+
+            def _done(_, session_id=session_id, fetch=fetch):
+                if self._status_fetches.get(session_id) is fetch:
+                    del self._status_fetches[session_id]
+
+            fetch.add_done_callback(_done)
+        # shield(): one poller disconnecting must not cancel the read the
+        # other pollers are waiting on.
+        return await asyncio.shield(fetch)
+
+    async def _fetch_status(self, session_id: str) -> Optional[Dict[str, Any]]:
+        async with self._connection() as conn:
             row = await conn.fetchrow("""
                 SELECT id, query, status, max_loops, search_api, user_id,
                        created_at, updated_at, started_at, completed_at, error_message
@@ -257,7 +480,7 @@ class ResearchService:
             if not row:
                 return None
                 
-            return {
+            result = {
                 "session_id": str(row["id"]),
                 "query": row["query"],
                 "status": row["status"],
@@ -270,14 +493,29 @@ class ResearchService:
                 "completed_at": row["completed_at"].isoformat() if row["completed_at"] else None,
                 "error_message": row["error_message"]
             }
-        finally:
-            await conn.close()
+            expires_at = (
+                float("inf")
+                if result["status"] in TERMINAL_STATUSES
+                else time.monotonic() + _STATUS_TTL
+            )
+            # A status write during the read detached this fetch (see
+            # _forget_status); its row may predate the write, so don't cache it.
+            if self._status_fetches.get(session_id) is asyncio.current_task():
+                self._remember(self._status_cache, session_id, (expires_at, result))
+            return result
 
     async def get_research_result(self, session_id: str) -> Optional[Dict[str, Any]]:
-        """Get research results for a completed session"""
-        conn = await self._get_db_connection()
-        
-        try:
+        """Get research results for a completed session.
+
+        A result row is written once when the session completes, so a hit
+        is memoized until evicted. Misses are not cached.
+        """
+        cached = self._result_cache.get(session_id)
+        if cached is not None:
+            self._result_cache.move_to_end(session_id)
+            return cached
+
+        async with self._connection() as conn:
             row = await conn.fetchrow("""
                 SELECT r.id, r.title, r.summary, r.content, r.sources, r.metadata, r.created_at,
                        s.status
@@ -289,47 +527,59 @@ class ResearchService:
             if not row:
                 return None
                 
-            return {
+            result = {
                 "session_id": session_id,
                 "result_id": str(row["id"]),
                 "title": row["title"],
                 "summary": row["summary"],
                 "content": row["content"],
-                "sources": json.loads(row["sources"]) if isinstance(row["sources"], str) else (row["sources"] or []),
-                "metadata": json.loads(row["metadata"]) if isinstance(row["metadata"], str) else (row["metadata"] or {}),
+                "sources": row["sources"] or [],
+                "metadata": row["metadata"] or {},
                 "created_at": row["created_at"].isoformat(),
                 "status": row["status"]
             }
-        finally:
-            await conn.close()
+            self._remember(self._result_cache, session_id, result)
+            return result
 
     async def list_user_sessions(
         self, 
         user_id: Optional[str] = None, 
         limit: int = 50, 
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        """List research sessions for a user"""
-        conn = await self._get_db_connection()
-        
-        try:
-            if user_id:
-                rows = await conn.fetch("""
-                    SELECT id, query, status, max_loops, search_api, 
-                           created_at, started_at, completed_at
-                    FROM public.research_sessions 
-                    WHERE user_id = $1
-                    ORDER BY created_at DESC
-                    LIMIT $2 OFFSET $3
-                """, UUID(user_id), limit, offset)
-            else:
-                rows = await conn.fetch("""
-                    SELECT id, query, status, max_loops, search_api, 
-                           created_at, started_at, completed_at
-                    FROM public.research_sessions 
-                    ORDER BY created_at DESC
-                    LIMIT $1 OFFSET $2
-                """, limit, offset)
+        """List research sessions for a user, newest first.
+
+        With ``cursor`` (from encode_session_cursor on the last row of the
+        previous page) the page is read by keyset, so the DB seeks straight
+        to it instead of scanning and discarding ``offset`` rows; ``offset``
+        is then ignored. Offset paging is kept for existing callers.
+
+        Raises:
+            ValueError: if ``cursor`` is malformed.
+        """
+        conditions = []
+        args: List[Any] = []
+        if user_id:
+            args.append(UUID(user_id))
+            conditions.append(f"user_id = ${len(args)}")
+        if cursor:
+            created_at, last_id = decode_session_cursor(cursor)
+            args.extend((created_at, last_id))
+            conditions.append(f"(created_at, id) < (${len(args) - 1}, ${len(args)})")
+            offset = 0
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        args.extend((limit, offset))
+
+        async with self._connection() as conn:
+            rows = await conn.fetch(f"""
+                SELECT id, query, status, max_loops, search_api, 
+                       created_at, started_at, completed_at
+                FROM public.research_sessions 
+                {where}
+                ORDER BY created_at DESC, id DESC
+                LIMIT ${len(args) - 1} OFFSET ${len(args)}
+            """, *args)
             
             return [
                 {
@@ -344,14 +594,10 @@ class ResearchService:
                 }
                 for row in rows
             ]
-        finally:
-            await conn.close()
 
     async def cancel_research(self, session_id: str) -> bool:
         """Cancel a running research session"""
-        conn = await self._get_db_connection()
-        
-        try:
+        async with self._connection() as conn:
             # Check current status
             status_row = await conn.fetchrow("""
                 SELECT status FROM public.research_sessions WHERE id = $1
@@ -367,77 +613,103 @@ class ResearchService:
                 return False
             
             # Cancel background task if it exists
-            if session_id in self._active_tasks:
-                self._active_tasks[session_id].cancel()
-                del self._active_tasks[session_id]
+            remote_session_id = self._remote_ids.pop(session_id, None)
+            task = self._active_tasks.pop(session_id, None)
+            if task is not None:
+                task.cancel()
             
-            # Update database
-            await conn.execute("""
-                UPDATE public.research_sessions 
-                SET status = $1, completed_at = $2
-                WHERE id = $3
-            """, ResearchStatus.CANCELLED.value, datetime.now(timezone.utc), session_id)
-
-            await conn.execute("""
-                INSERT INTO public.research_logs (session_id, step_number, step_type, message)
-                VALUES ($1, $2, $3, $4)
-            """, session_id, 98, "cancel", "Research session cancelled by user")
+            # Update database; the researcher is told to stop at the same
+            # time so it frees its worker instead of finishing unseen work.
+            update = conn.execute(
+                _FINISH_SESSION_QUERY,
+                ResearchStatus.CANCELLED.value, datetime.now(timezone.utc), session_id,
+            )
+            if remote_session_id is None:
+                await update
+            else:
+                _, remote = await asyncio.gather(
+                    update, self.research_client.cancel_research(remote_session_id)
+                )
+                if remote.status != ResearchStatus.CANCELLED:
+                    # Best effort: the local session is cancelled either way.
+                    logger.warning(
+                        "remote cancel failed (session_id=%s, remote=%s): %s",
+                        session_id, remote_session_id, remote.message,
+                    )
+            self._forget_status(session_id)
+
+            await conn.execute(
+                _INSERT_LOG_QUERY,
+                session_id, 98, "cancel", "Research session cancelled by user",
+            )
             
             return True
-        finally:
-            await conn.close()
+
+    @staticmethod
+    def _log_entry(row) -> Dict[str, Any]:
+        return {
+            "step_number": row["step_number"],
+            "step_type": row["step_type"],
+            "message": row["message"],
+            "data": row["data"],
+            "timestamp": row["created_at"].isoformat()
+        }
 
     async def get_research_logs(self, session_id: str) -> List[Dict[str, Any]]:
         """Get research logs for a session"""
-        conn = await self._get_db_connection()
-        
-        try:
-            rows = await conn.fetch("""
-                SELECT step_number, step_type, message, data, created_at
-                FROM public.research_logs 
-                WHERE session_id = $1
-                ORDER BY step_number ASC
-            """, session_id)
-            
-            return [
-                {
-                    "step_number": row["step_number"],
-                    "step_type": row["step_type"],
-                    "message": row["message"],
-                    "data": json.loads(row["data"]) if isinstance(row["data"], str) else row["data"],
-                    "timestamp": row["created_at"].isoformat()
-                }
-                for row in rows
-            ]
-        finally:
-            await conn.close()
+        async with self._connection() as conn:
+            rows = await conn.fetch(_LOGS_QUERY, session_id)
+            return [self._log_entry(row) for row in rows]
+
+    async def iter_research_logs(self, session_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """Yield a session's logs one at a time.
+
+        Reads through a server-side cursor, so memory stays flat however
+        long the log is. The connection is held until the iterator is
+        exhausted or closed.
+        """
+        async with self._connection() as conn:
+            # asyncpg cursors only exist inside a transaction.
+            async with conn.transaction():
+                async for row in conn.cursor(_LOGS_QUERY, session_id, prefetch=_LOGS_PREFETCH):
+                    yield self._log_entry(row)
 
     async def health_check(self) -> Dict[str, Any]:
-        """Check service health including database and research client"""
-        results = {
-            "database": "unknown",
-            "research_client": "unknown",
-            "active_tasks": len(self._active_tasks)
+        """Check service health including database and research client.
+
+        The probe results are cached for _HEALTH_TTL seconds and concurrent
+        callers share one probe, so frequent health polling costs at most
+        one DB round-trip and one researcher call per interval.
+        ``active_tasks`` is always current.
+        """
+        cached = self._health_cache
+        if cached is None or time.monotonic() >= cached[0]:
+            async with self._health_lock:
+                cached = self._health_cache
+                if cached is None or time.monotonic() >= cached[0]:
+                    cached = (time.monotonic() + _HEALTH_TTL, await self._probe_health())
+                    self._health_cache = cached
+        return {**cached[1], "active_tasks": len(self._active_tasks)}
+
+    async def _probe_health(self) -> Dict[str, Any]:
+        # The two probes are independent, so they run concurrently and
+        # the check takes as long as the slower one rather than the sum.
+        database, client = await asyncio.gather(
+            self._probe_database(),
+            self.research_client.health_check(),
+            return_exceptions=True,
+        )
+        return {
+            "database": (
+                f"unhealthy: {str(database)}"
+                if isinstance(database, Exception) else "healthy"
+            ),
+            "research_client": (
+                f"unhealthy: {str(client)}"
+                if isinstance(client, Exception) else client["status"]
+            ),
         }
-        
-        # Test database connection
-        try:
-            conn = await self._get_db_connection()
-            try:
-                await conn.fetchval("SELECT 1")
-            finally:
-                # close in finally — a probe failure post-connect used to
-                # leak the connection (every other site closes in finally).
-                await conn.close()
-            results["database"] = "healthy"
-        except Exception as e:
-            results["database"] = f"unhealthy: {str(e)}"
-        
-        # Test research client
-        try:
-            client_health = await self.research_client.health_check()
-            results["research_client"] = client_health["status"]
-        except Exception as e:
-            results["research_client"] = f"unhealthy: {str(e)}"
-        
-        return results
\ No newline at end of file
+
+    async def _probe_database(self) -> None:
+        async with self._connection() as conn:
+            await conn.fetchval("SELECT 1")
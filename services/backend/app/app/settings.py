@@ -0,0 +1,61 @@
+"""
+Process-wide backend configuration read from the environment.
+
+Everything main.py needs at import time is read and validated here once;
+``get_settings()`` returns the same frozen instance on every call.
+"""
+
+import os
+from functools import cached_property, lru_cache
+from typing import Tuple
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class Settings(BaseModel):
+    """Validated environment configuration for the backend."""
+    model_config = ConfigDict(frozen=True)
+
+    project_name: str = "atlas"
+    kong_url: str = Field(..., min_length=1)
+    service_key: str = Field(..., min_length=1)
+    # Maximum body size for /storage/upload, in bytes. Default 100 MiB
+    # matches Supabase Storage's default object cap.
+    max_upload_bytes: int = Field(100 * 1024 * 1024, gt=0)
+    # Browser origins allowed by CORSMiddleware (CORS_ORIGINS, comma
+    # separated). Kong fronts all browser traffic, hence the open default.
+    cors_origins: Tuple[str, ...] = ("*",)
+
+    @cached_property
+    def storage_url(self) -> str:
+        """Supabase Storage via Kong. The trailing slash matters: the
+        public-URL builder appends object paths to it directly. Built once
+        per instance."""
+        return f"{self.kong_url}/storage/v1/"
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Read and validate the backend's environment once per process.
+
+    Raises:
+        ValueError: if KONG_URL or SUPABASE_SERVICE_KEY is unset, or a
+            value fails validation (pydantic's ValidationError is a
+            ValueError).
+    """
+    kong_url = os.getenv("KONG_URL")
+    service_key = os.getenv("SUPABASE_SERVICE_KEY")
+    if not kong_url:
+        raise ValueError("KONG_URL environment variable is required")
+    if not service_key:
+        raise ValueError("SUPABASE_SERVICE_KEY environment variable is required")
+
+    values = {"kong_url": kong_url, "service_key": service_key}
+    if project_name := os.getenv("PROJECT_NAME"):
+        values["project_name"] = project_name
+    if max_upload_bytes := os.getenv("MAX_UPLOAD_BYTES"):
+        values["max_upload_bytes"] = max_upload_bytes
+    cors_origins = [o.strip() for o in os.getenv("CORS_ORIGINS", "").split(",")]
+    if any(cors_origins):
+        values["cors_origins"] = tuple(o for o in cors_origins if o)
+    return Settings(**values)
@@ -17,6 +17,7 @@ them when run from ``services/backend/app/app/``.
 
 from __future__ import annotations
 
+import asyncio
 import sys
 import os
 from pathlib import Path
@@ -32,6 +33,19 @@ if _APP_DIR not in sys.path:
     sys.path.insert(0, _APP_DIR)
 
 
+def run_coro(coro):
+    """Run ``coro`` to completion on a private event loop.
+
+    Not ``asyncio.run()``: that clears the thread's current loop, which
+    breaks later tests that still rely on ``asyncio.get_event_loop()``.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
 @pytest.fixture
 def ray_disabled_env(monkeypatch):
     """Force RAY_ADDRESS empty → RayClient raises RayDisabledError on any call."""
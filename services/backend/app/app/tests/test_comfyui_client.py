@@ -0,0 +1,482 @@
+"""Unit tests for ComfyUIClient (services/backend/app/app/comfyui_client.py).
+
+ComfyUI itself is never contacted: HTTP calls go through an
+``httpx.MockTransport`` and the websocket is replaced with an in-memory
+stand-in, so these run without the stack.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+import comfyui_client
+from comfyui_client import ComfyUIClient, ComfyUIError
+from tests.conftest import run_coro
+
+
+def _client_with(handler) -> ComfyUIClient:
+    client = ComfyUIClient(base_url="http://comfyui:18188")
+    client.client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+class _FakeWebSocket:
+    """Async-iterable stand-in for a websockets connection."""
+
+    def __init__(self, messages):
+        self._messages = list(messages)
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._messages:
+            # Keep the socket "open" until the test tears the client down.
+            await asyncio.sleep(3600)
+        await asyncio.sleep(0)
+        return self._messages.pop(0)
+
+    async def close(self):
+        self.closed = True
+
+
+def test_ws_url_follows_base_url_scheme():
+    client = ComfyUIClient(base_url="https://comfy.example.com/")
+    assert client._ws_url() == f"wss://comfy.example.com/ws?clientId={client.client_id}"
+    client = ComfyUIClient(base_url="http://comfyui:18188")
+    assert client._ws_url().startswith("ws://comfyui:18188/ws?clientId=")
+
+
+def test_aclose_leaves_injected_transport_open():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+    shared = ComfyUIClient(base_url="http://comfyui:18188", transport=transport)
+    owned = ComfyUIClient(base_url="http://comfyui:18188")
+
+    async def run():
+        await shared.aclose()
+        await owned.aclose()
+        # The shared pool still serves requests after one user closes.
+        return await shared.get_queue_status()
+
+    assert run_coro(run()) == {}
+    assert shared.client.is_closed is False
+    assert owned.client.is_closed is True
+
+
+def test_queue_prompt_uses_instance_client_id():
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.update(json.loads(request.content))
+        return httpx.Response(200, json={"prompt_id": "p1", "number": 0})
+
+    async def run():
+        client = _client_with(handler)
+        result = await client.queue_prompt({"1": {}})
+        await client.aclose()
+        return client, result
+
+    client, result = run_coro(run())
+    assert result["success"] is True
+    assert seen["client_id"] == client.client_id == result["client_id"]
+
+
+def test_queue_prompt_concurrency_is_bounded(monkeypatch):
+    monkeypatch.setenv("COMFYUI_MAX_INFLIGHT", "2")
+    state = {"active": 0, "peak": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        return httpx.Response(200, json={"prompt_id": "p", "number": 0})
+
+    async def run():
+        client = _client_with(handler)
+        try:
+            return await asyncio.gather(*(client.queue_prompt({}) for _ in range(6)))
+        finally:
+            await client.aclose()
+
+    results = run_coro(run())
+    assert all(r["success"] for r in results)
+    assert state["peak"] == 2
+
+
+def test_idempotent_gets_retry_transient_upstream_errors():
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise httpx.ReadError("connection reset", request=request)
+        if calls["n"] == 2:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"queue_running": [], "queue_pending": []})
+
+    async def run():
+        client = _client_with(handler)
+        try:
+            return await client.get_queue_status()
+        finally:
+            await client.aclose()
+
+    assert run_coro(run()) == {"queue_running": [], "queue_pending": []}
+    assert calls["n"] == 3
+
+
+@pytest.mark.parametrize("error", [httpx.ConnectError, httpx.ConnectTimeout])
+def test_connect_failures_are_left_to_the_transport(error):
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        raise error("unreachable", request=request)
+
+    async def run():
+        client = _client_with(handler)
+        try:
+            return await client.health_check()
+        finally:
+            await client.aclose()
+
+    assert run_coro(run())["status"] == "unhealthy"
+    # One attempt per health check; the real transport retries connects.
+    assert calls["n"] == 1
+
+
+def test_queue_prompt_is_not_retried():
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        return httpx.Response(503)
+
+    async def run():
+        client = _client_with(handler)
+        try:
+            return await client.queue_prompt({})
+        finally:
+            await client.aclose()
+
+    assert run_coro(run())["success"] is False
+    assert calls["n"] == 1
+
+
+def test_generate_simple_image_patches_copy_of_template():
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(json.loads(request.content)["prompt"])
+        return httpx.Response(200, json={"prompt_id": "p1", "number": 0})
+
+    async def run():
+        client = _client_with(handler)
+        try:
+            await client.generate_simple_image("a cat", width=768, seed=42, checkpoint="x.safetensors")
+            return await client.generate_simple_image("a dog")
+        finally:
+            await client.aclose()
+
+    result = run_coro(run())
+    first, second = sent
+    assert first["1"]["inputs"]["ckpt_name"] == "x.safetensors"
+    assert first["2"]["inputs"]["text"] == "a cat"
+    assert first["4"]["inputs"]["seed"] == 42
+    assert first["5"]["inputs"]["width"] == 768
+    # The second call must not see the first call's values.
+    assert second["2"]["inputs"]["text"] == "a dog"
+    assert second["5"]["inputs"]["width"] == 512
+    assert second["4"]["inputs"]["seed"] == result["parameters"]["seed"]
+    assert comfyui_client._SIMPLE_WORKFLOW_TEMPLATE["2"]["inputs"]["text"] == ""
+
+
+def test_get_history_scopes_requests():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.url.path, dict(request.url.params)))
+        return httpx.Response(200, json={})
+
+    async def run():
+        client = _client_with(handler)
+        try:
+            await client.get_history("p1")
+            await client.get_history(max_items=5)
+        finally:
+            await client.aclose()
+
+    run_coro(run())
+    assert seen == [("/history/p1", {}), ("/history", {"max_items": "5"})]
+
+
+def test_wait_for_completion_falls_back_to_polling(monkeypatch):
+    """No websocket → history is polled until the prompt shows outputs."""
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/history/p1"
+        calls["n"] += 1
+        if calls["n"] < 2:
+            return httpx.Response(200, json={})
+        return httpx.Response(200, json={"p1": {"outputs": {"7": {}}, "status": {}}})
+
+    async def refuse(*args, **kwargs):
+        raise OSError("connection refused")
+
+    monkeypatch.setattr(comfyui_client.websockets, "connect", refuse)
+
+    async def run():
+        client = _client_with(handler)
+        try:
+            return await client.wait_for_completion("p1", timeout=30)
+        finally:
+            await client.aclose()
+
+    started = time.monotonic()
+    result = run_coro(run())
+    assert result["success"] is True
+    assert result["outputs"] == {"7": {}}
+    assert calls["n"] == 2
+    # First re-poll comes after the short initial backoff, not a full second.
+    assert time.monotonic() - started < 0.9
+
+
+def test_wait_for_completion_wakes_on_websocket_event(monkeypatch):
+    """An ``executing`` event with node=None triggers the final history read."""
+    holder = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        # History only reports the prompt once the websocket said it's done.
+        events = holder["client"]._completion_events.get("p1", ())
+        if any(event.is_set() for event in events):
+            return httpx.Response(200, json={"p1": {"outputs": {}, "status": {}}})
+        return httpx.Response(200, json={})
+
+    ws = _FakeWebSocket([
+        json.dumps({"type": "executing", "data": {"node": "4", "prompt_id": "p1"}}),
+        json.dumps({"type": "executing", "data": {"node": None, "prompt_id": "p1"}}),
+    ])
+
+    async def connect(*args, **kwargs):
+        return ws
+
+    monkeypatch.setattr(comfyui_client.websockets, "connect", connect)
+
+    async def run():
+        client = holder["client"] = _client_with(handler)
+        try:
+            return await asyncio.wait_for(client.wait_for_completion("p1", timeout=30), 5)
+        finally:
+            await client.aclose()
+
+    result = run_coro(run())
+    assert result["success"] is True
+    assert ws.closed is True
+
+
+def test_waiter_leaving_does_not_strand_others_on_same_prompt(monkeypatch):
+    done = {"v": False}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if done["v"]:
+            return httpx.Response(200, json={"p1": {"outputs": {}, "status": {}}})
+        return httpx.Response(200, json={})
+
+    class _QueuedWebSocket(_FakeWebSocket):
+        def __init__(self):
+            super().__init__([])
+            self.queue = asyncio.Queue()
+
+        async def __anext__(self):
+            return await self.queue.get()
+
+    ws = _QueuedWebSocket()
+
+    async def connect(*args, **kwargs):
+        return ws
+
+    monkeypatch.setattr(comfyui_client.websockets, "connect", connect)
+
+    async def run():
+        client = _client_with(handler)
+        try:
+            patient = asyncio.ensure_future(client.wait_for_completion("p1", timeout=30))
+            # A second waiter on the same prompt gives up first.
+            impatient = await client.wait_for_completion("p1", timeout=0.05)
+            assert impatient["success"] is False
+            done["v"] = True
+            ws.queue.put_nowait(
+                json.dumps({"type": "execution_success", "data": {"prompt_id": "p1"}})
+            )
+            return await asyncio.wait_for(patient, 2)
+        finally:
+            await client.aclose()
+
+    assert run_coro(run())["success"] is True
+
+
+
+def test_get_models_is_cached_until_invalidated(monkeypatch):
+    calls = {"n": 0}
+    object_info = {
+        "CheckpointLoaderSimple": {"input": {"required": {"ckpt_name": [["a.safetensors"]]}}},
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/object_info"
+        calls["n"] += 1
+        return httpx.Response(200, json=object_info)
+
+    async def run():
+        client = _client_with(handler)
+        try:
+            # Concurrent cold-cache callers share one upstream fetch.
+            first, second = await asyncio.gather(client.get_models(), client.get_models())
+            assert first == second == {"checkpoints": ["a.safetensors"]}
+            assert calls["n"] == 1
+            client.invalidate_models_cache()
+            await client.get_models()
+            assert calls["n"] == 2
+            # Past the TTL the listing is fetched again.
+            now = time.monotonic()
+            monkeypatch.setattr(
+                comfyui_client.time, "monotonic", lambda: now + client._models_ttl + 1
+            )
+            await client.get_models()
+            assert calls["n"] == 3
+        finally:
+            await client.aclose()
+
+    run_coro(run())
+
+
+def test_get_models_failure_is_not_cached():
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        return httpx.Response(500)
+
+    async def run():
+        client = _client_with(handler)
+        try:
+            assert await client.get_models() == {}
+            assert await client.get_models() == {}
+        finally:
+            await client.aclose()
+
+    run_coro(run())
+    assert calls["n"] == 2
+
+
+def test_stream_image_yields_bounded_chunks():
+    payload = bytes(range(256)) * 1024  # 256 KiB
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/view"
+        assert request.url.params["filename"] == "out.png"
+        return httpx.Response(200, content=payload)
+
+    async def run():
+        client = _client_with(handler)
+        try:
+            chunks = [c async for c in client.stream_image("out.png", chunk_size=64 * 1024)]
+            data = await client.get_image_data("out.png")
+            return chunks, data
+        finally:
+            await client.aclose()
+
+    chunks, data = run_coro(run())
+    assert max(len(c) for c in chunks) <= 64 * 1024
+    assert b"".join(chunks) == payload == data
+
+
+def test_queue_prompt_rejection_keeps_status_and_payload():
+    body = {"error": {"type": "prompt_outputs_failed_validation"}, "node_errors": {"4": {}}}
+
+    async def run():
+        client = _client_with(lambda request: httpx.Response(400, json=body))
+        try:
+            return await client.queue_prompt({})
+        finally:
+            await client.aclose()
+
+    result = run_coro(run())
+    assert result["success"] is False
+    assert result["status_code"] == 400
+    assert result["payload"] == body
+
+
+def test_stream_image_raises_comfyui_error_with_status():
+    async def run():
+        client = _client_with(lambda request: httpx.Response(404, text="not found"))
+        try:
+            async for _chunk in client.stream_image("missing.png"):
+                pass
+        finally:
+            await client.aclose()
+
+    with pytest.raises(ComfyUIError) as excinfo:
+        run_coro(run())
+    assert excinfo.value.status_code == 404
+    assert excinfo.value.payload == "not found"
+
+
+def test_get_images_data_downloads_concurrently_in_order():
+    state = {"active": 0, "peak": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        return httpx.Response(200, content=request.url.params["filename"].encode())
+
+    async def run():
+        client = _client_with(handler)
+        try:
+            specs = [(f"img{i}.png", "", "output") for i in range(5)]
+            return await client.get_images_data(specs, concurrency=3)
+        finally:
+            await client.aclose()
+
+    assert run_coro(run()) == [f"img{i}.png".encode() for i in range(5)]
+    # Downloads overlap, up to the concurrency bound.
+    assert state["peak"] == 3
+
+
+def test_cancel_prompt_interrupts_only_running_prompt():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, request.url.path, request.content))
+        if request.method == "GET":
+            return httpx.Response(200, json={"queue_running": [[0, "p1"]], "queue_pending": []})
+        # ComfyUI answers both POSTs with an empty body.
+        return httpx.Response(200)
+
+    async def run():
+        client = _client_with(handler)
+        try:
+            return await client.cancel_prompt("p1"), await client.cancel_prompt("p2")
+        finally:
+            await client.aclose()
+
+    assert run_coro(run()) == (True, True)
+    posts = [(path, body) for method, path, body in seen if method == "POST"]
+    assert posts == [
+        ("/queue", b'{"delete":["p1"]}'),
+        ("/interrupt", b""),
+        ("/queue", b'{"delete":["p2"]}'),
+    ]
+
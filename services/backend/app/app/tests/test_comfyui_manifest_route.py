@@ -190,3 +190,39 @@ def test_get_models_corrupt_manifest_returns_empty_list(monkeypatch, tmp_path):
     body = resp.json()
     assert body["success"] is True
     assert body["models"] == []
+
+
+def test_get_models_reparses_only_when_manifest_changes(monkeypatch, manifest_file):
+    """The parsed manifest is reused until the file's mtime/size change."""
+    _stub_required_env(monkeypatch)
+    monkeypatch.setenv("COMFYUI_MANIFEST_PATH", str(manifest_file))
+
+    from fastapi.testclient import TestClient
+    import sys
+    if "main" in sys.modules:
+        main = sys.modules["main"]
+    else:
+        import main  # type: ignore[import]
+
+    parses = []
+    real_safe_load = main.yaml.safe_load
+
+    def counting_safe_load(stream):
+        parses.append(1)
+        return real_safe_load(stream)
+
+    monkeypatch.setattr(main.yaml, "safe_load", counting_safe_load)
+    client = TestClient(main.app)
+
+    for _ in range(3):
+        assert len(client.get("/comfyui/db/models").json()["models"]) == 2
+    assert len(parses) == 1
+
+    # The bootstrapper rewrites the manifest on the next stack start.
+    manifest_file.write_text(
+        "models:\n  - name: Only\n    active: true\n", encoding="utf-8"
+    )
+    st = manifest_file.stat()
+    os.utime(manifest_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert [m["name"] for m in client.get("/comfyui/db/models").json()["models"]] == ["Only"]
+    assert len(parses) == 2
@@ -1,5 +1,6 @@
-"""App-level behavior in main.py: research/start user_id validation and the
-lifespan shutdown that closes the long-lived n8n client.
+"""App-level behavior in main.py: research/start user_id validation, the
+lifespan shutdown that closes the long-lived n8n client, storage upload
+size limits, and streaming of ComfyUI images.
 
 Backend has no auth dependency (Kong gates external access at the edge),
 so these tests don't override any auth dependency.
@@ -7,8 +8,10 @@ so these tests don't override any auth dependency.
 
 from __future__ import annotations
 
+import json
 import os
 
+import httpx
 import pytest
 
 
@@ -24,6 +27,27 @@ def _stub_required_env(monkeypatch):
             monkeypatch.setenv(var, default)
 
 
+def test_constant_endpoints_serve_precomputed_bodies(monkeypatch):
+    _stub_required_env(monkeypatch)
+    from fastapi.testclient import TestClient
+    import main
+
+    client = TestClient(main.app)
+    resp = client.get("/health")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/json"
+    assert resp.json() == {"status": "healthy", "version": "0.1.0"}
+
+    resp = client.get("/")
+    assert resp.json() == {
+        "message": f"Welcome to the {main.PROJECT_NAME} Backend API",
+        "docs_url": "/docs",
+    }
+    # Still documented in the OpenAPI schema.
+    schema = client.get("/openapi.json").json()
+    assert "HealthResponse" in schema["components"]["schemas"]
+
+
 def test_research_start_rejects_non_uuid_user_id(monkeypatch):
     """POST /research/start with a non-UUID user_id returns a clean 400,
     not an opaque 500 from UUID() deep inside research_service."""
@@ -40,6 +64,146 @@ def test_research_start_rejects_non_uuid_user_id(monkeypatch):
     assert "user_id" in resp.json()["detail"]
 
 
+def test_research_start_returns_503_when_busy(monkeypatch):
+    _stub_required_env(monkeypatch)
+    from fastapi.testclient import TestClient
+    import main
+
+    async def busy(**kwargs):
+        raise main.ResearchBusyError("Too many research sessions running")
+
+    monkeypatch.setattr(main.research_service, "start_research", busy)
+
+    resp = TestClient(main.app).post("/research/start", json={"query": "q"})
+    assert resp.status_code == 503
+    assert resp.headers["retry-after"] == "5"
+
+
+def test_upstream_failures_map_to_typed_statuses(monkeypatch):
+    _stub_required_env(monkeypatch)
+    from fastapi.testclient import TestClient
+    import main
+
+    async def db_down(session_id):
+        raise ConnectionRefusedError("connect failed: secret-host:5432")
+
+    async def n8n_error():
+        request = httpx.Request("GET", "http://n8n:5678/api/v1/workflows")
+        raise httpx.HTTPStatusError(
+            "boom", request=request, response=httpx.Response(500, request=request)
+        )
+
+    async def bug(session_id):
+        raise KeyError("status")
+
+    async def local_file_missing():
+        raise FileNotFoundError("/app/missing.json")
+
+    monkeypatch.setattr(main.research_service, "get_research_status", db_down)
+    monkeypatch.setattr(main.n8n_client, "list_workflows", n8n_error)
+    monkeypatch.setattr(main.research_service, "get_research_result", bug)
+    monkeypatch.setattr(main.comfyui_client, "get_models", local_file_missing)
+    client = TestClient(main.app, raise_server_exceptions=False)
+    session = "11111111-1111-1111-1111-111111111111"
+
+    resp = client.get(f"/research/{session}/status")
+    assert resp.status_code == 503
+    # The cause is logged, not echoed to the client.
+    assert resp.json()["detail"] == "Upstream service unavailable"
+
+    assert client.get("/workflows").status_code == 502
+    # Bugs are not swallowed into a typed error; FastAPI's handler 500s.
+    assert client.get(f"/research/{session}/result").status_code == 500
+    # A local OSError is not an upstream outage either.
+    assert client.get("/comfyui/models").status_code == 500
+
+
+def test_research_lists_keep_their_response_shape(monkeypatch):
+    _stub_required_env(monkeypatch)
+    from fastapi.testclient import TestClient
+    import main
+
+    logs = [
+        {
+            "step_number": 1,
+            "step_type": "init",
+            "message": "Research session created",
+            "data": {"query": "q"},
+            "timestamp": "2024-01-01T00:00:00+00:00",
+        }
+    ]
+    sessions = [
+        {
+            "session_id": "11111111-1111-1111-1111-111111111111",
+            "query": "q",
+            "status": "running",
+            "max_loops": 3,
+            "search_api": "duckduckgo",
+            "created_at": "2024-01-01T00:00:00+00:00",
+            "started_at": None,
+            "completed_at": None,
+        }
+    ]
+
+    async def fake_logs(session_id):
+        return logs
+
+    async def fake_sessions(**kwargs):
+        return sessions
+
+    monkeypatch.setattr(main.research_service, "get_research_logs", fake_logs)
+    monkeypatch.setattr(main.research_service, "list_user_sessions", fake_sessions)
+
+    client = TestClient(main.app)
+    resp = client.get("/research/11111111-1111-1111-1111-111111111111/logs")
+    assert resp.status_code == 200
+    assert resp.json() == logs
+
+    resp = client.get("/research/sessions")
+    assert resp.status_code == 200
+    assert resp.json() == [{**sessions[0], "user_id": None, "error_message": None}]
+    # A short page has no next page.
+    assert "x-next-cursor" not in resp.headers
+
+    resp = client.get("/research/sessions", params={"limit": 1})
+    cursor = resp.headers["x-next-cursor"]
+    assert main.decode_session_cursor(cursor)[1].hex == "1" * 32
+
+    resp = client.get("/research/sessions", params={"cursor": "bogus"})
+    assert resp.status_code == 400
+    # Paging bounds are enforced by the query validators, not clamped.
+    resp = client.get("/research/sessions", params={"limit": 101})
+    assert resp.status_code == 422
+
+
+def test_research_logs_stream_as_ndjson(monkeypatch):
+    _stub_required_env(monkeypatch)
+    from fastapi.testclient import TestClient
+    import main
+
+    closed = {"v": False}
+
+    async def fake_iter_logs(session_id):
+        try:
+            for step in (1, 2):
+                yield {"step_number": step, "step_type": "t", "message": "m",
+                       "data": None, "timestamp": "2024-01-01T00:00:00+00:00"}
+        finally:
+            closed["v"] = True
+
+    monkeypatch.setattr(main.research_service, "iter_research_logs", fake_iter_logs)
+
+    resp = TestClient(main.app).get(
+        "/research/11111111-1111-1111-1111-111111111111/logs",
+        headers={"Accept": "application/x-ndjson"},
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    lines = resp.text.splitlines()
+    assert [json.loads(line)["step_number"] for line in lines] == [1, 2]
+    assert closed["v"] is True
+
+
 def test_lifespan_closes_n8n_client(monkeypatch):
     """App shutdown awaits n8n_client.aclose() so httpx doesn't leak the
     process-lifetime client on reload/shutdown."""
@@ -58,3 +222,174 @@ def test_lifespan_closes_n8n_client(monkeypatch):
     with TestClient(main.app):
         pass
     assert closed["v"] is True
+
+
+def test_memory_service_shares_the_app_transport(monkeypatch):
+    _stub_required_env(monkeypatch)
+    from fastapi.testclient import TestClient
+    import main
+
+    assert main.memory_service._http._transport is main.http_transport
+
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.url.path)
+        return httpx.Response(
+            200, json={"choices": [{"message": {"content": "ok"}}]}
+        )
+
+    monkeypatch.setattr(
+        main.memory_service,
+        "_http",
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    closed = {"v": False}
+
+    async def fake_aclose():
+        closed["v"] = True
+
+    monkeypatch.setattr(main.memory_service, "aclose", fake_aclose)
+    # The lifespan shutdown closes the memory client with the others.
+    with TestClient(main.app) as client:
+        content = client.portal.call(
+            main.memory_service._litellm_complete, "m", "hi"
+        )
+    assert content == "ok"
+    assert sent == ["/v1/chat/completions"]
+    assert closed["v"] is True
+
+
+def _mock_comfyui(monkeypatch, handler):
+    import main
+
+    monkeypatch.setattr(
+        main.comfyui_client,
+        "client",
+        httpx.AsyncClient(
+            base_url=main.comfyui_client.base_url,
+            transport=httpx.MockTransport(handler),
+        ),
+    )
+
+
+def test_comfyui_queue_passthrough_is_orjson_encoded(monkeypatch):
+    _stub_required_env(monkeypatch)
+    from fastapi.testclient import TestClient
+    import main
+
+    queue = {"queue_running": [[0, "p1", {"1": {}}]], "queue_pending": []}
+    _mock_comfyui(monkeypatch, lambda request: httpx.Response(200, json=queue))
+
+    resp = TestClient(main.app).get("/comfyui/queue")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/json"
+    assert resp.json() == {"success": True, "queue": queue}
+
+
+def test_comfyui_image_is_streamed(monkeypatch):
+    _stub_required_env(monkeypatch)
+    from fastapi.testclient import TestClient
+    import main
+
+    payload = b"\x89PNG" + b"x" * 200_000
+    _mock_comfyui(
+        monkeypatch, lambda request: httpx.Response(200, content=payload)
+    )
+
+    resp = TestClient(main.app).get("/comfyui/image/out.webp")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "image/webp"
+    assert resp.content == payload
+
+
+def test_comfyui_image_missing_returns_404(monkeypatch):
+    _stub_required_env(monkeypatch)
+    from fastapi.testclient import TestClient
+    import main
+
+    _mock_comfyui(monkeypatch, lambda request: httpx.Response(404))
+
+    resp = TestClient(main.app).get("/comfyui/image/missing.png")
+    assert resp.status_code == 404
+    assert "missing.png" in resp.json()["detail"]
+
+
+def _mock_storage(monkeypatch, uploads, reply=None):
+    import main
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        uploads.append(
+            (
+                request.url.raw_path.decode(),
+                request.headers["content-type"],
+                await request.aread(),
+            )
+        )
+        return reply or httpx.Response(200, json={"Key": "ok"})
+
+    monkeypatch.setattr(
+        main,
+        "storage_http",
+        httpx.AsyncClient(
+            base_url=main.storage_url, transport=httpx.MockTransport(handler)
+        ),
+    )
+
+
+def test_storage_upload_rejects_oversized_file_before_upload(monkeypatch):
+    _stub_required_env(monkeypatch)
+    from fastapi.testclient import TestClient
+    import main
+
+    uploads = []
+    _mock_storage(monkeypatch, uploads)
+    monkeypatch.setattr(main, "MAX_UPLOAD_BYTES", 16)
+
+    client = TestClient(main.app)
+    resp = client.post("/storage/upload", files={"file": ("big.bin", b"x" * 17)})
+    assert resp.status_code == 413
+    assert uploads == []
+
+
+def test_storage_upload_streams_file_to_storage(monkeypatch):
+    _stub_required_env(monkeypatch)
+    from fastapi.testclient import TestClient
+    import main
+
+    uploads = []
+    _mock_storage(monkeypatch, uploads)
+    monkeypatch.setattr(main, "UPLOAD_CHUNK_BYTES", 4)
+
+    client = TestClient(main.app)
+    resp = client.post(
+        "/storage/upload",
+        params={"bucket": "media"},
+        files={"file": ("my notes.txt", b"hello world", "text/plain")},
+    )
+    assert resp.status_code == 200
+    assert resp.json()["url"] == (
+        f"{main.storage_url}object/public/media/my%20notes.txt"
+    )
+    assert uploads == [
+        ("/storage/v1/object/media/my%20notes.txt", "text/plain", b"hello world")
+    ]
+
+
+def test_storage_upload_reports_storage_error_message(monkeypatch):
+    _stub_required_env(monkeypatch)
+    from fastapi.testclient import TestClient
+    import main
+
+    reply = httpx.Response(
+        409,
+        json={"statusCode": "409", "error": "Duplicate", "message": "The resource already exists"},
+    )
+    _mock_storage(monkeypatch, [], reply=reply)
+
+    resp = TestClient(main.app).post(
+        "/storage/upload", files={"file": ("dup.txt", b"x", "text/plain")}
+    )
+    assert resp.status_code == 500
+    assert resp.json()["detail"] == "The resource already exists"
+
@@ -0,0 +1,80 @@
+"""Unit tests for N8nClient (services/backend/app/app/n8n_client.py).
+
+n8n itself is never contacted: HTTP calls go through an
+``httpx.MockTransport``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from n8n_client import N8nClient
+from tests.conftest import run_coro
+
+
+def _client_with(handler) -> N8nClient:
+    return N8nClient(
+        base_url="http://n8n:5678", transport=httpx.MockTransport(handler)
+    )
+
+
+def test_concurrent_workflow_misses_share_one_fetch():
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"id": "w1", "name": "W", "active": True})
+
+    client = _client_with(handler)
+
+    async def run():
+        results = await asyncio.gather(*(client.get_workflow("w1") for _ in range(5)))
+        again = await client.get_workflow("w1")
+        return results, again
+
+    results, again = run_coro(run())
+    assert calls == ["/api/v1/workflows/w1"]
+    assert all(r["id"] == "w1" for r in results)
+    assert again == results[0]
+
+
+def test_workflow_list_is_cached_until_invalidated():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"data": [{"id": "w1"}], "nextCursor": None})
+
+    client = _client_with(handler)
+
+    async def run():
+        first = await client.list_workflows()
+        await client.list_workflows()
+        client.invalidate_workflow_cache()
+        await client.list_workflows()
+        return first
+
+    assert run_coro(run()) == [{"id": "w1"}]
+    assert calls == ["/api/v1/workflows", "/api/v1/workflows"]
+
+
+def test_missing_workflow_is_not_cached():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(404, json={"message": "not found"})
+
+    client = _client_with(handler)
+
+    async def run():
+        for _ in range(2):
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get_workflow("gone")
+
+    run_coro(run())
+    assert len(calls) == 2
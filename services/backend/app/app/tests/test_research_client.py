@@ -0,0 +1,107 @@
+"""Unit tests for ResearchClient (services/backend/app/app/research_client.py).
+
+local-deep-researcher is never contacted: HTTP calls go through an
+``httpx.MockTransport``.
+"""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+import research_client
+from research_client import ResearchClient, ResearchStatus
+from tests.conftest import run_coro
+
+
+def test_calls_share_one_client_over_injected_transport():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, request.url.path))
+        return httpx.Response(200, json={"status": "running"})
+
+    client = ResearchClient(
+        base_url="http://researcher:2024",
+        transport=httpx.MockTransport(handler),
+    )
+
+    async def run():
+        first = await client.get_research_status("s1")
+        second = await client.get_research_status("s2")
+        await client.aclose()
+        return first, second
+
+    first, second = run_coro(run())
+    assert first.status is ResearchStatus.RUNNING
+    assert second.status is ResearchStatus.RUNNING
+    assert seen == [
+        ("GET", "/research/s1/status"),
+        ("GET", "/research/s2/status"),
+    ]
+    # An injected transport belongs to the caller; aclose() leaves it open.
+    assert client._client.is_closed is False
+
+
+def test_aclose_closes_owned_client():
+    client = ResearchClient(base_url="http://researcher:2024")
+    run_coro(client.aclose())
+    assert client._client.is_closed is True
+
+
+def test_wait_for_completion_backs_off_between_polls(monkeypatch):
+    statuses = iter(["running", "running", "running", "completed"])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"status": next(statuses)})
+
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(research_client.asyncio, "sleep", fake_sleep)
+    client = ResearchClient(
+        base_url="http://researcher:2024",
+        transport=httpx.MockTransport(handler),
+    )
+
+    result = run_coro(client.wait_for_completion("s1", poll_interval=0.15))
+    assert result.status is ResearchStatus.COMPLETED
+    # Starts short, grows by the backoff factor, capped at poll_interval.
+    assert sleeps == pytest.approx([0.1, 0.13, 0.15])
+
+
+def test_stream_research_logs_parses_sse_frames():
+    body = (
+        'data: {"step": 1}\r\n\r\n'
+        ": keep-alive\n\n"
+        "data: not-json\n\n"
+        'data: {"step": 2}\n\n'
+        "event: close\n\n"
+        'data: {"step": 3}\n\n'
+    )
+
+    class _Chunked(httpx.AsyncByteStream):
+        # Small chunks so frames straddle chunk boundaries.
+        async def __aiter__(self):
+            raw = body.encode()
+            for i in range(0, len(raw), 7):
+                yield raw[i:i + 7]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/research/s1/logs/stream"
+        return httpx.Response(
+            200, stream=_Chunked(), headers={"content-type": "text/event-stream"}
+        )
+
+    client = ResearchClient(
+        base_url="http://researcher:2024",
+        transport=httpx.MockTransport(handler),
+    )
+
+    async def run():
+        return [event async for event in client.stream_research_logs("s1")]
+
+    # Malformed frames are skipped and "event: close" ends the stream.
+    assert run_coro(run()) == [{"step": 1}, {"step": 2}]
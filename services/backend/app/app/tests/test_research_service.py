@@ -0,0 +1,431 @@
+"""Unit tests for ResearchService's status/result memoization
+(services/backend/app/app/research_service.py).
+
+Postgres is never contacted: ``_get_pool`` is replaced with a pool that
+hands out an in-memory connection counting queries.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import pytest
+
+import research_service
+from research_client import ResearchResponse, ResearchStatus
+from research_service import ResearchService
+from tests.conftest import run_coro
+
+
+class _FakeConnection:
+    def __init__(self, row):
+        self.row = row
+        self.queries = 0
+        self.transactions = 0
+        self.in_transaction = False
+
+    async def fetchrow(self, query, *args):
+        self.queries += 1
+        return self.row
+
+    async def execute(self, query, *args):
+        return "UPDATE 1"
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.transactions += 1
+        self.in_transaction = True
+        try:
+            yield
+        finally:
+            self.in_transaction = False
+
+
+class _FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+        self.acquired = 0
+        self.closed = False
+
+    @asynccontextmanager
+    async def acquire(self, timeout=None):
+        self.acquired += 1
+        yield self.conn
+
+    async def close(self):
+        self.closed = True
+
+
+def _session_row(status):
+    return {
+        "id": "11111111-1111-1111-1111-111111111111",
+        "query": "q",
+        "status": status,
+        "max_loops": 3,
+        "search_api": "duckduckgo",
+        "user_id": None,
+        "created_at": datetime.now(timezone.utc),
+        "updated_at": None,
+        "started_at": None,
+        "completed_at": None,
+        "error_message": None,
+    }
+
+
+def _service(monkeypatch, conn) -> ResearchService:
+    monkeypatch.setenv("DATABASE_URL", "postgresql://x:x@localhost/x")
+    service = ResearchService()
+    pool = _FakePool(conn)
+
+    async def get_pool():
+        return pool
+
+    monkeypatch.setattr(service, "_get_pool", get_pool)
+    return service
+
+
+def test_terminal_status_is_memoized(monkeypatch):
+    conn = _FakeConnection(_session_row("completed"))
+    service = _service(monkeypatch, conn)
+
+    async def run():
+        for _ in range(3):
+            result = await service.get_research_status("s1")
+        return result
+
+    assert run_coro(run())["status"] == "completed"
+    assert conn.queries == 1
+
+
+def test_running_status_expires_after_ttl(monkeypatch):
+    conn = _FakeConnection(_session_row("running"))
+    service = _service(monkeypatch, conn)
+
+    async def run():
+        await service.get_research_status("s1")
+        await service.get_research_status("s1")
+        monkeypatch.setattr(research_service, "_STATUS_TTL", 0.0)
+        service._forget_status("s1")
+        await service.get_research_status("s1")
+        await service.get_research_status("s1")
+
+    run_coro(run())
+    # Two within the TTL collapse; with a zero TTL every call hits the DB.
+    assert conn.queries == 3
+
+
+def test_cancel_invalidates_cached_status(monkeypatch):
+    conn = _FakeConnection(_session_row("running"))
+    service = _service(monkeypatch, conn)
+
+    async def run():
+        await service.get_research_status("s1")
+        assert await service.cancel_research("s1") is True
+        conn.row = _session_row("cancelled")
+        return await service.get_research_status("s1")
+
+    assert run_coro(run())["status"] == "cancelled"
+
+
+def test_missing_result_is_not_memoized(monkeypatch):
+    conn = _FakeConnection(None)
+    service = _service(monkeypatch, conn)
+
+    async def run():
+        assert await service.get_research_result("s1") is None
+        assert await service.get_research_result("s1") is None
+
+    run_coro(run())
+    assert conn.queries == 2
+
+
+def test_concurrent_status_polls_share_one_read(monkeypatch):
+    conn = _FakeConnection(_session_row("running"))
+    service = _service(monkeypatch, conn)
+    real_fetchrow = conn.fetchrow
+
+    async def slow_fetchrow(query, *args):
+        await asyncio.sleep(0.01)
+        return await real_fetchrow(query, *args)
+
+    conn.fetchrow = slow_fetchrow
+
+    async def run():
+        return await asyncio.gather(
+            *(service.get_research_status("s1") for _ in range(10))
+        )
+
+    results = run_coro(run())
+    assert conn.queries == 1
+    assert all(r["status"] == "running" for r in results)
+    assert service._status_fetches == {}
+
+
+def test_session_cursor_pages_by_keyset(monkeypatch):
+    seen = {}
+
+    class _ListConnection(_FakeConnection):
+        async def fetch(self, query, *args):
+            seen["query"], seen["args"] = query, args
+            return []
+
+    service = _service(monkeypatch, _ListConnection(None))
+    page = [{
+        "session_id": "11111111-1111-1111-1111-111111111111",
+        "created_at": "2024-01-01T00:00:00+00:00",
+    }]
+    cursor = research_service.encode_session_cursor(page[-1])
+
+    run_coro(service.list_user_sessions(limit=10, offset=40, cursor=cursor))
+    assert "(created_at, id) < ($1, $2)" in seen["query"]
+    assert "ORDER BY created_at DESC, id DESC" in seen["query"]
+    created_at, last_id = research_service.decode_session_cursor(cursor)
+    # offset is ignored once a cursor is given.
+    assert seen["args"] == (created_at, last_id, 10, 0)
+
+
+def test_malformed_session_cursor_is_rejected():
+    with pytest.raises(ValueError):
+        research_service.decode_session_cursor("not-a-cursor")
+
+
+def test_start_research_rejects_past_concurrency_limit(monkeypatch):
+    monkeypatch.setenv("RESEARCH_MAX_CONCURRENCY", "1")
+    service = _service(monkeypatch, _FakeConnection(None))
+    release = asyncio.Event()
+
+    async def fake_background(*args):
+        await release.wait()
+
+    monkeypatch.setattr(service, "_run_research_background", fake_background)
+
+    async def run():
+        await service.start_research("first")
+        with pytest.raises(research_service.ResearchBusyError):
+            await service.start_research("second")
+        # The slot frees up once the running session's task ends.
+        release.set()
+        await asyncio.gather(*service._active_tasks.values())
+        await asyncio.sleep(0)
+        # Finished tasks drop themselves from the registry.
+        assert service._active_tasks == {}
+        return await service.start_research("third")
+
+    assert run_coro(run())["status"] == "pending"
+
+
+def test_pool_is_created_once_and_closed(monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "postgresql://x:x@localhost/x")
+    service = ResearchService()
+    pool = _FakePool(_FakeConnection(_session_row("running")))
+    created = []
+
+    async def create_pool(dsn, **kwargs):
+        created.append(dsn)
+        await asyncio.sleep(0)
+        return pool
+
+    monkeypatch.setattr(research_service.asyncpg, "create_pool", create_pool)
+
+    async def run():
+        # Concurrent first uses must not race into two pools.
+        await asyncio.gather(
+            service.get_research_status("s1"),
+            service.get_research_status("s2"),
+        )
+        assert await service.cancel_research("s1") is True
+        await service.aclose()
+
+    run_coro(run())
+    assert created == ["postgresql://x:x@localhost/x"]
+    assert pool.acquired == 3
+    assert pool.closed is True
+    assert service._pool is None
+
+
+def test_result_is_stored_in_one_transaction_with_batched_sources(monkeypatch):
+    calls = []
+
+    class _RecordingConnection(_FakeConnection):
+        async def execute(self, query, *args):
+            assert self.in_transaction
+            calls.append(("execute", query.split()[0]))
+            return "INSERT 0 1"
+
+        async def executemany(self, query, args):
+            assert self.in_transaction
+            calls.append(("executemany", len(args)))
+
+    conn = _RecordingConnection(None)
+    service = _service(monkeypatch, conn)
+    result = research_service.ResearchResult(
+        session_id="remote",
+        title="t",
+        summary="s",
+        content="c",
+        sources=[{"url": f"https://example.com/{i}"} for i in range(5)],
+        metadata={},
+    )
+
+    run_coro(service._store_research_result(conn, "s1", result))
+    assert calls.count(("executemany", 5)) == 1
+    assert [c for c in calls if c[0] == "execute"] == [
+        ("execute", "INSERT"), ("execute", "INSERT"), ("execute", "UPDATE"),
+    ]
+    assert conn.transactions == 1
+
+
+def test_concurrent_health_checks_share_one_probe(monkeypatch):
+    conn = _FakeConnection(None)
+    probes = []
+
+    async def fetchval(query):
+        probes.append("db")
+        await asyncio.sleep(0.01)
+        return 1
+
+    conn.fetchval = fetchval
+    service = _service(monkeypatch, conn)
+
+    async def client_health():
+        probes.append("client")
+        return {"status": "healthy"}
+
+    monkeypatch.setattr(service.research_client, "health_check", client_health)
+
+    async def run():
+        results = await asyncio.gather(*(service.health_check() for _ in range(5)))
+        results.append(await service.health_check())
+        return results
+
+    results = run_coro(run())
+    assert sorted(probes) == ["client", "db"]
+    assert all(r == {"database": "healthy", "research_client": "healthy",
+                     "active_tasks": 0} for r in results)
+
+
+def test_health_probes_run_concurrently(monkeypatch):
+    conn = _FakeConnection(None)
+    running = set()
+    overlapped = []
+
+    async def fetchval(query):
+        running.add("db")
+        await asyncio.sleep(0.01)
+        overlapped.append(running == {"db", "client"})
+        running.discard("db")
+        return 1
+
+    conn.fetchval = fetchval
+    service = _service(monkeypatch, conn)
+
+    async def client_health():
+        running.add("client")
+        await asyncio.sleep(0.01)
+        running.discard("client")
+        raise RuntimeError("researcher down")
+
+    monkeypatch.setattr(service.research_client, "health_check", client_health)
+
+    result = run_coro(service.health_check())
+    assert overlapped == [True]
+    assert result["database"] == "healthy"
+    assert result["research_client"] == "unhealthy: researcher down"
+
+
+def test_pooled_connections_decode_jsonb_with_orjson(monkeypatch):
+    codecs = {}
+
+    class _CodecConnection(_FakeConnection):
+        async def set_type_codec(self, typename, *, encoder, decoder, schema, **kw):
+            codecs[(schema, typename)] = (encoder, decoder)
+
+    run_coro(research_service._init_connection(_CodecConnection(None)))
+    encoder, decoder = codecs[("pg_catalog", "jsonb")]
+    assert encoder({"k": [1, "é"]}) == '{"k":[1,"é"]}'
+    assert decoder('{"k": 1}') == {"k": 1}
+
+    # Rows from the pool arrive decoded, so log entries pass data through.
+    entry = ResearchService._log_entry({
+        "step_number": 1,
+        "step_type": "start",
+        "message": "m",
+        "data": {"k": 1},
+        "created_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+    })
+    assert entry["data"] == {"k": 1}
+    assert entry["timestamp"] == "2024-01-01T00:00:00+00:00"
+
+
+def test_cancel_also_cancels_remote_session(monkeypatch):
+    service = _service(monkeypatch, _FakeConnection(_session_row("running")))
+    service._remote_ids["s1"] = "remote-1"
+    cancelled = []
+
+    async def remote_cancel(remote_id):
+        cancelled.append(remote_id)
+        return ResearchResponse(
+            session_id=remote_id,
+            status=ResearchStatus.FAILED,
+            message="researcher down",
+        )
+
+    monkeypatch.setattr(service.research_client, "cancel_research", remote_cancel)
+
+    # A failed remote cancel is logged; the local cancel still succeeds.
+    assert run_coro(service.cancel_research("s1")) is True
+    assert cancelled == ["remote-1"]
+    assert service._remote_ids == {}
+
+
+def test_start_research_writes_session_and_log_in_one_statement(monkeypatch):
+    statements = []
+
+    class _RecordingConnection(_FakeConnection):
+        async def execute(self, query, *args):
+            statements.append((query, args))
+            return "INSERT 0 1"
+
+    service = _service(monkeypatch, _RecordingConnection(None))
+
+    async def fake_background(*args):
+        pass
+
+    monkeypatch.setattr(service, "_run_research_background", fake_background)
+
+    async def run():
+        result = await service.start_research("why is the sky blue")
+        await asyncio.gather(*service._active_tasks.values())
+        return result
+
+    result = run_coro(run())
+    assert len(statements) == 1
+    query, args = statements[0]
+    assert "INSERT INTO public.research_logs" in query
+    assert str(args[0]) == result["session_id"]
+    assert args[-1] == "Research session started for query: why is the sky blue"
+
+
+def test_aclose_stops_running_sessions_and_is_idempotent(monkeypatch):
+    service = _service(monkeypatch, _FakeConnection(None))
+    started = asyncio.Event()
+
+    async def fake_background(*args):
+        started.set()
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(service, "_run_research_background", fake_background)
+
+    async def run():
+        async with service:
+            await service.start_research("q")
+            await started.wait()
+            task = next(iter(service._active_tasks.values()))
+        await service.aclose()
+        return task
+
+    task = run_coro(run())
+    assert task.cancelled()
+    assert service._active_tasks == {}
@@ -0,0 +1,58 @@
+"""Unit tests for settings.get_settings (environment read + validation)."""
+
+from __future__ import annotations
+
+import pytest
+
+import settings
+
+
+@pytest.fixture(autouse=True)
+def _fresh_settings():
+    settings.get_settings.cache_clear()
+    yield
+    settings.get_settings.cache_clear()
+
+
+def test_missing_kong_url_fails_fast(monkeypatch):
+    monkeypatch.delenv("KONG_URL", raising=False)
+    monkeypatch.setenv("SUPABASE_SERVICE_KEY", "key")
+    with pytest.raises(ValueError, match="KONG_URL"):
+        settings.get_settings()
+
+
+def test_settings_are_read_once(monkeypatch):
+    monkeypatch.setenv("KONG_URL", "http://kong:8000")
+    monkeypatch.setenv("SUPABASE_SERVICE_KEY", "key")
+    monkeypatch.delenv("PROJECT_NAME", raising=False)
+    monkeypatch.setenv("MAX_UPLOAD_BYTES", "1024")
+
+    first = settings.get_settings()
+    monkeypatch.setenv("KONG_URL", "http://elsewhere:8000")
+    assert settings.get_settings() is first
+    assert first.project_name == "atlas"
+    assert first.max_upload_bytes == 1024
+    assert first.storage_url == "http://kong:8000/storage/v1/"
+    assert first.storage_url is first.storage_url
+
+
+def test_invalid_upload_limit_is_rejected(monkeypatch):
+    monkeypatch.setenv("KONG_URL", "http://kong:8000")
+    monkeypatch.setenv("SUPABASE_SERVICE_KEY", "key")
+    monkeypatch.setenv("MAX_UPLOAD_BYTES", "0")
+    with pytest.raises(ValueError):
+        settings.get_settings()
+
+
+def test_cors_origins_parse_comma_list(monkeypatch):
+    monkeypatch.setenv("KONG_URL", "http://kong:8000")
+    monkeypatch.setenv("SUPABASE_SERVICE_KEY", "key")
+    monkeypatch.setenv("CORS_ORIGINS", "http://a.localhost, http://b.localhost,")
+    assert settings.get_settings().cors_origins == (
+        "http://a.localhost",
+        "http://b.localhost",
+    )
+
+    settings.get_settings.cache_clear()
+    monkeypatch.delenv("CORS_ORIGINS")
+    assert settings.get_settings().cors_origins == ("*",)
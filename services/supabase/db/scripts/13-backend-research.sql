@@ -60,8 +60,14 @@ CREATE TABLE IF NOT EXISTS public.research_logs (
 
 -- Create indexes for better performance
 CREATE INDEX IF NOT EXISTS idx_research_sessions_status ON public.research_sessions(status);
-CREATE INDEX IF NOT EXISTS idx_research_sessions_user_id ON public.research_sessions(user_id);
-CREATE INDEX IF NOT EXISTS idx_research_sessions_created_at ON public.research_sessions(created_at);
+-- Keyset paging for GET /research/sessions: (created_at, id) < cursor,
+-- newest first, with and without a user_id filter. Their leading columns
+-- also serve plain created_at and user_id lookups, so the former
+-- single-column indexes are dropped on databases that still have them.
+DROP INDEX IF EXISTS public.idx_research_sessions_user_id;
+DROP INDEX IF EXISTS public.idx_research_sessions_created_at;
+CREATE INDEX IF NOT EXISTS idx_research_sessions_created_at_id ON public.research_sessions(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_research_sessions_user_created_at ON public.research_sessions(user_id, created_at DESC, id DESC);
 CREATE INDEX IF NOT EXISTS idx_research_results_session_id ON public.research_results(session_id);
 CREATE INDEX IF NOT EXISTS idx_research_sources_session_id ON public.research_sources(session_id);
 CREATE INDEX IF NOT EXISTS idx_research_logs_session_id ON public.research_logs(session_id);